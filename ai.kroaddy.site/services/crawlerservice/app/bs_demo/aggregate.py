@@ -1,6 +1,7 @@
 from app.bs_demo.google import crawl_google_news
 from app.bs_demo.naver import crawl_naver_news
 from app.bs_demo.daum import crawl_daum_news
+from app.bs_demo.hazard_analyzer import analyze_article
 import re
 
 def aggregate_news(keywords):
@@ -41,10 +42,14 @@ def run_all_crawlers():
         risk_zones = analyze_risk(articles)
         print(f"스케줄러: {len(risk_zones)}개의 위험 지역을 감지했습니다.")
         
+        # 좌표가 있는 기사별 분석 결과 (API 쪽 공간 인덱스에 적재)
+        events = [e for e in (analyze_article(a) for a in articles) if e["lat"] is not None]
+        
         return {
             "articles_count": len(articles),
             "risk_zones_count": len(risk_zones),
-            "risk_zones": risk_zones
+            "risk_zones": risk_zones,
+            "events": events
         }
     except Exception as e:
         print(f"스케줄러 크롤링 오류: {str(e)}")
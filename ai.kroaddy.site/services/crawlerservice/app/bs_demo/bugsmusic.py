@@ -1,13 +1,15 @@
-import requests
 from bs4 import BeautifulSoup
 import json
 import re
+from app.bs_demo.http_client import http_client
+
+BUGSMUSIC_CHART_URL = "https://music.bugs.co.kr/chart/track/realtime/total?wl_ref=M_contents_03_01"
 
 def crawl_bugsmusic_chart():
     """
     Bugs Music 실시간 차트를 크롤링하여 title, artist, album 정보를 추출
     """
-    url = "https://music.bugs.co.kr/chart/track/realtime/total?wl_ref=M_contents_03_01"
+    url = BUGSMUSIC_CHART_URL
     
     # User-Agent 헤더 추가 (일부 사이트에서 봇 차단 방지)
     headers = {
@@ -18,11 +20,17 @@ def crawl_bugsmusic_chart():
     }
     
     # HTML 가져오기
-    response = requests.get(url, headers=headers, timeout=10)
-    response.raise_for_status()  # HTTP 에러 체크
+    # 공용 클라이언트: keep-alive, 호스트별 속도 제한, 재시도, circuit breaker
+    text = http_client.fetch_text(url, headers=headers, timeout=10)
     
+    return parse_bugsmusic_chart(text)
+
+def parse_bugsmusic_chart(html):
+    """
+    Bugs Music 차트 HTML에서 title, artist, album 정보를 추출
+    """
     # BeautifulSoup으로 HTML 파싱
-    soup = BeautifulSoup(response.text, 'html.parser')
+    soup = BeautifulSoup(html, 'html.parser')
     
     # 결과를 저장할 리스트
     chart_data = []
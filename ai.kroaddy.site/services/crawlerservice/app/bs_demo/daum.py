@@ -1,27 +1,36 @@
-import requests
 from bs4 import BeautifulSoup
 import json
 from urllib.parse import quote
+from app.bs_demo.http_client import http_client
+
+DAUM_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+    "Referer": "https://www.daum.net/"
+}
+
+def build_daum_news_url(keywords):
+    query = " OR ".join(keywords)
+    # 다음 뉴스 검색 URL
+    return f"https://search.daum.net/search?w=news&q={quote(query)}&DA=PGD&spacing=0"
 
 def crawl_daum_news(keywords):
     """
     다음 뉴스를 크롤링하여 반환
     """
-    query = " OR ".join(keywords)
-    # 다음 뉴스 검색 URL
-    url = f"https://search.daum.net/search?w=news&q={quote(query)}&DA=PGD&spacing=0"
-    
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
-        "Referer": "https://www.daum.net/"
-    }
+    url = build_daum_news_url(keywords)
     
-    response = requests.get(url, headers=headers, timeout=10)
-    response.raise_for_status()
+    # 공용 클라이언트: keep-alive, 호스트별 속도 제한, 재시도, circuit breaker
+    text = http_client.fetch_text(url, headers=DAUM_HEADERS, timeout=10)
     
-    soup = BeautifulSoup(response.text, "html.parser")
+    return parse_daum_news(text)
+
+def parse_daum_news(html):
+    """
+    다음 뉴스 검색 결과 HTML을 기사 리스트로 변환
+    """
+    soup = BeautifulSoup(html, "html.parser")
     
     articles = []
     
@@ -0,0 +1,224 @@
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+import math
+import os
+import threading
+import time
+
+from app.scheduler import STATE_DIR, RESULT_FILE, read_json
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEG_LAT = 111.32
+
+# 뉴스 사이트별 날짜 표기 (RFC 822는 parsedate_to_datetime으로 처리)
+PUB_DATE_FORMATS = ["%Y-%m-%d %H:%M", "%Y-%m-%d %H:%M:%S", "%Y.%m.%d. %H:%M", "%Y.%m.%d %H:%M", "%Y.%m.%d."]
+
+
+def parse_event_time(pub_date, default=None):
+    """
+    기사 발행 시각 문자열을 epoch 초로 변환
+    파싱할 수 없으면 default (없으면 현재 시각, 즉 수집 시각) 반환
+    """
+    default = time.time() if default is None else default
+    if not pub_date:
+        return default
+    pub_date = pub_date.strip()
+    try:
+        return parsedate_to_datetime(pub_date).timestamp()
+    except (TypeError, ValueError, IndexError):
+        pass
+    try:
+        return datetime.fromisoformat(pub_date).timestamp()
+    except ValueError:
+        pass
+    for fmt in PUB_DATE_FORMATS:
+        try:
+            return datetime.strptime(pub_date, fmt).timestamp()
+        except ValueError:
+            continue
+    return default
+
+
+def haversine_km(lat1, lng1, lat2, lng2):
+    """두 좌표 사이의 거리 (km)"""
+    lat1, lng1, lat2, lng2 = map(math.radians, (lat1, lng1, lat2, lng2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(a))
+
+
+class GeoEventIndex:
+    """
+    위험 이벤트 공간 인덱스 (균일 격자)
+    - 위도/경도를 cell_deg 크기의 격자로 나눠 이벤트를 저장, 반경 검색 시 주변 격자만 확인
+    - 지역(location)별 시간 감쇠 위험 열지도(heat)를 이벤트가 들어올 때마다 O(1)로 갱신
+        heat(t) = Σ risk_score × exp(-λ(t - 발생시각)),  λ = ln2 / 반감기
+    - retention_hours보다 오래된 이벤트는 주기적으로 정리
+    """
+
+    def __init__(self, cell_deg=0.05, half_life_hours=6.0, retention_hours=72.0):
+        self.cell_deg = cell_deg
+        self.half_life_hours = half_life_hours
+        self.retention_seconds = retention_hours * 3600
+        self._decay = math.log(2) / (half_life_hours * 3600)
+        self._cells = {}    # (행, 열) -> [event, ...]
+        self._keys = {}     # 중복 제거 키(link/title) -> event
+        self._heat = {}     # location -> {"value", "ref", "lat", "lng", "event_count"}
+        self._lock = threading.Lock()
+        self._last_prune = time.time()
+        self._synced_mtime = None
+
+    def _cell(self, lat, lng):
+        return int(math.floor(lat / self.cell_deg)), int(math.floor(lng / self.cell_deg))
+
+    # ==================== 적재 ====================
+
+    def _add_heat(self, event):
+        """지역별 감쇠 열지도 누적 (기준 시각 ref에서의 값으로 저장, 늦게 도착한 이벤트도 처리)"""
+        entry = self._heat.get(event["location"])
+        if entry is None:
+            entry = {"value": 0.0, "ref": event["ts"], "lat": event["lat"], "lng": event["lng"], "event_count": 0}
+            self._heat[event["location"]] = entry
+        if event["ts"] > entry["ref"]:
+            entry["value"] *= math.exp(-self._decay * (event["ts"] - entry["ref"]))
+            entry["ref"] = event["ts"]
+        entry["value"] += event["risk_score"] * math.exp(-self._decay * (entry["ref"] - event["ts"]))
+        entry["event_count"] += 1
+
+    def add(self, analyzed, ingested_at=None):
+        """
+        analyze_article 결과 1건 추가 (좌표가 없거나, 보관 기간이 지났거나, 이미 들어온 기사면 무시)
+        Returns: 추가 여부
+        """
+        lat, lng = analyzed.get("lat"), analyzed.get("lng")
+        if lat is None or lng is None:
+            return False
+        ts = parse_event_time(analyzed.get("pub_date"), ingested_at)
+        if ts < time.time() - self.retention_seconds:
+            return False
+        key = analyzed.get("link") or analyzed.get("title")
+        event = {
+            "title": analyzed.get("title", ""),
+            "link": analyzed.get("link", ""),
+            "source": analyzed.get("source", ""),
+            "location": analyzed.get("location"),
+            "lat": lat,
+            "lng": lng,
+            "risk_score": analyzed.get("risk_score", 0.0),
+            "keywords": analyzed.get("keywords", []),
+            "pub_date": analyzed.get("pub_date", ""),
+            "ts": ts,
+        }
+        with self._lock:
+            if key in self._keys:
+                return False
+            self._keys[key] = event
+            self._cells.setdefault(self._cell(lat, lng), []).append(event)
+            self._add_heat(event)
+        return True
+
+    def ingest(self, analyzed_articles):
+        """여러 건 추가 후 오래된 이벤트 정리, 추가된 건수 반환"""
+        now = time.time()
+        added = sum(1 for analyzed in analyzed_articles if self.add(analyzed, now))
+        if now - self._last_prune > 600:
+            self.prune(now)
+        return added
+
+    def sync_from_latest_result(self, state_dir=STATE_DIR):
+        """
+        스케줄러가 저장한 최신 크롤 결과(events)를 인덱스에 반영
+        파일이 바뀐 경우에만 읽으므로 조회할 때마다 호출해도 비용이 거의 없음
+        """
+        path = Path(state_dir) / RESULT_FILE
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return 0
+        if mtime == self._synced_mtime:
+            return 0
+        self._synced_mtime = mtime
+        latest = read_json(path) or {}
+        return self.ingest((latest.get("result") or {}).get("events", []))
+
+    def prune(self, now=None):
+        """retention보다 오래된 이벤트 제거 (heat는 감쇠로 자연히 0에 수렴하므로 값이 작아지면 삭제)"""
+        now = time.time() if now is None else now
+        cutoff = now - self.retention_seconds
+        with self._lock:
+            for cell, events in list(self._cells.items()):
+                kept = [event for event in events if event["ts"] >= cutoff]
+                if kept:
+                    self._cells[cell] = kept
+                else:
+                    del self._cells[cell]
+            self._keys = {key: event for key, event in self._keys.items() if event["ts"] >= cutoff}
+            for location, entry in list(self._heat.items()):
+                if entry["value"] * math.exp(-self._decay * (now - entry["ref"])) < 1e-3:
+                    del self._heat[location]
+            self._last_prune = now
+
+    # ==================== 조회 ====================
+
+    def query(self, lat, lng, radius_km=3.0, hours=24.0, now=None, limit=None):
+        """
+        (lat, lng)에서 radius_km 이내, 최근 hours 시간 안의 이벤트를 가까운 순으로 반환
+        """
+        now = time.time() if now is None else now
+        since = now - hours * 3600
+        dlat = radius_km / KM_PER_DEG_LAT
+        dlng = radius_km / (KM_PER_DEG_LAT * max(math.cos(math.radians(lat)), 1e-6))
+        row_min, col_min = self._cell(lat - dlat, lng - dlng)
+        row_max, col_max = self._cell(lat + dlat, lng + dlng)
+
+        results = []
+        with self._lock:
+            for row in range(row_min, row_max + 1):
+                for col in range(col_min, col_max + 1):
+                    for event in self._cells.get((row, col), ()):
+                        if event["ts"] < since:
+                            continue
+                        distance = haversine_km(lat, lng, event["lat"], event["lng"])
+                        if distance <= radius_km:
+                            results.append({
+                                **{k: v for k, v in event.items() if k != "ts"},
+                                "distance_km": round(distance, 3),
+                                "occurred_at": datetime.fromtimestamp(event["ts"]).isoformat(timespec="seconds"),
+                            })
+        results.sort(key=lambda x: (x["distance_km"], -x["risk_score"]))
+        return results[:limit] if limit else results
+
+    def heat(self, now=None, district_only=False, limit=None):
+        """지역별 현재 시각 기준 감쇠 위험도 (높은 순)"""
+        now = time.time() if now is None else now
+        with self._lock:
+            results = [
+                {
+                    "location": location,
+                    "heat": round(entry["value"] * math.exp(-self._decay * (now - entry["ref"])), 4),
+                    "lat": entry["lat"],
+                    "lng": entry["lng"],
+                    "event_count": entry["event_count"],
+                }
+                for location, entry in self._heat.items()
+                if not district_only or location.endswith("구")
+            ]
+        results.sort(key=lambda x: x["heat"], reverse=True)
+        return results[:limit] if limit else results
+
+    def stats(self):
+        with self._lock:
+            return {
+                "events": len(self._keys),
+                "cells": len(self._cells),
+                "locations": len(self._heat),
+                "cell_deg": self.cell_deg,
+                "half_life_hours": self.half_life_hours,
+            }
+
+
+# 서비스 전역 인덱스 (환경변수로 조정)
+geo_index = GeoEventIndex(
+    half_life_hours=float(os.environ.get("GEO_HEAT_HALF_LIFE_HOURS", "6")),
+    retention_hours=float(os.environ.get("GEO_RETENTION_HOURS", "72")),
+)
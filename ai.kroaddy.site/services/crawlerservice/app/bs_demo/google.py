@@ -1,19 +1,20 @@
-import requests
 from bs4 import BeautifulSoup
 import json
+from app.bs_demo.http_client import http_client
 
-def crawl_google_news(keywords):
-    query = " OR ".join(keywords)
-    rss_url = f"https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
-
-    headers = {
-        "User-Agent": "Mozilla/5.0"
-    }
+GOOGLE_HEADERS = {
+    "User-Agent": "Mozilla/5.0"
+}
 
-    response = requests.get(rss_url, headers=headers)
-    response.raise_for_status()
+def build_google_news_url(keywords):
+    query = " OR ".join(keywords)
+    return f"https://news.google.com/rss/search?q={query}&hl=ko&gl=KR&ceid=KR:ko"
 
-    soup = BeautifulSoup(response.text, "xml")
+def parse_google_news(xml_text):
+    """
+    Google News RSS 응답을 기사 리스트로 변환
+    """
+    soup = BeautifulSoup(xml_text, "xml")
 
     articles = []
     for item in soup.find_all("item"):
@@ -29,9 +30,16 @@ def crawl_google_news(keywords):
 
     return articles
 
+def crawl_google_news(keywords):
+    rss_url = build_google_news_url(keywords)
+
+    # 공용 클라이언트: keep-alive, 호스트별 속도 제한, 재시도, circuit breaker
+    text = http_client.fetch_text(rss_url, headers=GOOGLE_HEADERS, timeout=10)
+
+    return parse_google_news(text)
+
 
 if __name__ == "__main__":
     keywords = ["시위", "폭행", "속보", "테러", "위험"]
     data = crawl_google_news(keywords)
     print(json.dumps(data, ensure_ascii=False, indent=2))
-
@@ -137,9 +137,9 @@ def extract_location(article_text):
     return None
 
 # 5️⃣ 전체 분석 함수
-def analyze_article(article):
+def score_article(article):
     """
-    article: dict with keys 'title', 'content' (or 'description'), 'link', 'pub_date' (or 'pubDate'), 'source'
+    위험도 점수 계산 (분석 텍스트, 점수, 감지된 키워드 반환)
     """
     title = article.get("title", "")
     content = article.get("content", "") or article.get("description", "")
@@ -148,6 +148,12 @@ def analyze_article(article):
     # 위험도 계산
     risk_score, keywords = calculate_risk_score(text)
     
+    return text, risk_score, keywords
+
+def geolocate_article(article, text, risk_score, keywords):
+    """
+    score_article 결과에 위치/위도/경도를 붙여 최종 분석 결과 생성
+    """
     # 위치 추출
     location = extract_location(text)
     
@@ -157,7 +163,7 @@ def analyze_article(article):
         lat, lng = LOCATION_LATLNG.get(location, (None, None))
     
     return {
-        "title": title,
+        "title": article.get("title", ""),
         "link": article.get("link", ""),
         "pub_date": article.get("pub_date") or article.get("pubDate", ""),
         "risk_score": round(risk_score, 2),
@@ -168,6 +174,12 @@ def analyze_article(article):
         "keywords": keywords
     }
 
+def analyze_article(article):
+    """
+    article: dict with keys 'title', 'content' (or 'description'), 'link', 'pub_date' (or 'pubDate'), 'source'
+    """
+    return geolocate_article(article, *score_article(article))
+
 # 6️⃣ 테스트용 예시
 if __name__ == "__main__":
     sample_article = {
@@ -0,0 +1,253 @@
+import os
+import random
+import threading
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from app.bs_demo.replay import resolve_url
+
+# 재시도 대상 HTTP 상태 코드 (과부하/일시 장애)
+RETRY_STATUS = {429, 500, 502, 503, 504}
+
+
+class CircuitOpenError(Exception):
+    """호스트 회로가 열려 있고 캐시된 응답도 없는 경우"""
+    pass
+
+
+class TokenBucket:
+    """
+    호스트별 요청 속도 제한 (token bucket)
+    - rate: 초당 토큰 충전량 (= 평균 허용 요청 수)
+    - capacity: 순간적으로 허용되는 최대 burst
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout=30.0):
+        """토큰 하나를 얻을 때까지 대기 (timeout 초과 시 False)"""
+        deadline = time.monotonic() + timeout
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return True
+                wait = (1 - self._tokens) / self.rate
+            if time.monotonic() + wait > deadline:
+                return False
+            time.sleep(wait)
+
+
+class CircuitBreaker:
+    """
+    호스트별 회로 차단기
+    - closed: 정상 요청
+    - open: 연속 실패가 failure_threshold 이상이면 reset_timeout 동안 요청 차단
+    - half_open: reset_timeout 이후 한 번 시험 요청, 성공 시 closed / 실패 시 다시 open
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=60.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.reset_timeout:
+                    return False
+                self.state = "half_open"
+                return True  # 시험 요청 1건만 통과
+            return self.state == "closed"
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == "half_open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self._opened_at = time.monotonic()
+
+
+class HttpClient:
+    """
+    크롤러 공용 HTTP 클라이언트
+    - keep-alive 커넥션 풀 (requests.Session + HTTPAdapter)
+    - 호스트별 token bucket 속도 제한
+    - 지수 백오프 + jitter 재시도 (연결 오류, 타임아웃, 429/5xx 등 requests 전송 오류)
+    - 호스트별 circuit breaker, 회로가 열려 있으면 마지막 성공 응답을 캐시에서 반환
+    """
+
+    def __init__(self, rate=2.0, burst=5, max_retries=3, backoff_base=0.5, backoff_max=8.0,
+                 failure_threshold=5, reset_timeout=60.0, cache_size=256, pool_maxsize=20):
+        self.rate = rate
+        self.burst = burst
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.cache_size = cache_size
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=pool_maxsize, max_retries=0)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+        self._buckets = {}
+        self._breakers = {}
+        self._cache = OrderedDict()  # url -> 마지막 성공 응답 본문 (LRU)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "retries": 0, "failures": 0, "cache_hits": 0, "throttled": 0}
+
+    def set_rate_limit(self, rate, burst=None):
+        """속도 제한 변경 (rate=None이면 비활성화)"""
+        with self._lock:
+            self.rate = rate
+            if burst is not None:
+                self.burst = burst
+            self._buckets.clear()
+
+    def _bucket(self, host):
+        with self._lock:
+            if host not in self._buckets:
+                self._buckets[host] = TokenBucket(self.rate, self.burst)
+            return self._buckets[host]
+
+    def _breaker(self, host):
+        with self._lock:
+            if host not in self._breakers:
+                self._breakers[host] = CircuitBreaker(self.failure_threshold, self.reset_timeout)
+            return self._breakers[host]
+
+    def _count(self, key):
+        with self._lock:
+            self._stats[key] += 1
+
+    def _remember(self, url, text):
+        with self._lock:
+            self._cache[url] = text
+            self._cache.move_to_end(url)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def _cached(self, url):
+        with self._lock:
+            text = self._cache.get(url)
+            if text is not None:
+                self._stats["cache_hits"] += 1
+            return text
+
+    def _backoff(self, attempt, retry_after=None):
+        if retry_after is not None:
+            return min(self.backoff_max, retry_after)
+        # full jitter: 0 ~ base * 2^attempt
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def fetch_text(self, url, headers=None, timeout=10):
+        """
+        URL 본문을 문자열로 반환
+        - 회로가 열려 있으면 캐시된 마지막 성공 응답 반환 (없으면 CircuitOpenError)
+        - 재시도를 모두 소진하면 캐시된 응답으로 대체, 캐시도 없으면 마지막 예외를 다시 발생
+        """
+        host = urlsplit(url).netloc
+        breaker = self._breaker(host)
+
+        if not breaker.allow():
+            cached = self._cached(url)
+            if cached is not None:
+                return cached
+            raise CircuitOpenError(f"{host} 회로가 열려 있습니다 (최근 연속 실패 {breaker.failures}회)")
+
+        last_error = None
+        for attempt in range(self.max_retries + 1):
+            if self.rate and not self._bucket(host).acquire(timeout=timeout):
+                self._count("throttled")
+                last_error = TimeoutError(f"{host} 속도 제한 대기 시간 초과")
+                break
+
+            retry_after = None
+            try:
+                self._count("requests")
+                response = self.session.get(resolve_url(url), headers=headers, timeout=timeout)
+                if response.status_code in RETRY_STATUS:
+                    header = response.headers.get("Retry-After")
+                    retry_after = float(header) if header and header.isdigit() else None
+                    raise requests.HTTPError(f"{response.status_code} 응답", response=response)
+                response.raise_for_status()
+            except requests.RequestException as e:
+                # 연결/타임아웃/5xx 외의 requests 오류(ChunkedEncodingError, TooManyRedirects 등)도 전송 실패로 처리
+                last_error = e
+                status = getattr(getattr(e, "response", None), "status_code", None)
+                if status is not None and status not in RETRY_STATUS:
+                    # 4xx 등 재시도해도 의미 없는 오류 (호스트는 살아 있으므로 회로에는 반영하지 않음)
+                    breaker.record_success()
+                    raise
+                if attempt < self.max_retries:
+                    self._count("retries")
+                    time.sleep(self._backoff(attempt, retry_after))
+                continue
+            except Exception:
+                # 예상하지 못한 오류도 회로에 반영 (half_open 시험 요청의 결과가 기록되지 않으면 회로가 계속 막힘)
+                self._count("failures")
+                breaker.record_failure()
+                raise
+
+            breaker.record_success()
+            text = response.text
+            self._remember(url, text)
+            return text
+
+        self._count("failures")
+        breaker.record_failure()
+        cached = self._cached(url)
+        if cached is not None:
+            print(f"{host} 요청 실패, 캐시된 응답 사용: {str(last_error)}")
+            return cached
+        raise last_error
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self._stats,
+                "rate_per_host": self.rate,
+                "burst": self.burst,
+                "cached_urls": len(self._cache),
+                "circuits": {
+                    host: {"state": breaker.state, "failures": breaker.failures}
+                    for host, breaker in self._breakers.items()
+                },
+            }
+
+
+def _env_float(name, default):
+    value = os.environ.get(name)
+    return float(value) if value else default
+
+
+# 크롤러 공용 인스턴스 (환경변수로 조정)
+http_client = HttpClient(
+    rate=_env_float("CRAWLER_HTTP_RATE", 2.0),
+    burst=int(_env_float("CRAWLER_HTTP_BURST", 5)),
+    max_retries=int(_env_float("CRAWLER_HTTP_RETRIES", 3)),
+    reset_timeout=_env_float("CRAWLER_CIRCUIT_RESET", 60.0),
+)
@@ -0,0 +1,135 @@
+"""
+뉴스 기사 스트리밍 분석 파이프라인
+
+    fetch → parse → dedup → score → geolocate → rank
+
+각 단계는 제너레이터로 연결되어 앞 단계에서 나온 항목을 바로 다음 단계로 넘깁니다.
+먼저 응답한 소스의 기사부터 분석되므로 첫 결과까지의 시간이 짧고,
+전체 기사 목록을 단계마다 리스트로 만들지 않아 메모리 사용량이 줄어듭니다.
+"""
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import heapq
+import itertools
+
+from app.bs_demo.http_client import http_client
+from app.bs_demo.google import GOOGLE_HEADERS, build_google_news_url, parse_google_news
+from app.bs_demo.naver import NAVER_HEADERS, build_naver_news_url, parse_naver_news
+from app.bs_demo.daum import DAUM_HEADERS, build_daum_news_url, parse_daum_news
+from app.bs_demo.hazard_analyzer import geolocate_article, score_article
+
+# 소스 이름 -> (URL 생성, 요청 헤더, 파서)
+SOURCES = {
+    "google": (build_google_news_url, GOOGLE_HEADERS, parse_google_news),
+    "naver": (build_naver_news_url, NAVER_HEADERS, parse_naver_news),
+    "daum": (build_daum_news_url, DAUM_HEADERS, parse_daum_news),
+}
+
+
+def keyword_batches(keywords, batch_size=None):
+    """키워드를 batch_size개씩 나눔 (None이면 전체를 한 번에 검색)"""
+    if not batch_size:
+        return [list(keywords)]
+    return [keywords[i:i + batch_size] for i in range(0, len(keywords), batch_size)]
+
+
+# ==================== 단계별 제너레이터 ====================
+
+def fetch_documents(keywords, sources=None, batch_size=None, max_workers=6):
+    """
+    (소스 × 키워드 묶음) 요청을 동시에 보내고, 응답이 오는 순서대로 (source, 본문) 반환
+    실패한 요청은 로그만 남기고 건너뜀
+    """
+    sources = sources or list(SOURCES)
+    tasks = [(source, batch) for batch in keyword_batches(keywords, batch_size) for source in sources]
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(tasks))))
+    try:
+        futures = {}
+        for source, batch in tasks:
+            build_url, headers, _ = SOURCES[source]
+            futures[executor.submit(http_client.fetch_text, build_url(batch), headers=headers, timeout=10)] = source
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                yield source, future.result()
+            except Exception as e:
+                print(f"{source} 뉴스 크롤링 오류: {str(e)}")
+    finally:
+        # 소비자가 중간에 멈춰도(클라이언트 연결 종료 등) 남은 요청을 기다리지 않음
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_documents(documents):
+    """응답 본문을 소스별 파서로 기사 단위로 풀어냄"""
+    for source, text in documents:
+        try:
+            articles = SOURCES[source][2](text)
+        except Exception as e:
+            print(f"{source} 뉴스 파싱 오류: {str(e)}")
+            continue
+        for article in articles:
+            article["source"] = source
+            yield article
+
+
+def dedup_articles(articles):
+    """링크(없으면 제목) 기준으로 이미 나온 기사 제외"""
+    seen = set()
+    for article in articles:
+        key = article.get("link") or article.get("title")
+        if not key or key in seen:
+            continue
+        seen.add(key)
+        yield article
+
+
+def score_articles(articles):
+    """위험도 점수 계산 (hazard_analyzer.score_article)"""
+    for article in articles:
+        yield (article, *score_article(article))
+
+
+def geolocate_articles(scored):
+    """위치 추출 및 위도/경도 매핑 (hazard_analyzer.geolocate_article, analyze_article과 같은 결과)"""
+    for article, text, risk_score, keywords in scored:
+        yield geolocate_article(article, text, risk_score, keywords)
+
+
+def analyze_stream(keywords, sources=None, batch_size=None, max_workers=6):
+    """fetch → parse → dedup → score → geolocate 를 연결한 분석 결과 스트림"""
+    documents = fetch_documents(keywords, sources, batch_size, max_workers)
+    return geolocate_articles(score_articles(dedup_articles(parse_documents(documents))))
+
+
+# ==================== 순위 ====================
+
+def rank_articles(analyzed, top_k=None):
+    """
+    위험도 점수 높은 순 정렬
+    top_k가 있으면 크기 top_k의 힙만 유지 (전체 정렬 없이 O(n log k))
+    """
+    key = lambda x: x.get("risk_score", 0)
+    if top_k:
+        return heapq.nlargest(top_k, analyzed, key=key)
+    return sorted(analyzed, key=key, reverse=True)
+
+
+class TopK:
+    """
+    스트리밍 중 위험도 상위 k개를 유지하는 최소 힙
+    점수가 같으면 먼저 들어온 기사를 우선 (sorted와 같은 순서)
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self._heap = []
+        self._counter = itertools.count()
+
+    def push(self, item):
+        entry = (item.get("risk_score", 0), -next(self._counter), item)
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def items(self):
+        return [entry[2] for entry in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
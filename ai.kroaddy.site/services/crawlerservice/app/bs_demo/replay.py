@@ -0,0 +1,23 @@
+import os
+from urllib.parse import urlsplit
+
+# 녹화된 응답을 재생할 스텁 서버 주소 (예: http://127.0.0.1:8765)
+# 설정되어 있으면 모든 크롤러 요청이 실제 사이트 대신 스텁 서버로 향합니다.
+REPLAY_ENV = "CRAWLER_REPLAY_URL"
+
+
+def resolve_url(url):
+    """
+    크롤링 대상 URL을 실제 요청 URL로 변환
+    - CRAWLER_REPLAY_URL이 없으면 원래 URL 그대로 반환
+    - 있으면 https://host/path?query -> {replay}/host/path?query 로 변환
+    """
+    replay_base = os.environ.get(REPLAY_ENV)
+    if not replay_base:
+        return url
+
+    parts = urlsplit(url)
+    replayed = f"{replay_base.rstrip('/')}/{parts.netloc}{parts.path}"
+    if parts.query:
+        replayed += f"?{parts.query}"
+    return replayed
@@ -1,11 +1,23 @@
-from fastapi import FastAPI, APIRouter, Query
+from fastapi import FastAPI, APIRouter, Query, Request, Header
 from fastapi.middleware.cors import CORSMiddleware
-from apscheduler.schedulers.background import BackgroundScheduler
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from typing import Optional
+import asyncio
+import json
+import os
+import threading
 import uvicorn
 from app.bs_demo.bugsmusic import crawl_bugsmusic_chart
-from app.sel_demo.danawa import crawl_danawa_mats
-from app.bs_demo.aggregate import aggregate_news, analyze_risk, run_all_crawlers
-from app.bs_demo.hazard_analyzer import analyze_article
+from app.sel_demo.danawa import crawl_danawa_mats, crawl_danawa
+from app.sel_demo.browser_pool import browser_pool
+from app.bs_demo.aggregate import aggregate_news, analyze_risk
+from app.bs_demo.pipeline import analyze_stream, rank_articles, TopK
+from app.bs_demo.http_client import http_client
+from app.bs_demo.geo_index import geo_index
+from app.scheduler import read_metrics
+from app.risk_feed import risk_feed_reader
+from app.worker import build_scheduler
 
 # FastAPI 앱 생성
 app = FastAPI(title="Crawler Service", version="1.0.0")
@@ -26,6 +38,29 @@ feed_router = APIRouter()
 async def root():
     return {"service": "Crawler Service", "status": "running"}
 
+@feed_router.get("/http/stats")
+async def get_http_stats():
+    """
+    크롤러 공용 HTTP 클라이언트 상태 (요청/재시도/캐시 사용 횟수, 호스트별 회로 상태)
+    """
+    return {
+        "success": True,
+        "data": http_client.stats()
+    }
+
+@feed_router.get("/scheduler/metrics")
+async def get_scheduler_metrics():
+    """
+    주기적 크롤링 작업 메트릭 (leader 여부, 큐 깊이, 작업 소요 시간 등)
+    embedded/worker 모드 모두 상태 디렉터리에 기록된 값을 읽어서 반환
+    """
+    metrics = read_metrics()
+    return {
+        "success": metrics is not None,
+        "mode": SCHEDULER_MODE,
+        "data": metrics
+    }
+
 @feed_router.get("/bugsmusic")
 async def get_bugsmusic_chart():
     """
@@ -48,13 +83,56 @@ async def get_bugsmusic_chart():
 async def get_danawa_mats():
     """
     다나와에서 매트 제품을 크롤링하여 반환
+    동시 요청은 브라우저 풀 크기만큼 병렬로 처리됩니다.
+    가격은 페이지에 표시된 문자열 그대로, 가격_숫자는 정수(원)로 파싱한 값(없으면 null)입니다.
     """
     try:
-        results = crawl_danawa_mats()
+        # Selenium 호출은 블로킹이므로 스레드풀에서 실행 (이벤트 루프 점유 방지)
+        results = await run_in_threadpool(crawl_danawa_mats)
         return {
             "success": True,
             "data": results,
-            "count": len(results)
+            "count": len(results),
+            "pool": browser_pool.stats()
+        }
+    except Exception as e:
+        return {
+            "success": False,
+            "error": str(e)
+        }
+
+@feed_router.get("/danawa/search")
+async def search_danawa(
+    queries: str = Query(..., description="검색어 (쉼표로 구분)"),
+    start_page: int = Query(1, ge=1, description="시작 페이지"),
+    end_page: int = Query(1, ge=1, le=50, description="끝 페이지 (포함)")
+):
+    """
+    다나와에서 여러 검색어 × 페이지 범위를 병렬 크롤링하여 반환
+    가격은 페이지에 표시된 문자열 그대로, 가격_숫자는 정수(원)로 파싱한 값(없으면 null)입니다.
+    예: /danawa/search?queries=매트,요가매트&start_page=1&end_page=3
+    """
+    try:
+        query_list = [q.strip() for q in queries.split(",") if q.strip()]
+        if not query_list:
+            return {
+                "success": False,
+                "error": "검색어를 입력해주세요."
+            }
+        if end_page < start_page:
+            return {
+                "success": False,
+                "error": "end_page는 start_page보다 크거나 같아야 합니다."
+            }
+        
+        result = await run_in_threadpool(crawl_danawa, query_list, start_page, end_page)
+        return {
+            "success": True,
+            "data": result["data"],
+            "count": len(result["data"]),
+            "pages": result["pages"],
+            "errors": result["errors"],
+            "queries": query_list
         }
     except Exception as e:
         return {
@@ -124,6 +202,93 @@ async def get_risk_zones(keywords: str = Query(..., description="검색 키워
             "error": str(e)
         }
 
+# 위험 지역 피드: 스냅샷 변경 확인 주기 / keep-alive 주기 (초)
+RISK_FEED_POLL_SECONDS = float(os.environ.get("RISK_FEED_POLL_SECONDS", "2"))
+RISK_FEED_KEEPALIVE_SECONDS = float(os.environ.get("RISK_FEED_KEEPALIVE_SECONDS", "15"))
+
+def format_sse(payload, event_id=None):
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"data: {json.dumps(payload, ensure_ascii=False)}")
+    return "\n".join(lines) + "\n\n"
+
+def snapshot_event(snapshot):
+    return format_sse({"type": "snapshot", **snapshot}, snapshot["version"])
+
+@feed_router.get("/risk/snapshot")
+async def get_risk_snapshot():
+    """
+    스케줄러가 마지막으로 만든 위험 지역 스냅샷 (크롤링 없이 바로 반환)
+    """
+    snapshot = risk_feed_reader.snapshot()
+    return {
+        "success": snapshot["version"] > 0,
+        "data": snapshot
+    }
+
+@feed_router.get("/risk/changes")
+async def get_risk_changes(since: int = Query(0, ge=0, description="마지막으로 받은 스냅샷 버전")):
+    """
+    since 버전 이후의 위험 지역 변경분(diff) 목록
+    이력이 이미 잘려 diff로 따라잡을 수 없으면 전체 스냅샷을 함께 반환
+    """
+    snapshot = risk_feed_reader.snapshot()
+    changes = risk_feed_reader.changes_since(since)
+    return {
+        "success": True,
+        "version": snapshot["version"],
+        "changes": changes or [],
+        "snapshot": snapshot if changes is None else None
+    }
+
+@feed_router.get("/risk/stream")
+async def stream_risk_changes(
+    request: Request,
+    since: Optional[int] = Query(None, ge=0, description="마지막으로 받은 스냅샷 버전"),
+    last_event_id: Optional[str] = Header(None)
+):
+    """
+    위험 지역 변경 사항을 SSE로 푸시
+    - 접속 시 전체 스냅샷 1회 (type=snapshot), 이후에는 변경분만 (type=diff: added/changed/removed)
+    - 재접속 시 Last-Event-ID(또는 since) 이후의 diff만 전송
+    - 클라이언트는 크롤링을 유발하지 않고 스케줄러 결과만 구독
+    """
+    if since is None and last_event_id and last_event_id.isdigit():
+        since = int(last_event_id)
+
+    async def event_stream():
+        version = since
+        if version is None or risk_feed_reader.changes_since(version) is None:
+            snapshot = risk_feed_reader.snapshot()
+            version = snapshot["version"]
+            yield snapshot_event(snapshot)
+
+        idle = 0.0
+        while not await request.is_disconnected():
+            changes = risk_feed_reader.changes_since(version)
+            if changes is None:
+                snapshot = risk_feed_reader.snapshot()
+                version = snapshot["version"]
+                yield snapshot_event(snapshot)
+                idle = 0.0
+            elif changes:
+                for change in changes:
+                    yield format_sse({"type": "diff", **change}, change["version"])
+                version = changes[-1]["version"]
+                idle = 0.0
+            elif idle >= RISK_FEED_KEEPALIVE_SECONDS:
+                yield ": keep-alive\n\n"
+                idle = 0.0
+            await asyncio.sleep(RISK_FEED_POLL_SECONDS)
+            idle += RISK_FEED_POLL_SECONDS
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @feed_router.get("/hazard")
 async def get_hazard_analysis(keywords: str = Query(..., description="검색 키워드 (쉼표로 구분)")):
     """
@@ -139,27 +304,13 @@ async def get_hazard_analysis(keywords: str = Query(..., description="검색 키
                 "error": "키워드를 입력해주세요."
             }
         
-        # 뉴스 수집
-        articles = aggregate_news(keyword_list)
-        
-        # 각 기사 분석 (위험도 점수, 위치, 위도/경도 포함)
-        analyzed_articles = []
-        for article in articles:
-            # source 정보 추가
-            if "naver" in article.get("link", "").lower():
-                article["source"] = "naver"
-            elif "daum" in article.get("link", "").lower():
-                article["source"] = "daum"
-            elif "google" in article.get("link", "").lower():
-                article["source"] = "google"
-            else:
-                article["source"] = "unknown"
-            
-            analyzed = analyze_article(article)
-            analyzed_articles.append(analyzed)
+        # 수집 → 파싱 → 중복 제거 → 위험도/위치 분석 → 위험도 점수 순 정렬
+        analyzed_articles = await run_in_threadpool(
+            lambda: rank_articles(analyze_stream(keyword_list))
+        )
         
-        # 위험도 점수 순으로 정렬
-        analyzed_articles.sort(key=lambda x: x.get("risk_score", 0), reverse=True)
+        # 공간 인덱스에 적재 (/geo 조회용)
+        geo_index.ingest(analyzed_articles)
         
         return {
             "success": True,
@@ -173,18 +324,107 @@ async def get_hazard_analysis(keywords: str = Query(..., description="검색 키
             "error": str(e)
         }
 
+@feed_router.get("/hazard/stream")
+async def stream_hazard_analysis(
+    keywords: str = Query(..., description="검색 키워드 (쉼표로 구분)"),
+    top_k: int = Query(20, ge=1, le=500, description="마지막 요약에 포함할 위험도 상위 기사 수"),
+    batch_size: int = Query(5, ge=1, le=50, description="한 번에 검색할 키워드 수")
+):
+    """
+    뉴스 분석 결과를 NDJSON으로 스트리밍
+    - 분석이 끝난 기사부터 한 줄씩 전송: {"type": "article", ...}
+    - 마지막 줄에 위험도 상위 top_k 요약: {"type": "summary", "articles_count": n, "top": [...]}
+    예: /hazard/stream?keywords=시위,폭행,속보,테러,위험&top_k=10
+    """
+    keyword_list = [k.strip() for k in keywords.split(",") if k.strip()]
+    if not keyword_list:
+        return {
+            "success": False,
+            "error": "키워드를 입력해주세요."
+        }
+
+    def ndjson_stream():
+        top = TopK(top_k)
+        count = 0
+        try:
+            for analyzed in analyze_stream(keyword_list, batch_size=batch_size):
+                count += 1
+                top.push(analyzed)
+                geo_index.add(analyzed)
+                yield json.dumps({"type": "article", **analyzed}, ensure_ascii=False) + "\n"
+        except Exception as e:
+            yield json.dumps({"type": "error", "error": str(e)}, ensure_ascii=False) + "\n"
+        yield json.dumps({
+            "type": "summary",
+            "articles_count": count,
+            "top": top.items(),
+            "keywords": keyword_list
+        }, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(ndjson_stream(), media_type="application/x-ndjson")
+
+@feed_router.get("/geo/events")
+async def get_geo_events(
+    lat: float = Query(..., ge=-90, le=90, description="위도"),
+    lng: float = Query(..., ge=-180, le=180, description="경도"),
+    radius_km: float = Query(3.0, gt=0, le=100, description="검색 반경 (km)"),
+    hours: float = Query(24.0, gt=0, le=720, description="최근 몇 시간 이내"),
+    limit: int = Query(50, ge=1, le=500, description="최대 개수")
+):
+    """
+    (lat, lng) 반경 radius_km 이내, 최근 hours 시간 안의 위험 이벤트 (가까운 순)
+    크롤링 없이 메모리 인덱스에서 조회합니다.
+    예: /geo/events?lat=37.4979&lng=127.0276&radius_km=3&hours=24
+    """
+    geo_index.sync_from_latest_result()
+    events = geo_index.query(lat, lng, radius_km=radius_km, hours=hours, limit=limit)
+    return {
+        "success": True,
+        "data": events,
+        "count": len(events)
+    }
+
+@feed_router.get("/geo/heat")
+async def get_geo_heat(
+    district_only: bool = Query(False, description="구 단위 지역만 반환"),
+    limit: int = Query(50, ge=1, le=500, description="최대 개수")
+):
+    """
+    지역별 시간 감쇠 위험도 (최근 이벤트일수록 가중치가 큼, 높은 순)
+    """
+    geo_index.sync_from_latest_result()
+    heat = geo_index.heat(district_only=district_only, limit=limit)
+    return {
+        "success": True,
+        "data": heat,
+        "count": len(heat),
+        "index": geo_index.stats()
+    }
+
 # 라우터를 앱에 포함
 app.include_router(feed_router)
 
-# 스케줄러 설정
-scheduler = BackgroundScheduler()
-scheduler.add_job(run_all_crawlers, 'interval', minutes=5, id='crawler_job')
-scheduler.start()
+# 스케줄러 실행 방식 (CRAWLER_SCHEDULER_MODE)
+# - embedded: API 프로세스 안에서 실행 (단일 프로세스 개발용, leader lock으로 워커 간 중복 방지)
+# - worker: 별도 크롤 워커(python -m app.worker)가 실행, API는 결과/메트릭만 읽음
+# - off: 스케줄러 비활성화
+SCHEDULER_MODE = os.environ.get("CRAWLER_SCHEDULER_MODE", "embedded").lower()
+scheduler = build_scheduler() if SCHEDULER_MODE == "embedded" else None
+
+# 앱 시작 시 스케줄러 시작 및 브라우저 풀 워밍업 (백그라운드, 첫 /danawa 요청의 브라우저 기동 비용 제거)
+@app.on_event("startup")
+def startup_event():
+    if scheduler is not None:
+        scheduler.start()
+    if os.environ.get("BROWSER_POOL_WARM", "true").lower() == "true":
+        threading.Thread(target=browser_pool.warm, daemon=True).start()
 
-# 앱 종료 시 스케줄러 종료
+# 앱 종료 시 스케줄러와 브라우저 풀 종료
 @app.on_event("shutdown")
 def shutdown_event():
-    scheduler.shutdown()
+    if scheduler is not None:
+        scheduler.shutdown()
+    browser_pool.close()
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=9001)
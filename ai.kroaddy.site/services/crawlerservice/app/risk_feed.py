@@ -0,0 +1,128 @@
+from datetime import datetime
+from pathlib import Path
+import os
+import threading
+
+from app.scheduler import STATE_DIR, read_json, write_json_atomic
+
+# 스케줄러 결과로 만든 위험 지역 스냅샷과 변경 이력 (상태 디렉터리에 저장, API 프로세스가 읽음)
+SNAPSHOT_FILE = "risk_snapshot.json"
+CHANGES_FILE = "risk_changes.json"
+
+# 재접속한 클라이언트가 diff만 받을 수 있도록 보관하는 최근 변경 이력 개수
+MAX_CHANGE_HISTORY = int(os.environ.get("RISK_FEED_HISTORY", "100"))
+
+
+def diff_risk_zones(previous, current):
+    """
+    이전/현재 위험 지역 목록(location 기준)을 비교
+    - added: 새로 감지된 지역
+    - changed: 위험 레벨이 바뀐 지역 (previous_risk 포함)
+    - removed: 더 이상 감지되지 않는 지역 이름
+    """
+    before = {zone["location"]: zone for zone in previous}
+    after = {zone["location"]: zone for zone in current}
+
+    added = [zone for location, zone in after.items() if location not in before]
+    changed = [
+        {**zone, "previous_risk": before[location]["risk"]}
+        for location, zone in after.items()
+        if location in before and before[location]["risk"] != zone["risk"]
+    ]
+    removed = [location for location in before if location not in after]
+
+    return {"added": added, "changed": changed, "removed": removed}
+
+
+def has_changes(diff):
+    return bool(diff["added"] or diff["changed"] or diff["removed"])
+
+
+class RiskFeedPublisher:
+    """
+    크롤 결과를 버전이 붙은 위험 지역 스냅샷으로 저장 (크롤 워커 쪽)
+    위험 지역 구성이 바뀐 경우에만 버전을 올리고 diff를 변경 이력에 추가합니다.
+    """
+
+    def __init__(self, state_dir=STATE_DIR, max_history=MAX_CHANGE_HISTORY):
+        self.state_dir = Path(state_dir)
+        self.max_history = max_history
+        self._lock = threading.Lock()
+
+    def publish(self, result):
+        """CrawlScheduler on_result 콜백: run_all_crawlers 결과를 스냅샷으로 반영"""
+        risk_zones = result.get("risk_zones") or []
+        now = datetime.now().isoformat(timespec="seconds")
+
+        with self._lock:
+            snapshot = read_json(self.state_dir / SNAPSHOT_FILE) or {"version": 0, "zones": []}
+            diff = diff_risk_zones(snapshot["zones"], risk_zones)
+            if not has_changes(diff) and snapshot["version"] > 0:
+                return snapshot["version"]
+
+            version = snapshot["version"] + 1
+            history = read_json(self.state_dir / CHANGES_FILE) or []
+            history.append({"version": version, "generated_at": now, **diff})
+
+            # 변경 이력을 먼저 쓰고 스냅샷을 교체 (스냅샷 버전의 diff는 항상 이력에 존재)
+            write_json_atomic(self.state_dir / CHANGES_FILE, history[-self.max_history:])
+            write_json_atomic(self.state_dir / SNAPSHOT_FILE, {
+                "version": version,
+                "generated_at": now,
+                "articles_count": result.get("articles_count", 0),
+                "zones": risk_zones,
+            })
+            print(f"위험 지역 피드: v{version} (추가 {len(diff['added'])}, "
+                  f"변경 {len(diff['changed'])}, 해제 {len(diff['removed'])})")
+            return version
+
+
+class RiskFeedReader:
+    """
+    위험 지역 스냅샷 읽기 (API 쪽)
+    파일 mtime이 바뀐 경우에만 다시 읽으므로 클라이언트 수와 관계없이 비용이 거의 없음
+    """
+
+    def __init__(self, state_dir=STATE_DIR):
+        self.state_dir = Path(state_dir)
+        self._lock = threading.Lock()
+        self._mtime = None
+        self._snapshot = {"version": 0, "generated_at": None, "articles_count": 0, "zones": []}
+
+    def snapshot(self):
+        path = self.state_dir / SNAPSHOT_FILE
+        try:
+            mtime = path.stat().st_mtime_ns
+        except OSError:
+            return self._snapshot
+        with self._lock:
+            if mtime != self._mtime:
+                data = read_json(path)
+                if data is not None:
+                    self._snapshot = data
+                    self._mtime = mtime
+            return self._snapshot
+
+    @property
+    def version(self):
+        return self.snapshot()["version"]
+
+    def changes_since(self, since):
+        """
+        since 이후의 diff 목록 반환
+        이력이 잘려서 since 다음 버전부터 이어지지 않으면 None (전체 스냅샷을 다시 받아야 함)
+        """
+        current = self.version
+        if since == current:
+            return []
+        if since > current:
+            return None  # 상태 디렉터리가 초기화된 경우
+        history = read_json(self.state_dir / CHANGES_FILE) or []
+        changes = [change for change in history if since < change["version"] <= current]
+        if not changes or changes[0]["version"] != since + 1:
+            return None
+        return changes
+
+
+risk_feed_publisher = RiskFeedPublisher()
+risk_feed_reader = RiskFeedReader()
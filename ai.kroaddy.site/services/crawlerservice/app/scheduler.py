@@ -0,0 +1,271 @@
+from apscheduler.schedulers.background import BackgroundScheduler
+from datetime import datetime
+from pathlib import Path
+import fcntl
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+
+# API 프로세스와 크롤 워커가 공유하는 상태 디렉터리 (leader lock, 메트릭, 최신 결과)
+STATE_DIR = Path(os.environ.get("CRAWLER_STATE_DIR", Path(tempfile.gettempdir()) / "crawler_state"))
+LOCK_FILE = "scheduler.lock"
+METRICS_FILE = "metrics.json"
+RESULT_FILE = "latest_result.json"
+
+
+def write_json_atomic(path, data):
+    """임시 파일에 쓴 뒤 rename하여 읽는 쪽이 반쯤 쓰인 파일을 보지 않도록 저장"""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    except BaseException:
+        # 직렬화/교체에 실패하면 임시 파일이 상태 디렉터리에 남지 않도록 삭제
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def read_json(path):
+    path = Path(path)
+    if not path.exists():
+        return None
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def read_metrics(state_dir=STATE_DIR):
+    return read_json(Path(state_dir) / METRICS_FILE)
+
+
+def read_latest_result(state_dir=STATE_DIR):
+    return read_json(Path(state_dir) / RESULT_FILE)
+
+
+class LeaderLock:
+    """
+    파일 잠금(flock) 기반 단일 리더 선출
+    같은 상태 디렉터리를 공유하는 프로세스 중 하나만 스케줄러를 실행합니다.
+    (uvicorn 멀티 워커 / 워커 컨테이너 여러 개에서 중복 크롤링 방지)
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self._fd = None
+
+    @property
+    def held(self):
+        return self._fd is not None
+
+    def acquire(self):
+        if self._fd is not None:
+            return True
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def release(self):
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+
+class CrawlScheduler:
+    """
+    스케줄러 → 작업 큐 → 워커 스레드 구조의 주기적 크롤링 실행기
+    - APScheduler는 작업을 큐에 넣기만 함 (max_instances=1, coalesce로 밀린 tick은 1회로 합침)
+    - 큐가 가득 차 있으면 새 작업을 버림 (backpressure, 이전 크롤이 끝나지 않았으면 쌓지 않음)
+    - 워커가 작업을 실행하고 소요 시간 메트릭과 최신 결과를 상태 디렉터리에 기록
+    - leader lock을 얻은 프로세스만 실행, 나머지는 standby로 주기적으로 lock 재시도
+    """
+
+    def __init__(self, job_func, interval_minutes=5, queue_size=1, on_result=None,
+                 state_dir=STATE_DIR, standby_retry_seconds=30):
+        self.job_func = job_func
+        self.interval_minutes = interval_minutes
+        self.on_result = on_result
+        self.state_dir = Path(state_dir)
+        self.standby_retry_seconds = standby_retry_seconds
+
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._lock = LeaderLock(self.state_dir / LOCK_FILE)
+        self._stop = threading.Event()
+        self._metrics_lock = threading.Lock()
+        self._scheduler = None
+        self._threads = []
+        self.metrics = {
+            "pid": os.getpid(),
+            "leader": False,
+            "interval_minutes": interval_minutes,
+            "queue_size": queue_size,
+            "queue_depth": 0,
+            "jobs_enqueued": 0,
+            "jobs_dropped": 0,
+            "jobs_completed": 0,
+            "jobs_failed": 0,
+            "last_started_at": None,
+            "last_finished_at": None,
+            "last_duration_seconds": None,
+            "avg_duration_seconds": None,
+            "max_duration_seconds": None,
+            "total_duration_seconds": 0.0,
+        }
+
+    # ==================== 메트릭 ====================
+
+    def _update_metrics(self, **changes):
+        with self._metrics_lock:
+            self.metrics.update(changes)
+            self.metrics["queue_depth"] = self._queue.qsize()
+            self.metrics["updated_at"] = datetime.now().isoformat(timespec="seconds")
+            snapshot = dict(self.metrics)
+        try:
+            write_json_atomic(self.state_dir / METRICS_FILE, snapshot)
+        except OSError as e:
+            print(f"스케줄러 메트릭 저장 실패: {str(e)}")
+        return snapshot
+
+    def _record_duration(self, duration, failed):
+        with self._metrics_lock:
+            completed = self.metrics["jobs_completed"] + (0 if failed else 1)
+            failures = self.metrics["jobs_failed"] + (1 if failed else 0)
+            total = self.metrics["total_duration_seconds"] + duration
+            max_duration = max(self.metrics["max_duration_seconds"] or 0.0, duration)
+        self._update_metrics(
+            jobs_completed=completed,
+            jobs_failed=failures,
+            last_finished_at=datetime.now().isoformat(timespec="seconds"),
+            last_duration_seconds=round(duration, 3),
+            total_duration_seconds=round(total, 3),
+            avg_duration_seconds=round(total / (completed + failures), 3),
+            max_duration_seconds=round(max_duration, 3),
+        )
+
+    # ==================== 스케줄러 / 워커 ====================
+
+    def enqueue(self):
+        """스케줄러 tick: 작업을 큐에 넣고, 가득 차 있으면 버림"""
+        try:
+            self._queue.put_nowait(time.time())
+            self._update_metrics(jobs_enqueued=self.metrics["jobs_enqueued"] + 1)
+            return True
+        except queue.Full:
+            self._update_metrics(jobs_dropped=self.metrics["jobs_dropped"] + 1)
+            print("스케줄러: 이전 크롤링이 진행 중이라 이번 작업을 건너뜁니다.")
+            return False
+
+    def run_once(self):
+        """작업 1회 실행 (메트릭/결과 기록 포함)"""
+        self._update_metrics(last_started_at=datetime.now().isoformat(timespec="seconds"))
+        start = time.perf_counter()
+        result = None
+        failed = False
+        try:
+            result = self.job_func()
+            failed = result is None
+        except Exception as e:
+            print(f"스케줄러 작업 오류: {str(e)}")
+            failed = True
+        self._record_duration(time.perf_counter() - start, failed)
+
+        if result is not None:
+            try:
+                write_json_atomic(self.state_dir / RESULT_FILE, {
+                    "finished_at": datetime.now().isoformat(timespec="seconds"),
+                    "result": result,
+                })
+            except (OSError, TypeError, ValueError) as e:
+                # 디스크 오류나 JSON으로 직렬화할 수 없는 결과 (on_result는 그대로 호출)
+                print(f"스케줄러 결과 저장 실패: {str(e)}")
+            if self.on_result:
+                try:
+                    self.on_result(result)
+                except Exception as e:
+                    print(f"스케줄러 결과 처리 오류: {str(e)}")
+        return result
+
+    def _worker_loop(self):
+        while not self._stop.is_set():
+            try:
+                self._queue.get(timeout=1)
+            except queue.Empty:
+                continue
+            try:
+                self.run_once()
+            except Exception as e:
+                # 워커 스레드가 죽으면 이후 tick이 모두 "진행 중"으로 버려지므로 여기서 막음
+                print(f"스케줄러 워커 오류: {str(e)}")
+            finally:
+                self._queue.task_done()
+                self._update_metrics()
+
+    def _start_leader(self, run_immediately):
+        self._scheduler = BackgroundScheduler(job_defaults={
+            "max_instances": 1,
+            "coalesce": True,
+            "misfire_grace_time": 60,
+        })
+        self._scheduler.add_job(self.enqueue, "interval", minutes=self.interval_minutes, id="crawler_job")
+        self._scheduler.start()
+
+        worker = threading.Thread(target=self._worker_loop, name="crawl-worker", daemon=True)
+        worker.start()
+        self._threads.append(worker)
+
+        self._update_metrics(leader=True, pid=os.getpid())
+        print(f"스케줄러: leader로 시작 (pid={os.getpid()}, 주기={self.interval_minutes}분)")
+        if run_immediately:
+            self.enqueue()
+
+    def _standby_loop(self, run_immediately):
+        while not self._stop.wait(self.standby_retry_seconds):
+            if self._lock.acquire():
+                self._start_leader(run_immediately)
+                return
+
+    def start(self, run_immediately=False):
+        """leader lock을 얻으면 스케줄러 시작, 아니면 standby"""
+        if self._lock.acquire():
+            self._start_leader(run_immediately)
+            return True
+        print(f"스케줄러: 다른 프로세스가 leader입니다. standby 대기 (pid={os.getpid()})")
+        standby = threading.Thread(target=self._standby_loop, args=(run_immediately,),
+                                   name="crawl-standby", daemon=True)
+        standby.start()
+        self._threads.append(standby)
+        return False
+
+    @property
+    def is_leader(self):
+        return self._lock.held
+
+    def shutdown(self):
+        self._stop.set()
+        if self._scheduler is not None:
+            self._scheduler.shutdown(wait=False)
+            self._scheduler = None
+        for thread in self._threads:
+            thread.join(timeout=5)
+        if self._lock.held:
+            self._update_metrics(leader=False)
+        self._lock.release()
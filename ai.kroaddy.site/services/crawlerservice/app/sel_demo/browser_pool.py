@@ -0,0 +1,171 @@
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+from contextlib import contextmanager
+import os
+import queue
+import threading
+import time
+
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH", "/usr/local/bin/chromedriver")
+
+# 이미지/폰트 요청 차단 (렌더링과 네트워크 비용 절감)
+BLOCKED_URL_PATTERNS = [
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico",
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+]
+
+
+def build_chrome_options():
+    """헤드리스 Chrome 옵션 (이미지/폰트 로딩 비활성화)"""
+    chrome_options = Options()
+    chrome_options.add_argument('--headless')  # 헤드리스 모드 (브라우저 창 안 띄움)
+    chrome_options.add_argument('--no-sandbox')
+    chrome_options.add_argument('--disable-dev-shm-usage')
+    chrome_options.add_argument('--disable-gpu')
+    chrome_options.add_argument('--window-size=1920,1080')
+    chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
+    chrome_options.add_experimental_option("prefs", {
+        "profile.managed_default_content_settings.images": 2,
+        "profile.default_content_setting_values.images": 2,
+    })
+    # DOM만 준비되면 driver.get()이 반환되도록 설정 (명시적 wait으로 필요한 요소를 기다림)
+    chrome_options.page_load_strategy = 'eager'
+    return chrome_options
+
+
+class PooledBrowser:
+    """풀에서 관리하는 WebDriver 래퍼 (사용 횟수 추적)"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.monotonic()
+
+    def is_healthy(self):
+        """세션이 살아있는지 확인"""
+        try:
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def quit(self):
+        try:
+            self.driver.quit()
+        except Exception:
+            pass
+
+
+class BrowserPool:
+    """
+    재사용 가능한 헤드리스 Chrome 세션 풀
+    - size개 세션을 미리 띄워두고 (warm) 요청 간 재사용
+    - 동시에 사용할 수 있는 세션 수를 size로 제한 (bounded parallelism)
+    - 반납 시 헬스체크 실패 또는 max_uses 초과 세션은 폐기 후 새로 생성 (recycle)
+    """
+
+    def __init__(self, size=2, max_uses=50, acquire_timeout=60, driver_factory=None):
+        self.size = size
+        self.max_uses = max_uses
+        self.acquire_timeout = acquire_timeout
+        self._driver_factory = driver_factory or self._create_driver
+        self._idle = queue.LifoQueue()  # 최근 사용한(캐시가 따뜻한) 세션 우선
+        self._slots = threading.BoundedSemaphore(size)
+        self._lock = threading.Lock()
+        self._created = 0
+        self._recycled = 0
+        self._closed = False
+
+    def _create_driver(self):
+        service = Service(CHROMEDRIVER_PATH)
+        driver = webdriver.Chrome(service=service, options=build_chrome_options())
+        try:
+            # CDP로 폰트/이미지 URL 차단
+            driver.execute_cdp_cmd("Network.enable", {})
+            driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URL_PATTERNS})
+        except Exception as e:
+            print(f"브라우저 리소스 차단 설정 실패: {str(e)}")
+        return driver
+
+    def _new_browser(self):
+        browser = PooledBrowser(self._driver_factory())
+        with self._lock:
+            self._created += 1
+        return browser
+
+    def warm(self, count=None):
+        """세션을 미리 생성하여 idle 큐에 적재"""
+        count = self.size if count is None else min(count, self.size)
+        while self._idle.qsize() < count:
+            try:
+                self._idle.put(self._new_browser())
+            except Exception as e:
+                print(f"브라우저 풀 워밍업 실패: {str(e)}")
+                break
+
+    def _checkout(self):
+        while True:
+            try:
+                browser = self._idle.get_nowait()
+            except queue.Empty:
+                return self._new_browser()
+            if browser.is_healthy():
+                return browser
+            browser.quit()
+            with self._lock:
+                self._recycled += 1
+
+    def _checkin(self, browser):
+        browser.uses += 1
+        if self._closed or browser.uses >= self.max_uses or not browser.is_healthy():
+            browser.quit()
+            with self._lock:
+                self._recycled += 1
+            return
+        self._idle.put(browser)
+
+    @contextmanager
+    def acquire(self):
+        """
+        세션 하나를 빌려서 사용
+            with browser_pool.acquire() as driver:
+                driver.get(url)
+        """
+        if self._closed:
+            raise RuntimeError("브라우저 풀이 종료되었습니다.")
+        if not self._slots.acquire(timeout=self.acquire_timeout):
+            raise TimeoutError(f"{self.acquire_timeout}초 안에 사용 가능한 브라우저가 없습니다.")
+        browser = None
+        try:
+            browser = self._checkout()
+            yield browser.driver
+        finally:
+            if browser is not None:
+                self._checkin(browser)
+            self._slots.release()
+
+    def stats(self):
+        return {
+            "size": self.size,
+            "idle": self._idle.qsize(),
+            "max_uses": self.max_uses,
+            "created": self._created,
+            "recycled": self._recycled,
+        }
+
+    def close(self):
+        """모든 세션 종료"""
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().quit()
+            except queue.Empty:
+                break
+
+
+# 서비스 전역 풀 (환경변수로 크기 조정)
+browser_pool = BrowserPool(
+    size=int(os.environ.get("BROWSER_POOL_SIZE", "2")),
+    max_uses=int(os.environ.get("BROWSER_POOL_MAX_USES", "50")),
+)
@@ -1,128 +1,145 @@
-from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import quote
+from app.sel_demo.browser_pool import browser_pool
+from app.bs_demo.replay import resolve_url
 import json
-import time
+import re
 
-def crawl_danawa_mats():
+PRODUCT_ITEM_SELECTOR = ".main_prodlist_list .product_list li.prod_item.prod_layer"
+
+# 페이지의 모든 제품 정보를 브라우저 안에서 한 번에 추출하는 스크립트
+# (제품마다 find_element를 호출하면 WebDriver 왕복이 제품 수 × 필드 수만큼 발생)
+PRODUCT_SNAPSHOT_SCRIPT = """
+const text = (el) => el ? el.textContent.trim() : "";
+const items = document.querySelectorAll(arguments[0]);
+return Array.from(items).map((item) => {
+    const nameEl = item.querySelector(".prod_info .prod_name a") || item.querySelector(".prod_info .prod_name");
+    const linkEl = item.querySelector(".thumb_link") || item.querySelector(".prod_name a");
+    const imgEl = item.querySelector(".thumb_image img") || item.querySelector(".thumb_link img");
+    const priceEl = item.querySelector(".prod_pricelist .price_sect strong") || item.querySelector(".prod_pricelist .price");
+    const categoryEl = item.querySelector("input[type='hidden'][id*='categoryInfo']");
+    return {
+        id: (item.id || "").replace("productItem", ""),
+        name: text(nameEl),
+        link: linkEl ? linkEl.href : "",
+        image: imgEl ? (imgEl.getAttribute("data-original") || imgEl.getAttribute("src") || "") : "",
+        price: text(priceEl),
+        category: categoryEl ? categoryEl.value : ""
+    };
+});
+"""
+
+def build_danawa_url(query, page=1):
+    return f"https://search.danawa.com/dsearch.php?query={quote(query)}&tab=goods&page={page}"
+
+def parse_price(price_text):
     """
-    다나와에서 매트 제품을 순서대로 크롤링
+    가격 문자열을 정수(원)로 변환
+    예: "12,340원" -> 12340, "최저가 1,200,000" -> 1200000, "가격비교예정" -> None
     """
-    # Chrome 옵션 설정
-    chrome_options = Options()
-    chrome_options.add_argument('--headless')  # 헤드리스 모드 (브라우저 창 안 띄움)
-    chrome_options.add_argument('--no-sandbox')
-    chrome_options.add_argument('--disable-dev-shm-usage')
-    chrome_options.add_argument('--disable-gpu')
-    chrome_options.add_argument('--window-size=1920,1080')
-    chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36')
-    
-    # 다나와 매트 검색 URL (예시)
-    url = "https://search.danawa.com/dsearch.php?query=매트&tab=goods"
-    
-    driver = None
-    try:
-        # ChromeDriver 경로 설정 (Docker 컨테이너 내부 경로)
-        service = Service('/usr/local/bin/chromedriver')
-        # WebDriver 생성
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        driver.get(url)
-        
+    if not price_text:
+        return None
+    match = re.search(r"\d[\d,]*", price_text)
+    if not match:
+        return None
+    return int(match.group().replace(",", ""))
+
+def normalize_image_url(image):
+    if image and image.startswith("//"):
+        return "https:" + image
+    return image or ""
+
+def crawl_danawa_page(query, page=1):
+    """
+    다나와 검색 결과 한 페이지를 크롤링
+    - 브라우저 풀에서 세션을 빌려 페이지를 연 뒤 DOM 스냅샷 한 번으로 모든 제품을 추출
+    """
+    url = build_danawa_url(query, page)
+
+    # 풀에서 미리 띄워둔 브라우저 세션을 빌려서 사용 (반납은 with 블록 종료 시)
+    with browser_pool.acquire() as driver:
+        driver.get(resolve_url(url))
+
         # 페이지 로딩 대기
         wait = WebDriverWait(driver, 10)
         wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, ".main_prodlist_list")))
-        
-        # 스크롤하여 더 많은 제품 로드 (필요시)
+
+        # 스크롤하여 지연 로딩되는 제품까지 로드한 뒤, 고정 sleep 대신 문서 로딩 완료와 제품 노출을 기다림
         driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-        time.sleep(2)
-        
-        # 제품 목록 컨테이너 찾기
-        product_list = driver.find_element(By.CSS_SELECTOR, ".main_prodlist_list .product_list")
-        products = product_list.find_elements(By.CSS_SELECTOR, "li.prod_item.prod_layer")
-        
-        results = []
-        
-        # 각 제품 정보 추출
-        for idx, product in enumerate(products, 1):
+        wait.until(lambda d: d.execute_script("return document.readyState") == "complete")
+        wait.until(EC.presence_of_all_elements_located((By.CSS_SELECTOR, PRODUCT_ITEM_SELECTOR)))
+
+        snapshot = driver.execute_script(PRODUCT_SNAPSHOT_SCRIPT, PRODUCT_ITEM_SELECTOR) or []
+
+    collected_at = datetime.now().isoformat(timespec="seconds")
+    results = []
+    for idx, product in enumerate(snapshot, 1):
+        # 제품명이 있는 경우만 추가
+        if not product.get("name"):
+            continue
+        results.append({
+            "검색어": query,
+            "페이지": page,
+            "순서": idx,
+            "제품ID": product.get("id", ""),
+            "제품명": product["name"],
+            "링크": product.get("link", ""),
+            "이미지": normalize_image_url(product.get("image")),
+            "가격": product.get("price", ""),
+            "가격_숫자": parse_price(product.get("price")),
+            "카테고리": product.get("category", ""),
+            "수집시각": collected_at
+        })
+
+    return results
+
+def crawl_danawa(queries, start_page=1, end_page=1, max_workers=None):
+    """
+    여러 검색어 × 여러 페이지를 브라우저 풀에 분산하여 병렬 크롤링
+    - (검색어, 페이지) 단위 작업을 풀 크기만큼 동시에 실행
+    - 실패한 페이지는 건너뛰고 errors에 기록
+
+    Returns:
+        dict: {"data": [...], "pages": 성공 페이지 수, "errors": [...]}
+    """
+    if isinstance(queries, str):
+        queries = [queries]
+    tasks = [(query, page) for query in queries for page in range(start_page, end_page + 1)]
+    workers = max(1, min(max_workers or browser_pool.size, len(tasks) or 1))
+
+    data = []
+    errors = []
+    pages = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [(task, executor.submit(crawl_danawa_page, *task)) for task in tasks]
+        for (query, page), future in futures:
             try:
-                # 제품 ID 추출
-                product_id = product.get_attribute("id")
-                if product_id:
-                    product_id = product_id.replace("productItem", "")
-                
-                # 제품명 추출
-                try:
-                    prod_info = product.find_element(By.CSS_SELECTOR, ".prod_info")
-                    prod_name_elem = prod_info.find_element(By.CSS_SELECTOR, ".prod_name a, .prod_name")
-                    product_name = prod_name_elem.text.strip()
-                except:
-                    product_name = ""
-                
-                # 제품 링크 추출
-                try:
-                    prod_link_elem = product.find_element(By.CSS_SELECTOR, ".thumb_link, .prod_name a")
-                    product_link = prod_link_elem.get_attribute("href")
-                except:
-                    product_link = ""
-                
-                # 제품 이미지 추출
-                try:
-                    img_elem = product.find_element(By.CSS_SELECTOR, ".thumb_image img, .thumb_link img")
-                    product_image = img_elem.get_attribute("src")
-                    if not product_image or product_image.startswith("//"):
-                        product_image = "https:" + product_image if product_image.startswith("//") else product_image
-                except:
-                    product_image = ""
-                
-                # 가격 정보 추출
-                try:
-                    price_list = product.find_element(By.CSS_SELECTOR, ".prod_pricelist")
-                    price_elem = price_list.find_element(By.CSS_SELECTOR, ".price_sect strong, .price")
-                    price = price_elem.text.strip()
-                except:
-                    price = ""
-                
-                # 카테고리 정보 추출
-                try:
-                    category_input = product.find_element(By.CSS_SELECTOR, "input[type='hidden'][id*='categoryInfo']")
-                    category = category_input.get_attribute("value")
-                except:
-                    category = ""
-                
-                # 결과에 추가
-                if product_name:  # 제품명이 있는 경우만 추가
-                    results.append({
-                        "순서": idx,
-                        "제품ID": product_id,
-                        "제품명": product_name,
-                        "링크": product_link,
-                        "이미지": product_image,
-                        "가격": price,
-                        "카테고리": category
-                    })
-                    
+                data.extend(future.result())
+                pages += 1
             except Exception as e:
-                # 개별 제품 처리 중 오류 발생 시 스킵
-                print(f"제품 {idx} 처리 중 오류: {str(e)}")
-                continue
-        
-        return results
-        
+                print(f"다나와 크롤링 오류 (검색어={query}, 페이지={page}): {str(e)}")
+                errors.append({"검색어": query, "페이지": page, "error": str(e)})
+
+    return {"data": data, "pages": pages, "errors": errors}
+
+def crawl_danawa_mats():
+    """
+    다나와에서 매트 제품을 순서대로 크롤링 (첫 페이지)
+    """
+    try:
+        return crawl_danawa_page("매트", 1)
     except Exception as e:
         print(f"크롤링 중 오류 발생: {str(e)}")
         return []
-        
-    finally:
-        if driver:
-            driver.quit()
 
 if __name__ == "__main__":
     # 크롤링 실행
     results = crawl_danawa_mats()
-    
+    browser_pool.close()
+
     # JSON 형태로 터미널에 출력
     print(json.dumps(results, ensure_ascii=False, indent=2))
-
@@ -0,0 +1,54 @@
+"""
+크롤 워커 프로세스
+
+API(uvicorn) 프로세스와 분리된 별도 프로세스에서 주기적 크롤링을 실행합니다.
+같은 CRAWLER_STATE_DIR을 공유하는 워커 중 leader lock을 얻은 하나만 실행되고
+나머지는 standby로 대기합니다.
+
+    python -m app.worker                # 주기 실행 (기본 5분)
+    python -m app.worker --once         # 1회 실행 후 종료
+"""
+import argparse
+import os
+import signal
+import threading
+
+from app.bs_demo.aggregate import run_all_crawlers
+from app.risk_feed import risk_feed_publisher
+from app.scheduler import CrawlScheduler
+
+
+def build_scheduler():
+    return CrawlScheduler(
+        run_all_crawlers,
+        interval_minutes=int(os.environ.get("CRAWLER_INTERVAL_MINUTES", "5")),
+        queue_size=int(os.environ.get("CRAWLER_QUEUE_SIZE", "1")),
+        on_result=risk_feed_publisher.publish,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="크롤 워커")
+    parser.add_argument("--once", action="store_true", help="크롤링 1회 실행 후 종료")
+    parser.add_argument("--no-initial-run", action="store_true", help="시작 직후 크롤링하지 않음")
+    args = parser.parse_args()
+
+    crawl_scheduler = build_scheduler()
+
+    if args.once:
+        crawl_scheduler.run_once()
+        return
+
+    stop = threading.Event()
+    signal.signal(signal.SIGTERM, lambda *_: stop.set())
+    signal.signal(signal.SIGINT, lambda *_: stop.set())
+
+    crawl_scheduler.start(run_immediately=not args.no_initial_run)
+    stop.wait()
+
+    print("크롤 워커 종료 중...")
+    crawl_scheduler.shutdown()
+
+
+if __name__ == "__main__":
+    main()
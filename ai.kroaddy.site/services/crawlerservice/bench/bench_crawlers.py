@@ -0,0 +1,234 @@
+"""
+크롤러 오프라인 벤치마크
+
+녹화된 fixture와 로컬 스텁 서버만 사용하므로 네트워크 없이 실행됩니다.
+
+측정 항목
+- parse: 소스별 파싱 시간 (fixture 원문 -> 기사 리스트)
+- crawl: 소스별 fetch + parse 처리량 (pages/sec)
+- pipeline: 일괄 처리(aggregate_news → analyze_article → sort)와 스트리밍 파이프라인의
+  첫 결과까지 시간 / 전체 시간 / 메모리 peak 비교 (키워드가 많은 경우)
+- endpoints: /news, /risk, /hazard 엔드투엔드 지연 (p50/p95)
+
+    python -m bench.bench_crawlers --iterations 20 --output bench_result.json
+    python -m bench.bench_crawlers --baseline bench_result.json --max-regression 0.2
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+from app.bs_demo.google import crawl_google_news, parse_google_news
+from app.bs_demo.naver import crawl_naver_news, parse_naver_news
+from app.bs_demo.daum import crawl_daum_news, parse_daum_news
+from app.bs_demo.bugsmusic import crawl_bugsmusic_chart, parse_bugsmusic_chart
+from app.bs_demo.aggregate import aggregate_news
+from app.bs_demo.hazard_analyzer import analyze_article
+from app.bs_demo.pipeline import TopK, analyze_stream
+from app.bs_demo.replay import REPLAY_ENV
+from app.bs_demo.http_client import http_client
+from bench.stub_server import FIXTURE_DIR, StubServer, load_index
+
+KEYWORDS = ["시위", "폭행", "속보", "테러", "위험"]
+
+PARSERS = {
+    "google": parse_google_news,
+    "naver": parse_naver_news,
+    "daum": parse_daum_news,
+    "bugsmusic": parse_bugsmusic_chart,
+}
+
+CRAWLERS = {
+    "google": lambda: crawl_google_news(KEYWORDS),
+    "naver": lambda: crawl_naver_news(KEYWORDS),
+    "daum": lambda: crawl_daum_news(KEYWORDS),
+    "bugsmusic": crawl_bugsmusic_chart,
+}
+
+ENDPOINTS = ["/news", "/risk", "/hazard"]
+
+# 파이프라인 비교용 대량 키워드 (5개씩 묶어 검색)
+PIPELINE_KEYWORDS = KEYWORDS * 6
+PIPELINE_BATCH_SIZE = 5
+
+
+def _summary(samples):
+    """초 단위 샘플 -> ms 단위 통계"""
+    ordered = sorted(samples)
+    p95_index = max(0, int(round(len(ordered) * 0.95)) - 1)
+    return {
+        "runs": len(ordered),
+        "mean_ms": round(statistics.mean(ordered) * 1000, 3),
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[p95_index] * 1000, 3),
+    }
+
+
+def _timed(func, iterations):
+    samples = []
+    result = None
+    for _ in range(iterations):
+        start = time.perf_counter()
+        result = func()
+        samples.append(time.perf_counter() - start)
+    return samples, result
+
+
+def bench_parse(iterations, fixture_dir=FIXTURE_DIR):
+    """소스별 파싱 비용 (네트워크 없음)"""
+    results = {}
+    for key, entry in load_index(fixture_dir).items():
+        source = entry.get("source")
+        parser = PARSERS.get(source)
+        if parser is None:
+            continue
+        text = (Path(fixture_dir) / entry["file"]).read_text(encoding="utf-8")
+        samples, items = _timed(lambda: parser(text), iterations)
+        results[source] = {**_summary(samples), "items": len(items), "bytes": len(text.encode("utf-8"))}
+    return results
+
+
+def bench_crawl(iterations):
+    """소스별 fetch + parse 처리량 (스텁 서버 경유)"""
+    results = {}
+    for source, crawl in CRAWLERS.items():
+        samples, items = _timed(crawl, iterations)
+        stats = _summary(samples)
+        stats["pages_per_sec"] = round(len(samples) / sum(samples), 2) if sum(samples) else None
+        stats["items"] = len(items)
+        results[source] = stats
+    return results
+
+
+def _batch_hazard(keywords):
+    """기존 /hazard 방식: 단계마다 리스트를 모두 만든 뒤 다음 단계로 진행"""
+    articles = []
+    for i in range(0, len(keywords), PIPELINE_BATCH_SIZE):
+        articles.extend(aggregate_news(keywords[i:i + PIPELINE_BATCH_SIZE]))
+    analyzed = [analyze_article(article) for article in articles]
+    analyzed.sort(key=lambda x: x.get("risk_score", 0), reverse=True)
+    yield from analyzed
+
+
+def _stream_hazard(keywords):
+    top = TopK(20)
+    for analyzed in analyze_stream(keywords, batch_size=PIPELINE_BATCH_SIZE):
+        top.push(analyzed)
+        yield analyzed
+
+
+def bench_pipeline(iterations):
+    """첫 결과까지 시간(ttfr), 전체 시간, tracemalloc peak 비교"""
+    results = {}
+    for name, run_pipeline in (("batch", _batch_hazard), ("stream", _stream_hazard)):
+        first, total, peaks = [], [], []
+        for _ in range(iterations):
+            tracemalloc.start()
+            start = time.perf_counter()
+            count = 0
+            for _item in run_pipeline(PIPELINE_KEYWORDS):
+                if count == 0:
+                    first.append(time.perf_counter() - start)
+                count += 1
+            total.append(time.perf_counter() - start)
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+        results[name] = {
+            "ttfr": _summary(first),
+            "total": _summary(total),
+            "peak_kb": round(max(peaks) / 1024, 1),
+            "items": count,
+        }
+    return results
+
+
+def bench_endpoints(iterations):
+    """FastAPI 엔드포인트 엔드투엔드 지연"""
+    # 벤치마크 중에는 주기 크롤링이 끼어들지 않도록 스케줄러 비활성화
+    os.environ.setdefault("CRAWLER_SCHEDULER_MODE", "off")
+    os.environ.setdefault("BROWSER_POOL_WARM", "false")
+    from fastapi.testclient import TestClient
+    from app.main import app
+
+    results = {}
+    with TestClient(app) as client:
+        for path in ENDPOINTS:
+            params = {"keywords": ",".join(KEYWORDS)}
+            samples, response = _timed(lambda: client.get(path, params=params), iterations)
+            body = response.json()
+            if not body.get("success"):
+                raise RuntimeError(f"{path} 실패: {body.get('error')}")
+            results[path] = _summary(samples)
+    return results
+
+
+def run(iterations, latency=0.0, fixture_dir=FIXTURE_DIR, include_endpoints=True, rate_limit=None):
+    report = {"iterations": iterations, "stub_latency_ms": latency * 1000, "rate_limit": rate_limit}
+    # 기본은 호스트별 속도 제한 없이 순수 크롤러 비용만 측정
+    http_client.set_rate_limit(rate_limit)
+    report["parse"] = bench_parse(iterations, fixture_dir)
+
+    with StubServer(fixture_dir=fixture_dir, latency=latency) as server:
+        previous = os.environ.get(REPLAY_ENV)
+        os.environ[REPLAY_ENV] = server.base_url
+        try:
+            report["crawl"] = bench_crawl(iterations)
+            report["pipeline"] = bench_pipeline(max(1, iterations // 4))
+            if include_endpoints:
+                report["endpoints"] = bench_endpoints(iterations)
+        finally:
+            if previous is None:
+                os.environ.pop(REPLAY_ENV, None)
+            else:
+                os.environ[REPLAY_ENV] = previous
+        report["stub_hits"] = server.hits
+    report["http_client"] = http_client.stats()
+    return report
+
+
+def compare(report, baseline, max_regression):
+    """기준 결과 대비 p50이 max_regression 비율 이상 느려진 항목 목록"""
+    regressions = []
+    for section in ("parse", "crawl", "endpoints"):
+        for name, stats in report.get(section, {}).items():
+            base = baseline.get(section, {}).get(name)
+            if not base or not base.get("p50_ms"):
+                continue
+            ratio = stats["p50_ms"] / base["p50_ms"] - 1
+            if ratio > max_regression:
+                regressions.append(f"{section}.{name}: {base['p50_ms']}ms -> {stats['p50_ms']}ms (+{ratio:.0%})")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="크롤러 오프라인 벤치마크")
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="스텁 서버 응답 지연 (ms)")
+    parser.add_argument("--fixtures", default=str(FIXTURE_DIR))
+    parser.add_argument("--rate-limit", type=float, default=None, help="호스트별 초당 요청 수 제한 (기본: 제한 없음)")
+    parser.add_argument("--skip-endpoints", action="store_true", help="/news, /risk, /hazard 측정 생략")
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="허용 p50 증가율 (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    report = run(args.iterations, args.latency_ms / 1000, args.fixtures, not args.skip_endpoints, args.rate_limit)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.max_regression)
+        if regressions:
+            print("성능 저하 감지:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("기준 대비 성능 저하 없음")
@@ -0,0 +1,150 @@
+"""
+크롤러 응답 녹화 스크립트
+
+실제 사이트(Google/Naver/Daum/Bugs)에 한 번 요청해서 응답 원문을 fixtures/ 에 저장합니다.
+네트워크 없이 CI에서 돌릴 수 있도록 --synthetic 옵션으로 파서 구조에 맞춘
+합성 fixture를 생성할 수도 있습니다.
+
+    python -m bench.record --keywords 시위,폭행,속보
+    python -m bench.record --synthetic 50
+"""
+import argparse
+import json
+import random
+from pathlib import Path
+
+import requests
+
+from app.bs_demo.google import build_google_news_url
+from app.bs_demo.naver import build_naver_news_url
+from app.bs_demo.daum import build_daum_news_url
+from app.bs_demo.bugsmusic import BUGSMUSIC_CHART_URL
+from bench.stub_server import FIXTURE_DIR, INDEX_FILE, fixture_key
+
+DEFAULT_KEYWORDS = ["시위", "폭행", "속보", "테러", "위험", "사고", "범죄"]
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+    "Accept-Language": "ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7",
+}
+
+# source 이름 -> (URL 생성 함수, 저장 파일명, Content-Type)
+SOURCES = {
+    "google": (build_google_news_url, "google_news.xml", "application/xml; charset=utf-8"),
+    "naver": (build_naver_news_url, "naver_news.html", "text/html; charset=utf-8"),
+    "daum": (build_daum_news_url, "daum_news.html", "text/html; charset=utf-8"),
+    "bugsmusic": (lambda keywords: BUGSMUSIC_CHART_URL, "bugsmusic_chart.html", "text/html; charset=utf-8"),
+}
+
+
+def save_index(index, fixture_dir=FIXTURE_DIR):
+    with open(Path(fixture_dir) / INDEX_FILE, "w", encoding="utf-8") as f:
+        json.dump(index, f, ensure_ascii=False, indent=2)
+
+
+def record_live(keywords, fixture_dir=FIXTURE_DIR):
+    """실제 사이트 응답을 녹화"""
+    fixture_dir = Path(fixture_dir)
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    index = {}
+    for source, (build_url, filename, content_type) in SOURCES.items():
+        url = build_url(keywords)
+        try:
+            response = requests.get(url, headers=HEADERS, timeout=10)
+            response.raise_for_status()
+        except Exception as e:
+            print(f"✗ {source} 녹화 실패: {str(e)}")
+            continue
+        (fixture_dir / filename).write_bytes(response.content)
+        index[fixture_key(url)] = {"file": filename, "content_type": content_type, "source": source}
+        print(f"✓ {source}: {len(response.content):,} bytes -> {filename}")
+    save_index(index, fixture_dir)
+    return index
+
+
+# ==================== 합성 fixture ====================
+
+_PLACES = ["서울", "부산", "강남구", "마포구", "종로구", "송파구", "대구", "인천", "수원", "해운대구"]
+_EVENTS = ["시위", "폭행", "화재", "사고", "테러", "절도", "집회", "충돌", "경고", "범죄"]
+
+
+def _headline(rng):
+    return f"{rng.choice(_PLACES)}에서 {rng.choice(_EVENTS)} 발생 속보"
+
+
+def _synthetic_google(rng, count):
+    items = "".join(
+        f"<item><title>{_headline(rng)}</title><link>https://news.google.com/articles/{i}</link>"
+        f"<pubDate>Mon, 01 Dec 2025 0{i % 10}:00:00 GMT</pubDate></item>"
+        for i in range(count)
+    )
+    return f'<?xml version="1.0" encoding="UTF-8"?><rss version="2.0"><channel>{items}</channel></rss>'
+
+
+def _synthetic_naver(rng, count):
+    items = "".join(
+        f'<li class="bx"><div class="news_wrap"><a class="news_tit" href="https://n.news.naver.com/article/{i}">{_headline(rng)}</a>'
+        f'<span class="info">{i % 24}시간 전</span><a class="info press">언론사{i % 7}</a>'
+        f'<div class="news_dsc">{_headline(rng)} 관련 경찰 조사 중</div></div></li>'
+        for i in range(count)
+    )
+    return f'<html><body><ul class="list_news">{items}</ul></body></html>'
+
+
+def _synthetic_daum(rng, count):
+    items = "".join(
+        f'<li><div class="wrap_cont"><a class="f_link_b" href="https://v.daum.net/v/{i}">{_headline(rng)}</a>'
+        f'<span class="f_nb">2025.12.01</span><p class="desc">{_headline(rng)} 현장 상황</p></div></li>'
+        for i in range(count)
+    )
+    return f'<html><body><ul class="list_news">{items}</ul></body></html>'
+
+
+def _synthetic_bugsmusic(rng, count):
+    rows = "".join(
+        f'<tr><td><p class="title"><a>곡 {i}</a></p></td><td><p class="artist"><a>가수 {i % 30}</a></p></td>'
+        f'<td><a class="album">앨범 {i % 40}</a></td></tr>'
+        for i in range(count)
+    )
+    return (
+        '<html><body><div id="CHARTrealtime"><table class="list trackList byChart">'
+        f"<tbody>{rows}</tbody></table></div></body></html>"
+    )
+
+
+_SYNTHETIC = {
+    "google": _synthetic_google,
+    "naver": _synthetic_naver,
+    "daum": _synthetic_daum,
+    "bugsmusic": _synthetic_bugsmusic,
+}
+
+
+def record_synthetic(count, fixture_dir=FIXTURE_DIR, seed=42):
+    """파서 선택자에 맞춘 합성 fixture 생성 (결정적)"""
+    fixture_dir = Path(fixture_dir)
+    fixture_dir.mkdir(parents=True, exist_ok=True)
+    rng = random.Random(seed)
+    index = {}
+    for source, (build_url, filename, content_type) in SOURCES.items():
+        body = _SYNTHETIC[source](rng, count)
+        (fixture_dir / filename).write_text(body, encoding="utf-8")
+        index[fixture_key(build_url(DEFAULT_KEYWORDS))] = {
+            "file": filename, "content_type": content_type, "source": source
+        }
+        print(f"✓ {source}: 합성 {count}건 -> {filename}")
+    save_index(index, fixture_dir)
+    return index
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="크롤러 fixture 녹화")
+    parser.add_argument("--keywords", default=",".join(DEFAULT_KEYWORDS), help="쉼표로 구분된 키워드")
+    parser.add_argument("--synthetic", type=int, default=0, help="합성 fixture 항목 수 (0이면 실제 사이트 녹화)")
+    parser.add_argument("--output", default=str(FIXTURE_DIR), help="fixture 저장 경로")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        record_synthetic(args.synthetic, args.output)
+    else:
+        record_live([k.strip() for k in args.keywords.split(",") if k.strip()], args.output)
@@ -0,0 +1,115 @@
+"""
+녹화된 크롤링 응답(fixtures)을 그대로 돌려주는 로컬 스텁 HTTP 서버
+
+app.bs_demo.replay.resolve_url 이 만드는 /{host}{path}?{query} 형식의 요청을
+fixtures/index.json 의 "host/path" 키로 찾아 응답합니다. (쿼리스트링은 무시)
+
+    with StubServer() as server:
+        os.environ["CRAWLER_REPLAY_URL"] = server.base_url
+        crawl_naver_news(["시위"])
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import urlsplit
+
+FIXTURE_DIR = Path(__file__).parent / "fixtures"
+INDEX_FILE = "index.json"
+
+
+def load_index(fixture_dir=FIXTURE_DIR):
+    """fixtures/index.json 로드 ({"host/path": {"file": ..., "content_type": ...}})"""
+    index_path = Path(fixture_dir) / INDEX_FILE
+    if not index_path.exists():
+        return {}
+    with open(index_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def fixture_key(url):
+    """원본 URL 또는 재생 경로를 fixture 키(host/path)로 변환"""
+    parts = urlsplit(url)
+    if parts.netloc:
+        return f"{parts.netloc}{parts.path}"
+    return parts.path.lstrip("/")
+
+
+class StubServer:
+    """fixture를 메모리에 올려두고 스레드로 서비스하는 스텁 서버"""
+
+    def __init__(self, fixture_dir=FIXTURE_DIR, host="127.0.0.1", port=0, latency=0.0):
+        self.fixture_dir = Path(fixture_dir)
+        self.host = host
+        self.port = port
+        self.latency = latency  # 네트워크 지연 흉내 (초)
+        self.hits = 0
+        self._responses = {}
+        self._server = None
+        self._thread = None
+
+    def _load(self):
+        for key, entry in load_index(self.fixture_dir).items():
+            body = (self.fixture_dir / entry["file"]).read_bytes()
+            self._responses[key] = (body, entry.get("content_type", "text/html; charset=utf-8"))
+
+    @property
+    def base_url(self):
+        return f"http://{self.host}:{self.port}"
+
+    def start(self):
+        self._load()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                stub.hits += 1
+                if stub.latency:
+                    threading.Event().wait(stub.latency)
+                entry = stub._responses.get(fixture_key(self.path))
+                if entry is None:
+                    self.send_error(404, "fixture not found")
+                    return
+                body, content_type = entry
+                self.send_response(200)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass  # 벤치마크 출력 오염 방지
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.stop()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="크롤러 fixture 스텁 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = StubServer(port=args.port).start()
+    print(f"스텁 서버 실행 중: {server.base_url} (CRAWLER_REPLAY_URL로 지정하세요)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
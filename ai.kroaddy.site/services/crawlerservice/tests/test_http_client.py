@@ -0,0 +1,77 @@
+import time
+
+import pytest
+import requests
+
+from app.bs_demo.http_client import CircuitOpenError, HttpClient
+
+
+class FakeResponse:
+    def __init__(self, text="ok", status_code=200):
+        self.text = text
+        self.status_code = status_code
+        self.headers = {}
+
+    def raise_for_status(self):
+        pass
+
+
+def _client():
+    return HttpClient(rate=None, max_retries=0, backoff_base=0, failure_threshold=1, reset_timeout=0.05)
+
+
+def _open_circuit(client, monkeypatch, url):
+    def refuse(*args, **kwargs):
+        raise requests.ConnectionError("refused")
+
+    monkeypatch.setattr(client.session, "get", refuse)
+    with pytest.raises(requests.ConnectionError):
+        client.fetch_text(url)
+    assert client._breaker("example.test").state == "open"
+    with pytest.raises(CircuitOpenError):
+        client.fetch_text(url)
+    time.sleep(0.06)
+
+
+@pytest.mark.parametrize("error", [
+    requests.exceptions.ChunkedEncodingError("broken chunk"),
+    requests.exceptions.ContentDecodingError("bad gzip"),
+    requests.exceptions.TooManyRedirects("loop"),
+    requests.exceptions.InvalidURL("bad url"),
+    ValueError("unexpected"),
+])
+def test_unlisted_error_on_half_open_trial_reopens_circuit(monkeypatch, error):
+    client = _client()
+    url = "http://example.test/page"
+    _open_circuit(client, monkeypatch, url)
+
+    def fail(*args, **kwargs):
+        raise error
+
+    monkeypatch.setattr(client.session, "get", fail)
+    with pytest.raises(type(error)):
+        client.fetch_text(url)
+    breaker = client._breaker("example.test")
+    assert breaker.state == "open"
+
+    # reset_timeout 이후 다시 시험 요청이 허용되고, 성공하면 회로가 닫힘
+    time.sleep(0.06)
+    monkeypatch.setattr(client.session, "get", lambda *args, **kwargs: FakeResponse("recovered"))
+    assert client.fetch_text(url) == "recovered"
+    assert breaker.state == "closed"
+
+
+def test_request_exception_is_retried_as_transport_failure(monkeypatch):
+    client = HttpClient(rate=None, max_retries=2, backoff_base=0, failure_threshold=5)
+    calls = []
+
+    def flaky(*args, **kwargs):
+        calls.append(1)
+        if len(calls) < 3:
+            raise requests.exceptions.ChunkedEncodingError("broken chunk")
+        return FakeResponse("ok")
+
+    monkeypatch.setattr(client.session, "get", flaky)
+    assert client.fetch_text("http://example.test/page") == "ok"
+    assert len(calls) == 3
+    assert client.stats()["retries"] == 2
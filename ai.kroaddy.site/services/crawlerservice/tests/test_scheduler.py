@@ -0,0 +1,57 @@
+import threading
+import time
+
+import pytest
+
+from app.scheduler import CrawlScheduler, RESULT_FILE, read_latest_result, write_json_atomic
+
+
+def test_write_json_atomic_removes_temp_file_on_failure(tmp_path):
+    target = tmp_path / "data.json"
+    with pytest.raises(TypeError):
+        write_json_atomic(target, {"value": object()})
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_unserializable_result_does_not_fail_run_once(tmp_path):
+    received = []
+    sched = CrawlScheduler(lambda: {"value": object()}, on_result=received.append, state_dir=tmp_path)
+    result = sched.run_once()
+    assert received == [result]
+    assert sched.metrics["jobs_completed"] == 1
+    assert read_latest_result(tmp_path) is None
+    assert not any(p.name.startswith(f".{RESULT_FILE}.") for p in tmp_path.iterdir())
+
+
+def test_worker_survives_result_write_error(tmp_path, monkeypatch):
+    calls = []
+    done = threading.Event()
+
+    def job():
+        calls.append(1)
+        if len(calls) == 2:
+            done.set()
+        return {"n": len(calls)}
+
+    sched = CrawlScheduler(job, state_dir=tmp_path)
+
+    def broken_run_once():
+        CrawlScheduler.run_once(sched)
+        if len(calls) == 1:
+            raise RuntimeError("unexpected")
+
+    monkeypatch.setattr(sched, "run_once", broken_run_once)
+    worker = threading.Thread(target=sched._worker_loop, daemon=True)
+    worker.start()
+    try:
+        assert sched.enqueue()
+        deadline = time.time() + 5
+        while sched._queue.unfinished_tasks and time.time() < deadline:
+            time.sleep(0.01)
+        assert worker.is_alive()
+        assert sched.enqueue()
+        assert done.wait(5)
+    finally:
+        sched._stop.set()
+        worker.join(timeout=5)
+    assert len(calls) == 2
@@ -0,0 +1,110 @@
+import gzip
+import hashlib
+import json
+from typing import Any, Dict, Iterable, Optional
+
+import shapely
+from shapely.geometry import mapping, shape
+from starlette.requests import Request
+from starlette.responses import Response
+
+# brotli가 있으면 br도 제공, 없으면 gzip만
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더에 etag가 있는지 (여러 값, W/ 접두사, * 허용)"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/").strip('"') == etag for tag in tags)
+
+
+def _round_coords(coords, precision: int):
+    """좌표 반올림 (반올림 후 연속으로 같은 점은 제거)"""
+    if isinstance(coords[0], (int, float)):
+        return [round(c, precision) for c in coords]
+    if isinstance(coords[0][0], (int, float)):
+        ring = []
+        for point in coords:
+            point = [round(c, precision) for c in point]
+            if not ring or point != ring[-1]:
+                ring.append(point)
+        return ring
+    return [_round_coords(part, precision) for part in coords]
+
+
+def compact_geojson(geojson: Dict[str, Any], tolerance: float, precision: int,
+                    properties: Iterable[str] = ("name",)) -> Dict[str, Any]:
+    """
+    클라이언트 렌더링용 경계 GeoJSON (단순화 + 좌표 자릿수 축소 + 필요한 속성만)
+    - 인접한 구/주 경계가 똑같이 단순화되도록 coverage_simplify 사용 (없거나 실패하면 도형별 simplify)
+    - tolerance: 단순화 허용 오차 (좌표 단위, 경위도면 도), precision: 소수점 자릿수
+    """
+    features = geojson["features"]
+    geometries = [shape(f["geometry"]) for f in features]
+    simplified = None
+    if tolerance > 0 and hasattr(shapely, "coverage_simplify"):
+        try:
+            simplified = list(shapely.coverage_simplify(geometries, tolerance))
+        except Exception:
+            simplified = None
+    if simplified is None:
+        simplified = [g.simplify(tolerance, preserve_topology=True) if tolerance > 0 else g for g in geometries]
+
+    compact = []
+    for feature, geometry in zip(features, simplified):
+        geo = mapping(geometry)
+        item = {
+            "type": "Feature",
+            "properties": {k: feature["properties"][k] for k in properties if k in feature.get("properties", {})},
+            "geometry": {"type": geo["type"], "coordinates": _round_coords(geo["coordinates"], precision)},
+        }
+        if "id" in feature:
+            item["id"] = feature["id"]
+        compact.append(item)
+    return {"type": "FeatureCollection", "features": compact}
+
+
+class CompressedPayload:
+    """
+    JSON 응답 본문을 한 번만 직렬화/압축해 보관 (gzip, brotli 설치 시 br)
+    etag는 본문 해시라서 내용이 같으면 프로세스가 달라도 같은 값
+    """
+
+    def __init__(self, body: bytes, media_type: str = "application/json"):
+        self.body = body
+        self.media_type = media_type
+        self.etag = hashlib.sha256(body).hexdigest()[:20]
+        self.encoded = {"gzip": gzip.compress(body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.encoded["br"] = brotli.compress(body, quality=11)
+
+    @classmethod
+    def from_json(cls, data: Any) -> "CompressedPayload":
+        return cls(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    def sizes(self) -> Dict[str, int]:
+        return {"identity": len(self.body), **{k: len(v) for k, v in self.encoded.items()}}
+
+    def response(self, request: Request, max_age: int = 0) -> Response:
+        """
+        Accept-Encoding에 맞춰 압축된 본문 응답, If-None-Match가 같으면 304
+        max_age: 0이면 매번 ETag로 재검증 (데이터가 바뀔 수 있는 값), 경계처럼 거의 안 바뀌면 길게
+        """
+        headers = {
+            "ETag": f'"{self.etag}"',
+            "Vary": "Accept-Encoding",
+            "Cache-Control": f"public, max-age={max_age}" if max_age else "no-cache",
+        }
+        if etag_matches(request.headers.get("if-none-match"), self.etag):
+            return Response(status_code=304, headers=headers)
+        accepted = {part.split(";")[0].strip() for part in request.headers.get("accept-encoding", "").split(",")}
+        for encoding in ("br", "gzip"):
+            if encoding in accepted and encoding in self.encoded:
+                headers["Content-Encoding"] = encoding
+                return Response(self.encoded[encoding], media_type=self.media_type, headers=headers)
+        return Response(self.body, media_type=self.media_type, headers=headers)
@@ -0,0 +1,60 @@
+from fastapi import APIRouter, HTTPException, Path
+from typing import Any, Dict, List
+
+from app.jobs.job_runner import job_runner, SUCCEEDED, FAILED
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+@router.get("", response_model=List[Dict[str, Any]])
+async def list_jobs():
+    """최근 작업 목록 (상태만)"""
+    return job_runner.list()
+
+
+@router.get("/{job_id}", response_model=Dict[str, Any])
+async def get_job(job_id: str = Path(..., description="작업 ID")):
+    """작업 상태 조회 (queued / running / succeeded / failed / cancelled)"""
+    job = job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+@router.get("/{job_id}/result", response_model=Dict[str, Any])
+async def get_job_result(job_id: str = Path(..., description="작업 ID")):
+    """
+    작업 결과 조회
+    - 아직 끝나지 않았거나 취소된 작업: 409
+    - 실패한 작업: 500 (에러 메시지 포함)
+    """
+    job = job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    if job["status"] == FAILED:
+        raise HTTPException(status_code=500, detail=f"작업 실패: {job['error']}")
+    if job["status"] != SUCCEEDED:
+        raise HTTPException(status_code=409, detail=f"작업이 완료되지 않았습니다 (status: {job['status']})")
+    return {**job, "result": job_runner.result(job_id)}
+
+
+@router.delete("/{job_id}", response_model=Dict[str, Any])
+async def cancel_job(job_id: str = Path(..., description="작업 ID")):
+    """
+    작업 취소
+    대기 중인 작업은 실행되지 않고, 이미 실행 중인 작업은 끝난 뒤 결과를 버립니다.
+    """
+    job = job_runner.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job
+
+
+def job_accepted(job_id: str) -> Dict[str, Any]:
+    """작업 제출 응답 (202)"""
+    return {
+        "job_id": job_id,
+        "status": job_runner.get(job_id)["status"],
+        "status_url": f"/jobs/{job_id}",
+        "result_url": f"/jobs/{job_id}/result",
+    }
@@ -0,0 +1,205 @@
+import asyncio
+import multiprocessing
+import os
+import sys
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# 로깅 설정
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+    from common.utils import setup_logging
+    logger = setup_logging("job_runner")
+except ImportError:
+    import logging
+    logger = logging.getLogger("job_runner")
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+
+# 작업 프로세스 수 (기본: CPU 수, 최대 4)
+JOB_WORKERS = int(os.environ.get("ML_JOB_WORKERS", str(min(4, os.cpu_count() or 1))))
+# 끝난 작업 결과 보관 시간(초)과 최대 개수
+JOB_TTL_SECONDS = int(os.environ.get("ML_JOB_TTL_SECONDS", "3600"))
+JOB_MAX_HISTORY = int(os.environ.get("ML_JOB_MAX_HISTORY", "200"))
+# 워커 프로세스 시작 방식 (spawn: 서버 스레드/락 상태를 복제하지 않음)
+JOB_START_METHOD = os.environ.get("ML_JOB_START_METHOD", "spawn")
+
+QUEUED, RUNNING, SUCCEEDED, FAILED, CANCELLED = "queued", "running", "succeeded", "failed", "cancelled"
+
+
+def _execute(fn: Callable, args: tuple, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """워커 프로세스에서 작업 실행 (실제 시작/종료 시각을 함께 반환)"""
+    started_at = time.time()
+    result = fn(*args, **kwargs)
+    return {"result": result, "started_at": started_at, "finished_at": time.time()}
+
+
+class JobRunner:
+    """
+    CPU를 많이 쓰는 작업(모델 학습, 전처리, 이미지/지도 생성)을 프로세스 풀에서 실행
+    - submit: 작업 id를 바로 반환하고 상태/결과는 id로 조회
+    - run: 제출 후 이벤트 루프를 막지 않고 결과를 기다림 (기존 동기 응답 엔드포인트용)
+    - cancel: 대기 중인 작업은 실행되지 않고, 실행 중인 작업은 결과를 버림
+      (프로세스 풀은 실행 중인 작업을 중단할 수 없어 해당 워커는 작업을 끝까지 수행)
+    - 끝난 작업은 JOB_TTL_SECONDS 동안 / 최근 JOB_MAX_HISTORY개만 보관
+
+    작업 함수는 워커 프로세스에서 import할 수 있는 모듈 수준 함수여야 하고,
+    인자와 반환값은 pickle 가능해야 합니다.
+    """
+
+    def __init__(self, max_workers: int = JOB_WORKERS, start_method: str = JOB_START_METHOD,
+                 ttl_seconds: int = JOB_TTL_SECONDS, max_history: int = JOB_MAX_HISTORY):
+        self.max_workers = max_workers
+        self.start_method = start_method
+        self.ttl_seconds = ttl_seconds
+        self.max_history = max_history
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._jobs: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.start_method)
+            )
+            logger.info(f"✅ 작업 프로세스 풀 시작: {self.max_workers}개 ({self.start_method})")
+        return self._executor
+
+    # ==================== 제출 ====================
+
+    def submit(self, name: str, fn: Callable, *args, on_done: Optional[Callable[[Any], None]] = None, **kwargs) -> str:
+        """
+        작업 제출 후 작업 id 반환
+        on_done: 작업이 성공하면 이 서버 프로세스에서 결과로 호출 (캐시 무효화, 모델 다시 로드 등)
+        """
+        job_id = uuid.uuid4().hex[:12]
+        with self._lock:
+            self._prune()
+            try:
+                future = self._get_executor().submit(_execute, fn, args, kwargs)
+            except BrokenProcessPool:
+                # 워커가 비정상 종료되어 풀이 망가진 경우 새로 만듦
+                logger.warning("작업 프로세스 풀이 손상되어 다시 시작합니다.")
+                self._executor = None
+                future = self._get_executor().submit(_execute, fn, args, kwargs)
+            self._jobs[job_id] = {
+                "job_id": job_id,
+                "name": name,
+                "submitted_at": time.time(),
+                "future": future,
+                "cancelled": False,
+            }
+        future.add_done_callback(lambda f: self._finish(job_id, f, on_done))
+        logger.info(f"▶ 작업 제출: {name} ({job_id})")
+        return job_id
+
+    def _finish(self, job_id: str, future: Future, on_done: Optional[Callable[[Any], None]]):
+        job = self._jobs.get(job_id)
+        if job is None or future.cancelled():
+            return
+        error = future.exception()
+        if error is not None:
+            logger.warning(f"작업 실패: {job['name']} ({job_id}) - {type(error).__name__}: {error}")
+            return
+        output = future.result()
+        job["started_at"] = output["started_at"]
+        job["finished_at"] = output["finished_at"]
+        logger.info(f"✅ 작업 완료: {job['name']} ({job_id}, {output['finished_at'] - output['started_at']:.2f}s)")
+        if on_done is not None and not job["cancelled"]:
+            try:
+                on_done(output["result"])
+            except Exception as e:
+                logger.warning(f"작업 완료 처리 실패 ({job_id}): {str(e)}")
+
+    def _prune(self):
+        """오래된 완료 작업 정리 (lock 안에서 호출)"""
+        now = time.time()
+        for job_id in list(self._jobs):
+            job = self._jobs[job_id]
+            expired = job["future"].done() and now - job["submitted_at"] > self.ttl_seconds
+            if expired or len(self._jobs) > self.max_history and job["future"].done():
+                del self._jobs[job_id]
+
+    # ==================== 조회 ====================
+
+    @staticmethod
+    def _status(job: Dict[str, Any]) -> str:
+        future = job["future"]
+        if job["cancelled"] or future.cancelled():
+            return CANCELLED
+        if future.done():
+            return FAILED if future.exception() is not None else SUCCEEDED
+        return RUNNING if future.running() else QUEUED
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """작업 상태 (없으면 None)"""
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        status = self._status(job)
+        info = {
+            "job_id": job_id,
+            "name": job["name"],
+            "status": status,
+            "submitted_at": job["submitted_at"],
+            "started_at": job.get("started_at"),
+            "finished_at": job.get("finished_at"),
+        }
+        if job.get("finished_at"):
+            info["elapsed"] = round(job["finished_at"] - job["started_at"], 3)
+        if status == FAILED:
+            error = job["future"].exception()
+            info["error"] = f"{type(error).__name__}: {error}"
+        return info
+
+    def list(self) -> List[Dict[str, Any]]:
+        return [self.get(job_id) for job_id in list(self._jobs)]
+
+    def result(self, job_id: str) -> Any:
+        """성공한 작업의 결과 (상태 확인 후 호출)"""
+        return self._jobs[job_id]["future"].result()["result"]
+
+    # ==================== 취소 / 대기 ====================
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if not job["future"].done():
+            if not job["future"].cancel():
+                job["cancelled"] = True
+            logger.info(f"작업 취소: {job['name']} ({job_id})")
+        return self.get(job_id)
+
+    async def wait(self, job_id: str) -> Any:
+        """
+        작업 결과를 이벤트 루프를 막지 않고 기다림 (실패하면 작업의 예외를 그대로 발생)
+        기다리던 요청이 끊기면 아직 시작하지 않은 작업은 취소됨
+        """
+        output = await asyncio.wrap_future(self._jobs[job_id]["future"])
+        return output["result"]
+
+    async def run(self, name: str, fn: Callable, *args, on_done: Optional[Callable[[Any], None]] = None, **kwargs) -> Any:
+        """제출 후 결과 대기"""
+        job_id = self.submit(name, fn, *args, on_done=on_done, **kwargs)
+        return await self.wait(job_id)
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+
+job_runner = JobRunner()
@@ -2,9 +2,11 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # 라우터 임포트
-from app.titanic.titanic_router import router as titanic_router
+from app.titanic.titanic_router import router as titanic_router, titanic_service
 from app.seoul_crime.seoul_router import router as seoul_router
 from app.us_unemployment.router import router as usa_router
+from app.jobs.job_router import router as jobs_router
+from app.jobs.job_runner import job_runner
 
 # NLP 라우터 임포트 (에러 발생 시에도 계속 진행)
 try:
@@ -44,6 +46,8 @@ app = FastAPI(
     - `GET /titanic/passengers/search` - 승객 검색
     - `GET /titanic/passengers/top/{top_n}` - 요금 기준 상위 N명
     - `GET /titanic/stats` - 통계 정보
+    - `POST /titanic/jobs/evaluate` - 학습/평가 작업 제출 (작업 프로세스에서 실행)
+    - `GET /jobs/{job_id}` - 작업 상태, `GET /jobs/{job_id}/result` - 작업 결과, `DELETE /jobs/{job_id}` - 작업 취소
     
     ### Swagger UI
     
@@ -148,6 +152,13 @@ app.include_router(
     tags=["usa"]
 )
 
+# 백그라운드 작업 라우터 등록 (titanic/seoul/nlp 작업 상태, 결과, 취소)
+app.include_router(
+    jobs_router,
+    prefix="",  # job_router.py에서 이미 /jobs prefix가 설정되어 있음
+    tags=["jobs"]
+)
+
 # NLP 서비스 라우터 등록
 if nlp_router_loaded and nlp_router is not None:
     app.include_router(
@@ -159,6 +170,30 @@ else:
     import logging
     logging.warning("NLP 라우터가 등록되지 않았습니다. import 에러를 확인하세요.")
 
+@app.on_event("startup")
+def load_saved_models():
+    """저장된 타이타닉 모델을 백그라운드에서 로드 (재시작 후 재학습 불필요)"""
+    titanic_service.warm_start()
+
+
+@app.on_event("startup")
+def load_passenger_store():
+    """승객 저장소 로드 (스냅샷 + 변경 저널 재생)"""
+    titanic_service.store.load()
+
+
+@app.on_event("shutdown")
+def close_passenger_store():
+    """남은 승객 변경 저널을 스냅샷으로 압축"""
+    titanic_service.store.close()
+
+
+@app.on_event("shutdown")
+def shutdown_job_runner():
+    """대기 중인 작업 취소 및 작업 프로세스 종료"""
+    job_runner.shutdown()
+
+
 @app.get("/")
 async def root():
     """서비스 상태 확인"""
@@ -0,0 +1,107 @@
+"""
+작업 프로세스에서 실행되는 NLP 분석 (app.jobs.job_runner에서 호출)
+
+토큰화, POS 태깅, 형태소 분석, 워드클라우드 렌더링은 CPU를 오래 쓰므로
+서버 이벤트 루프가 아닌 작업 프로세스에서 실행하고 결과(PNG 바이트, 통계 dict)만 돌려받습니다.
+nltk/konlpy는 작업 프로세스에서 처음 필요할 때 import합니다.
+"""
+from io import BytesIO
+from typing import Any, Dict, List, Tuple
+
+# 고유명사 필터에서 제외할 호칭
+EMMA_STOPWORDS = ["Mr.", "Mrs.", "Miss", "Mr", "Mrs", "Dear"]
+
+# 워커 프로세스마다 하나 (nltk 데이터 확인을 한 번만 수행)
+_nlp_service = None
+
+
+def _worker_nlp_service():
+    global _nlp_service
+    if _nlp_service is None:
+        from app.nlp.emma.emma_wordcloud import NLPService
+        _nlp_service = NLPService(download_nltk_data=True)
+    return _nlp_service
+
+
+def _to_png(wc) -> bytes:
+    """WordCloud -> PNG 바이트"""
+    from PIL import Image
+    img_buffer = BytesIO()
+    Image.fromarray(wc.to_array()).save(img_buffer, format='PNG')
+    return img_buffer.getvalue()
+
+
+def _emma_names():
+    """Emma 말뭉치 → 토큰화 → POS 태깅 → 고유명사(NNP) 빈도 분포"""
+    nlp_service = _worker_nlp_service()
+    emma_raw = nlp_service.load_corpus("austen-emma.txt")
+    emma_tokens = nlp_service.tokenize_regex(emma_raw)
+    tagged_tokens = nlp_service.pos_tag(emma_tokens)
+    names = nlp_service.filter_tokens_by_pos(
+        pos_tag="NNP",
+        stopwords=EMMA_STOPWORDS,
+        tagged_list=tagged_tokens
+    )
+    return nlp_service, nlp_service.create_freq_dist(names)
+
+
+def emma_wordcloud_job(width: int, height: int, background_color: str, random_state: int) -> bytes:
+    nlp_service, fd_names = _emma_names()
+    wc = nlp_service.generate_wordcloud(
+        freq_dist=fd_names,
+        width=width,
+        height=height,
+        background_color=background_color,
+        random_state=random_state,
+        show=False
+    )
+    return _to_png(wc)
+
+
+def emma_stats_job() -> Dict[str, Any]:
+    nlp_service, fd_names = _emma_names()
+    total, emma_count, emma_freq = nlp_service.get_freq_statistics(fd_names, "Emma")
+    most_common: List[Tuple[str, int]] = nlp_service.get_most_common(fd_names, 10)
+    return {
+        "status": "success",
+        "total_words": total,
+        "emma_count": emma_count,
+        "emma_frequency": round(emma_freq, 4),
+        "top_10_words": [
+            {"word": word, "count": count}
+            for word, count in most_common
+        ]
+    }
+
+
+def samsung_wordcloud_job(file_path: str, stopword_path: str, width: int, height: int,
+                          relative_scaling: float, background_color: str) -> bytes:
+    from app.nlp.samsung.samsung_wordcloud import SamsungWordCloud
+    swc = SamsungWordCloud(file_path=file_path, stopword_path=stopword_path)
+    swc.read_file()
+    wc = swc.draw_wordcloud(
+        width=width,
+        height=height,
+        relative_scaling=relative_scaling,
+        background_color=background_color,
+        show=False,
+        save=True
+    )
+    return _to_png(wc)
+
+
+def samsung_stats_job(file_path: str, stopword_path: str, top_n: int) -> Dict[str, Any]:
+    from app.nlp.samsung.samsung_wordcloud import SamsungWordCloud
+    swc = SamsungWordCloud(file_path=file_path, stopword_path=stopword_path)
+    swc.read_file()
+    freq = swc.find_freq()
+    total_words = len(swc.filtered_texts) if swc.filtered_texts else 0
+    top_words = freq.head(top_n).to_dict()
+    return {
+        "status": "success",
+        "total_words": total_words,
+        "top_words": [
+            {"word": word, "count": int(count)}
+            for word, count in top_words.items()
+        ]
+    }
@@ -4,6 +4,9 @@ from typing import Dict, Any, Optional
 from io import BytesIO
 from pathlib import Path
 
+from app.nlp import nlp_jobs
+from app.jobs.job_runner import job_runner
+
 # 라우터 생성 (게이트웨이 라우팅과 일치하도록 /nlp로 설정)
 router = APIRouter(prefix="/nlp", tags=["nlp"])
 
@@ -93,51 +96,14 @@ async def generate_emma_wordcloud(
     - PNG 형식의 워드클라우드 이미지
     """
     try:
-        # 1. Emma 말뭉치 로드
-        emma_raw = nlp_service.load_corpus("austen-emma.txt")
-        
-        # 2. 토큰화 (정규식 사용)
-        emma_tokens = nlp_service.tokenize_regex(emma_raw)
-        
-        # 3. POS 태깅
-        tagged_tokens = nlp_service.pos_tag(emma_tokens)
-        
-        # 4. 고유명사(NNP)만 필터링 (stopwords 제외)
-        stopwords = ["Mr.", "Mrs.", "Miss", "Mr", "Mrs", "Dear"]
-        names = nlp_service.filter_tokens_by_pos(
-            pos_tag="NNP",
-            stopwords=stopwords,
-            tagged_list=tagged_tokens
-        )
-        
-        # 5. 빈도 분포 생성
-        fd_names = nlp_service.create_freq_dist(names)
-        
-        # 6. 워드클라우드 생성 (show=False로 설정하여 이미지만 생성)
-        wc = nlp_service.generate_wordcloud(
-            freq_dist=fd_names,
-            width=width,
-            height=height,
-            background_color=background_color,
-            random_state=random_state,
-            show=False
+        # 말뭉치 로드 → 토큰화 → POS 태깅 → 고유명사 빈도 → 워드클라우드 (작업 프로세스에서 실행)
+        image_bytes = await job_runner.run(
+            "nlp.emma.wordcloud", nlp_jobs.emma_wordcloud_job,
+            width, height, background_color, random_state
         )
         
-        # 7. 이미지를 BytesIO로 변환
-        from PIL import Image
-        import numpy as np
-        
-        # WordCloud를 numpy 배열로 변환 후 PIL Image로 변환
-        img_array = wc.to_array()
-        img = Image.fromarray(img_array)
-        
-        img_buffer = BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-        
-        # 8. Response로 반환
         return Response(
-            content=img_buffer.getvalue(),
+            content=image_bytes,
             media_type="image/png",
             headers={
                 "Content-Disposition": "inline; filename=emma_wordcloud.png"
@@ -166,40 +132,8 @@ async def get_emma_stats():
                 status_code=503,
                 detail="NLPService가 초기화되지 않았습니다. 서버 로그를 확인하세요."
             )
-        # 1. Emma 말뭉치 로드
-        emma_raw = nlp_service.load_corpus("austen-emma.txt")
-        
-        # 2. 토큰화
-        emma_tokens = nlp_service.tokenize_regex(emma_raw)
-        
-        # 3. POS 태깅
-        tagged_tokens = nlp_service.pos_tag(emma_tokens)
-        
-        # 4. 고유명사만 필터링
-        stopwords = ["Mr.", "Mrs.", "Miss", "Mr", "Mrs", "Dear"]
-        names = nlp_service.filter_tokens_by_pos(
-            pos_tag="NNP",
-            stopwords=stopwords,
-            tagged_list=tagged_tokens
-        )
-        
-        # 5. 빈도 분포 생성
-        fd_names = nlp_service.create_freq_dist(names)
-        
-        # 6. 통계 정보 수집
-        total, emma_count, emma_freq = nlp_service.get_freq_statistics(fd_names, "Emma")
-        most_common = nlp_service.get_most_common(fd_names, 10)
-        
-        return {
-            "status": "success",
-            "total_words": total,
-            "emma_count": emma_count,
-            "emma_frequency": round(emma_freq, 4),
-            "top_10_words": [
-                {"word": word, "count": count} 
-                for word, count in most_common
-            ]
-        }
+        # 말뭉치 분석 및 통계 수집 (작업 프로세스에서 실행)
+        return await job_runner.run("nlp.emma.stats", nlp_jobs.emma_stats_job)
         
     except Exception as e:
         raise HTTPException(
@@ -266,40 +200,15 @@ async def generate_samsung_wordcloud(
                 detail=f"스탑워드 파일을 찾을 수 없습니다: {stopword_path} (경로: {stopword_path_obj.absolute()})"
             )
         
-        # SamsungWordCloud 인스턴스 생성
-        swc = SamsungWordCloud(
-            file_path=str(file_path_obj),
-            stopword_path=str(stopword_path_obj)
+        # 파일 읽기 → 명사 추출 → 스탑워드 제거 → 워드클라우드 (작업 프로세스에서 실행)
+        image_bytes = await job_runner.run(
+            "nlp.samsung.wordcloud", nlp_jobs.samsung_wordcloud_job,
+            str(file_path_obj), str(stopword_path_obj), width, height, relative_scaling, background_color
         )
         
-        # 파일 읽기
-        swc.read_file()
-        
-        # 워드클라우드 생성 (show=False로 설정하여 이미지만 생성)
-        wc = swc.draw_wordcloud(
-            width=width,
-            height=height,
-            relative_scaling=relative_scaling,
-            background_color=background_color,
-            show=False,
-            save=True
-        )
-        
-        # 이미지를 BytesIO로 변환 - emma와 동일한 패턴
-        from PIL import Image
-        import numpy as np
-        
-        # WordCloud를 numpy 배열로 변환 후 PIL Image로 변환
-        img_array = wc.to_array()
-        img = Image.fromarray(img_array)
-        
-        img_buffer = BytesIO()
-        img.save(img_buffer, format='PNG')
-        img_buffer.seek(0)
-        
         # Response로 반환 - emma와 동일한 패턴
         return Response(
-            content=img_buffer.getvalue(),
+            content=image_bytes,
             media_type="image/png",
             headers={
                 "Content-Disposition": "inline; filename=samsung_wordcloud.png"
@@ -371,31 +280,12 @@ async def get_samsung_stats(
                 detail=f"스탑워드 파일을 찾을 수 없습니다: {stopword_path}"
             )
         
-        # SamsungWordCloud 인스턴스 생성
-        swc = SamsungWordCloud(
-            file_path=str(file_path_obj),
-            stopword_path=str(stopword_path_obj)
+        # 파일 읽기 및 빈도 분석 (작업 프로세스에서 실행)
+        return await job_runner.run(
+            "nlp.samsung.stats", nlp_jobs.samsung_stats_job,
+            str(file_path_obj), str(stopword_path_obj), top_n
         )
         
-        # 파일 읽기
-        swc.read_file()
-        
-        # 빈도 분석
-        freq = swc.find_freq()
-        
-        # 통계 정보 수집
-        total_words = len(swc.filtered_texts) if swc.filtered_texts else 0
-        top_words = freq.head(top_n).to_dict()
-        
-        return {
-            "status": "success",
-            "total_words": total_words,
-            "top_words": [
-                {"word": word, "count": int(count)} 
-                for word, count in top_words.items()
-            ]
-        }
-        
     except HTTPException:
         # HTTPException은 그대로 전달
         raise
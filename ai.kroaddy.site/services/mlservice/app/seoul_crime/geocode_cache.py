@@ -0,0 +1,103 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+# docker-compose에서 볼륨으로 마운트되는 디렉터리 (재시작해도 유지)
+GEOCODE_CACHE_PATH = Path(os.environ.get("SEOUL_GEOCODE_CACHE_PATH", Path(__file__).parent / "cache" / "geocode.sqlite3"))
+# 검색 결과 보관 기간 (경찰서 위치는 거의 바뀌지 않음), 결과 없음은 짧게 보관
+GEOCODE_TTL_SECONDS = int(os.environ.get("SEOUL_GEOCODE_TTL_SECONDS", str(30 * 24 * 3600)))
+GEOCODE_NEGATIVE_TTL_SECONDS = int(os.environ.get("SEOUL_GEOCODE_NEGATIVE_TTL_SECONDS", str(24 * 3600)))
+
+# 결과 없음을 캐시에 표시하는 값 (조회 시 None으로 반환)
+NOT_FOUND = "null"
+
+
+class GeocodeCache:
+    """
+    Geocoding 결과 디스크 캐시 (SQLite, 쿼리 문자열 키)
+    - 값: Kakao 응답을 변환한 결과 리스트(JSON), 결과 없음은 NOT_FOUND로 짧은 TTL 동안 보관
+    - API 호출 실패(네트워크 오류, 5xx 등)는 저장하지 않음
+    - 작업 프로세스들이 같은 파일을 공유하므로 WAL 모드 사용
+    """
+
+    def __init__(self, path: Path = GEOCODE_CACHE_PATH, ttl_seconds: int = GEOCODE_TTL_SECONDS,
+                 negative_ttl_seconds: int = GEOCODE_NEGATIVE_TTL_SECONDS):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=10, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS geocode ("
+                " query TEXT PRIMARY KEY, result TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._conn = conn
+        return self._conn
+
+    def get_many(self, queries: Iterable[str]) -> Dict[str, Optional[Any]]:
+        """
+        만료되지 않은 항목만 반환 {query: 결과 리스트 또는 None(결과 없음)}
+        캐시에 없는 쿼리는 반환 딕셔너리에 포함되지 않음
+        """
+        queries = list(dict.fromkeys(queries))
+        if not queries:
+            return {}
+        found = {}
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            # SQLite 변수 개수 제한(999)을 넘지 않도록 나눠서 조회
+            for start in range(0, len(queries), 500):
+                batch = queries[start:start + 500]
+                rows = conn.execute(
+                    f"SELECT query, result FROM geocode WHERE expires_at > ? AND query IN ({','.join('?' * len(batch))})",
+                    [now, *batch]
+                ).fetchall()
+                for query, result in rows:
+                    found[query] = None if result == NOT_FOUND else json.loads(result)
+        return found
+
+    def set_many(self, results: Dict[str, Optional[Any]]):
+        """{query: 결과 리스트 또는 None} 저장 (None은 negative_ttl_seconds 동안 보관)"""
+        if not results:
+            return
+        now = time.time()
+        rows = [
+            (query, NOT_FOUND, now + self.negative_ttl_seconds) if result is None
+            else (query, json.dumps(result, ensure_ascii=False), now + self.ttl_seconds)
+            for query, result in results.items()
+        ]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.executemany("INSERT OR REPLACE INTO geocode (query, result, expires_at) VALUES (?, ?, ?)", rows)
+
+    def purge_expired(self) -> int:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute("DELETE FROM geocode WHERE expires_at <= ?", (time.time(),)).rowcount
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            conn = self._connect()
+            total, negative, expired = conn.execute(
+                "SELECT COUNT(*), SUM(result = ?), SUM(expires_at <= ?) FROM geocode", (NOT_FOUND, time.time())
+            ).fetchone()
+        return {"path": str(self.path), "entries": total, "not_found": negative or 0, "expired": expired or 0}
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
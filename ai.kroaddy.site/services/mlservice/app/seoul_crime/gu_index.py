@@ -0,0 +1,75 @@
+import json
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+from shapely.strtree import STRtree
+
+
+class GuIndex:
+    """
+    자치구 경계 공간 인덱스 (kr-state.json 등 GeoJSON FeatureCollection)
+    - shape()로 Polygon/MultiPolygon(구멍 포함)을 그대로 읽음
+    - 경계는 prepare()로 미리 준비하고 STRtree로 후보 구만 검사
+    - lookup_many: 좌표 배열을 한 번에 처리 (GEOS 벡터 연산, 파이썬 반복 없음)
+    """
+
+    def __init__(self, features: List[dict], name_key: str = 'name'):
+        self.names = np.array([f['properties'][name_key] for f in features], dtype=object)
+        self.geometries = np.array([shape(f['geometry']) for f in features], dtype=object)
+        shapely.prepare(self.geometries)
+        self.tree = STRtree(self.geometries)
+
+    @classmethod
+    def from_geojson(cls, json_path: str, name_key: str = 'name') -> "GuIndex":
+        with open(json_path, 'r', encoding='utf-8') as f:
+            geojson = json.load(f)
+        return cls(geojson['features'], name_key=name_key)
+
+    @property
+    def boundaries(self) -> Dict[str, object]:
+        return dict(zip(self.names, self.geometries))
+
+    def lookup(self, lng: float, lat: float) -> Optional[str]:
+        """좌표가 속한 구 이름 (없으면 None)"""
+        return self.lookup_many([lng], [lat])[0]
+
+    def lookup_many(self, lngs, lats) -> np.ndarray:
+        """
+        좌표 배열 -> 구 이름 배열 (object, 속한 구가 없으면 None)
+        구 내부에 있는 점만 해당 구로 판정하므로 경계선 위의 점은 None (기존 polygon.contains와 같음)
+        경계 데이터가 겹쳐 내부에 있는 구가 여럿이면 GeoJSON에서 앞에 있는 구
+        """
+        points = shapely.points(np.asarray(lngs, dtype=float), np.asarray(lats, dtype=float))
+        result = np.full(len(points), None, dtype=object)
+        point_idx, geom_idx = self.tree.query(points, predicate='within')
+        # predicate는 (점, 구) 순서로 평가됨 -> 점이 구 내부에 있으면 within (경계선 위는 제외)
+        # 점마다 구 번호가 가장 작은 결과 하나만
+        order = np.lexsort((geom_idx, point_idx))
+        point_idx, geom_idx = point_idx[order], geom_idx[order]
+        first = np.ones(len(point_idx), dtype=bool)
+        first[1:] = point_idx[1:] != point_idx[:-1]
+        result[point_idx[first]] = self.names[geom_idx[first]]
+        return result
+
+
+_indexes: Dict[Tuple[str, str], Tuple[int, GuIndex]] = {}
+_lock = threading.Lock()
+
+
+def load_gu_index(json_path: str, name_key: str = 'name') -> GuIndex:
+    """파일별 인덱스 (파일이 바뀌면 다시 생성, 프로세스 안에서 공유)"""
+    path = Path(json_path)
+    key = (str(path.resolve()), name_key)
+    mtime = path.stat().st_mtime_ns
+    with _lock:
+        cached = _indexes.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    index = GuIndex.from_geojson(str(path), name_key=name_key)
+    with _lock:
+        _indexes[key] = (mtime, index)
+    return index
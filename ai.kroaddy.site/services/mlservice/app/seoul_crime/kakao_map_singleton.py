@@ -1,8 +1,14 @@
 import os
+import threading
+import time
 import requests
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
+from app.seoul_crime.geocode_cache import GeocodeCache
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +26,30 @@ else:
     # .env가 없으면 기본 .env 파일도 시도
     load_dotenv()
 
+# 요청 타임아웃(초), 초당 최대 요청 수, geocode_many 동시 요청 수
+KAKAO_TIMEOUT = float(os.environ.get("KAKAO_TIMEOUT", "5"))
+KAKAO_RATE_PER_SEC = float(os.environ.get("KAKAO_RATE_PER_SEC", "10"))
+KAKAO_MAX_WORKERS = int(os.environ.get("KAKAO_MAX_WORKERS", "4"))
+
+
+class _RateLimiter:
+    """요청 시작 간격을 1/rate초 이상으로 유지 (여러 스레드 공유)"""
+
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate if rate > 0 else 0.0
+        self._next = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next)
+            self._next = start + self.interval
+        if start > now:
+            time.sleep(start - now)
+
 
 class KakaoMapSingleton:
     _instance = None  # 싱글턴 인스턴스를 저장할 클래스 변수
@@ -30,6 +60,11 @@ class KakaoMapSingleton:
             cls._instance._api_key = cls._instance._retrieve_api_key()  # API 키 가져오기
             cls._instance._address_url = "https://dapi.kakao.com/v2/local/search/address.json"
             cls._instance._keyword_url = "https://dapi.kakao.com/v2/local/search/keyword.json"
+            cls._instance._session = None
+            cls._instance._limiter = _RateLimiter(KAKAO_RATE_PER_SEC)
+            cls._instance.cache = GeocodeCache()
+            cls._instance._stats = {"cache_hits": 0, "requests": 0, "errors": 0}
+            cls._instance._stats_lock = threading.Lock()
         return cls._instance  # 기존 인스턴스 반환
 
     def _retrieve_api_key(self):
@@ -49,48 +84,93 @@ class KakaoMapSingleton:
         """저장된 API 키 반환"""
         return self._api_key
 
-    def geocode(self, query, language='ko'):
-        """장소명 또는 주소를 위도, 경도로 변환하는 메서드 (키워드 검색 사용)"""
-        if not self._api_key:
-            return None
+    def _get_session(self) -> requests.Session:
+        """keep-alive 커넥션 풀 (geocode_many의 동시 요청 수만큼)"""
+        if self._session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max(1, KAKAO_MAX_WORKERS), max_retries=0)
+            session.mount("https://", adapter)
+            session.headers["Authorization"] = f"KakaoAK {self._api_key}"
+            self._session = session
+        return self._session
+
+    def _count(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def stats(self) -> Dict[str, Any]:
+        with self._stats_lock:
+            return dict(self._stats)
+
+    @staticmethod
+    def _to_result(doc: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Kakao 키워드 검색 결과 1건 -> Google Geocoding과 유사한 형식"""
+        # 키워드 검색 API 응답 형식: address_name 또는 road_address_name이 직접 있음
+        address_name = doc.get('address_name', '') or doc.get('road_address_name', '')
+        if not address_name and 'address' in doc:
+            address_name = doc['address'].get('address_name', '') or doc['address'].get('road_address_name', '')
+        if not address_name and 'road_address' in doc:
+            address_name = doc['road_address'].get('address_name', '') or doc['road_address'].get('road_address_name', '')
         
-        headers = {
-            "Authorization": f"KakaoAK {self._api_key}"
-        }
+        return [{
+            "formatted_address": address_name,
+            "geometry": {
+                "location": {
+                    "lat": float(doc.get('y', 0)),
+                    "lng": float(doc.get('x', 0))
+                }
+            }
+        }]
+
+    def _request(self, query: str):
+        """
+        키워드 검색 API 호출 (캐시 없이)
+        Returns: (성공 여부, 결과 리스트 또는 None) - 실패는 캐시에 저장하지 않도록 구분
+        """
         params = {
             "query": query,
             "size": 1  # 첫 번째 결과만
         }
-        
+        self._limiter.wait()
+        self._count("requests")
         try:
             # 키워드 검색 API 사용 (장소명 검색 가능)
-            response = requests.get(self._keyword_url, headers=headers, params=params)
+            response = self._get_session().get(self._keyword_url, params=params, timeout=KAKAO_TIMEOUT)
             response.raise_for_status()
             data = response.json()
-            
-            if data.get('documents') and len(data['documents']) > 0:
-                # Kakao Maps API와 유사한 형식으로 변환
-                doc = data['documents'][0]
-                
-                # 키워드 검색 API 응답 형식: address_name 또는 road_address_name이 직접 있음
-                address_name = doc.get('address_name', '') or doc.get('road_address_name', '')
-                if not address_name and 'address' in doc:
-                    address_name = doc['address'].get('address_name', '') or doc['address'].get('road_address_name', '')
-                if not address_name and 'road_address' in doc:
-                    address_name = doc['road_address'].get('address_name', '') or doc['road_address'].get('road_address_name', '')
-                
-                return [{
-                    "formatted_address": address_name,
-                    "geometry": {
-                        "location": {
-                            "lat": float(doc.get('y', 0)),
-                            "lng": float(doc.get('x', 0))
-                        }
-                    }
-                }]
-            else:
-                logger.warning(f"검색 결과 없음: query={query}, response={data}")
-            return None
         except Exception as e:
+            self._count("errors")
             logger.error(f"Kakao Map API 호출 실패: query={query}, error={str(e)}")
-            return None
+            return False, None
+        
+        if data.get('documents') and len(data['documents']) > 0:
+            return True, self._to_result(data['documents'][0])
+        logger.warning(f"검색 결과 없음: query={query}, response={data}")
+        return True, None
+
+    def geocode(self, query, language='ko'):
+        """장소명 또는 주소를 위도, 경도로 변환하는 메서드 (키워드 검색 사용, 디스크 캐시 우선)"""
+        return self.geocode_many([query], language=language).get(query)
+
+    def geocode_many(self, queries: Iterable[str], language='ko', max_workers: int = KAKAO_MAX_WORKERS) -> Dict[str, Optional[List[Dict[str, Any]]]]:
+        """
+        여러 쿼리를 한 번에 변환 {query: geocode 결과 또는 None}
+        - 중복 쿼리는 한 번만 조회
+        - 캐시(geocode_cache)에 있으면 API를 호출하지 않음
+        - 캐시에 없는 쿼리만 max_workers개 스레드로 동시에 요청 (초당 KAKAO_RATE_PER_SEC건 이하)
+        """
+        queries = list(dict.fromkeys(q for q in queries if q))
+        if not self._api_key or not queries:
+            return {q: None for q in queries}
+        
+        results = self.cache.get_many(queries)
+        self._count("cache_hits", len(results))
+        misses = [q for q in queries if q not in results]
+        if misses:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(misses)))) as pool:
+                fetched = dict(zip(misses, pool.map(self._request, misses)))
+            # 성공한 응답만 저장 (결과 없음 포함, 호출 실패는 다음에 다시 시도)
+            self.cache.set_many({q: result for q, (ok, result) in fetched.items() if ok})
+            results.update({q: result for q, (ok, result) in fetched.items()})
+            logger.info(f"Kakao geocoding: {len(queries)}건 중 캐시 {len(queries) - len(misses)}건, API {len(misses)}건")
+        return {q: results.get(q) for q in queries}
@@ -0,0 +1,106 @@
+import hashlib
+import json
+import os
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import logging
+
+logger = logging.getLogger(__name__)
+
+# docker-compose에서 볼륨으로 마운트되는 seoul_crime/cache 아래 (재시작해도 유지)
+RENDER_CACHE_DIR = Path(os.environ.get("SEOUL_RENDER_CACHE_DIR", Path(__file__).parent / "cache" / "render"))
+# 캐시 전체 최대 크기, 넘으면 오래 사용하지 않은 파일부터 삭제
+RENDER_CACHE_MAX_MB = int(os.environ.get("SEOUL_RENDER_CACHE_MAX_MB", "200"))
+# 렌더링 코드(색상, dpi, 레이아웃 등)를 바꾸면 올려서 기존 캐시를 무효화
+RENDER_VERSION = "1"
+
+
+class RenderCache:
+    """
+    히트맵 PNG / folium 지도 HTML 캐시 (내용 주소 방식)
+    - 키: (데이터 버전, 종류, 렌더링 파라미터) 해시 -> 같은 키면 같은 내용이므로 그대로 ETag로 사용
+    - 파일 이름이 곧 키라서 작업 프로세스들이 같은 디렉터리를 공유해도 안전 (임시 파일에 쓴 뒤 교체)
+    - 조회할 때 mtime을 갱신하고, 최대 크기를 넘으면 mtime이 오래된 파일부터 삭제 (LRU)
+    """
+
+    def __init__(self, cache_dir: Path = RENDER_CACHE_DIR, max_mb: int = RENDER_CACHE_MAX_MB):
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_mb * 1024 * 1024
+        self._lock = threading.Lock()
+
+    def key(self, data_version: str, kind: str, params: Dict[str, Any]) -> str:
+        h = hashlib.sha256()
+        h.update(data_version.encode())
+        h.update(RENDER_VERSION.encode())
+        h.update(kind.encode())
+        h.update(json.dumps(params, sort_keys=True, ensure_ascii=False, default=str).encode())
+        return h.hexdigest()[:20]
+
+    def path(self, key: str, suffix: str) -> Path:
+        return self.cache_dir / f"{key}.{suffix}"
+
+    def get(self, key: str, suffix: str) -> Optional[Path]:
+        """캐시 파일 경로 (없으면 None)"""
+        path = self.path(key, suffix)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def get_or_create(self, key: str, suffix: str, write: Callable[[Path], None]) -> Path:
+        """
+        캐시에 없으면 write(임시 파일 경로)로 생성해 저장
+        Returns: 캐시 파일 경로
+        """
+        path = self.get(key, suffix)
+        if path is not None:
+            return path
+        path = self.path(key, suffix)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.cache_dir / f".{key}.{uuid.uuid4().hex}.tmp.{suffix}"
+        try:
+            write(tmp_path)
+            os.replace(tmp_path, path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        logger.info(f"렌더링 캐시 저장: {path.name} ({path.stat().st_size / 1024:.0f} KB)")
+        self.evict()
+        return path
+
+    def evict(self) -> int:
+        """최대 크기를 넘으면 오래 사용하지 않은 파일부터 삭제, 삭제한 파일 수 반환"""
+        with self._lock:
+            entries = []
+            for p in self.cache_dir.glob("*"):
+                if p.name.startswith("."):
+                    continue
+                try:
+                    stat = p.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, p))
+            total = sum(size for _, size, _ in entries)
+            removed = 0
+            # 가장 최근 파일은 방금 만들거나 조회한 파일이므로 남김
+            for _, size, p in sorted(entries, key=lambda e: e[0])[:-1]:
+                if total <= self.max_bytes:
+                    break
+                p.unlink(missing_ok=True)
+                total -= size
+                removed += 1
+        if removed:
+            logger.info(f"렌더링 캐시 정리: {removed}개 삭제")
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        files = [p for p in self.cache_dir.glob("*") if not p.name.startswith(".")] if self.cache_dir.exists() else []
+        return {
+            "path": str(self.cache_dir),
+            "entries": len(files),
+            "size_mb": round(sum(p.stat().st_size for p in files) / 1024 / 1024, 2),
+            "max_mb": self.max_bytes // 1024 // 1024,
+        }
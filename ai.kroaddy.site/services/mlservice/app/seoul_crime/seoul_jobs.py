@@ -0,0 +1,37 @@
+"""
+작업 프로세스에서 실행되는 서울 데이터 처리 (app.jobs.job_runner에서 호출)
+
+전처리, 히트맵(matplotlib), 지도(folium) 생성은 CPU를 오래 쓰므로
+서버 이벤트 루프가 아닌 작업 프로세스에서 실행합니다.
+"""
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.seoul_crime.seoul_service import SeoulService
+
+# 워커 프로세스마다 하나
+_service: Optional[SeoulService] = None
+
+
+def _worker_service() -> SeoulService:
+    global _service
+    if _service is None:
+        _service = SeoulService()
+    return _service
+
+
+def preprocess_job() -> Dict[str, Any]:
+    return _worker_service().preprocess()
+
+
+def heatmap_data_job() -> Dict[str, Any]:
+    return _worker_service().get_heatmap_data()
+
+
+def render_job(kind: str, crime_type: str = '전체') -> Tuple[str, str]:
+    """히트맵/지도 렌더링 (캐시에 저장) -> (캐시 키, 파일 경로)"""
+    return _worker_service().render(kind, crime_type)
+
+
+def render_many_job(variants: List[Tuple[str, str]]) -> List[Dict[str, Any]]:
+    """여러 조합을 순서대로 렌더링 (전처리 후 미리 렌더링)"""
+    return _worker_service().render_many(variants)
@@ -1,9 +1,10 @@
 import pandas as pd
+import numpy as np
 import json
 from pathlib import Path
 from io import BytesIO
-from shapely.geometry import Point, Polygon
 from app.seoul_crime.kakao_map_singleton import KakaoMapSingleton
+from app.seoul_crime.gu_index import load_gu_index
 import matplotlib
 matplotlib.use('Agg')  # GUI 백엔드 없이 사용
 import matplotlib.pyplot as plt
@@ -19,6 +20,15 @@ class SeoulMethod:
         self.gmaps = KakaoMapSingleton()
         self.gu_boundaries = None
         self._korean_font_prop = None  # 한글 폰트 속성 초기화
+        self._geojson = None  # (경로, mtime, GeoJSON) 지도 생성 시 재사용
+
+    def _load_geojson(self, json_path: str) -> dict:
+        """GeoJSON 로드 (파일이 바뀌지 않았으면 이전에 읽은 것 사용, folium은 수정하지 않음)"""
+        mtime = Path(json_path).stat().st_mtime_ns
+        if self._geojson is None or self._geojson[:2] != (str(json_path), mtime):
+            with open(json_path, 'r', encoding='utf-8') as f:
+                self._geojson = (str(json_path), mtime, json.load(f))
+        return self._geojson[2]
 
     def csv_to_df(self, fname: str) -> pd.DataFrame:
         return pd.read_csv(fname)
@@ -47,56 +57,54 @@ class SeoulMethod:
 
 
     def _load_gu_boundaries(self, json_path: str):
-        """구 경계 데이터 로드"""
+        """구 경계 데이터 로드 {구명: Polygon/MultiPolygon}"""
         if self.gu_boundaries is None:
-            with open(json_path, 'r', encoding='utf-8') as f:
-                geojson = json.load(f)
-            self.gu_boundaries = {}
-            for feature in geojson['features']:
-                gu_name = feature['properties']['name']
-                coords = feature['geometry']['coordinates'][0]
-                polygon = Polygon(coords)
-                self.gu_boundaries[gu_name] = polygon
+            self.gu_boundaries = load_gu_index(json_path).boundaries
         return self.gu_boundaries
 
     def _geocode_police_station(self, police_name: str):
         """경찰서 이름으로 Geocoding하여 좌표 획득"""
+        return self._geocode_police_stations([police_name]).get(police_name)
+
+    def _geocode_police_stations(self, police_names) -> dict:
+        """경찰서 이름 목록 -> {이름: (lng, lat) 또는 None} (캐시 우선, 나머지는 동시 조회)"""
         if not self.gmaps._api_key:
-            return None
+            return {}
         
-        query = f"서울시 {police_name}"
+        queries = {name: f"서울시 {name}" for name in police_names}
         try:
-            geocode_result = self.gmaps.geocode(query)
+            geocoded = self.gmaps.geocode_many(queries.values())
+        except Exception:
+            return {}
+        coords = {}
+        for name, query in queries.items():
+            geocode_result = geocoded.get(query)
             if geocode_result:
                 location = geocode_result[0]['geometry']['location']
-                return (location['lng'], location['lat'])
-        except Exception:
-            pass
-        return None
+                coords[name] = (location['lng'], location['lat'])
+        return coords
 
     def _find_gu_by_coordinates(self, lng: float, lat: float, json_path: str):
-        """좌표가 속한 구 찾기"""
-        boundaries = self._load_gu_boundaries(json_path)
-        point = Point(lng, lat)
-        
-        for gu_name, polygon in boundaries.items():
-            if polygon.contains(point):
-                return gu_name
-        return None
+        """좌표가 속한 구 찾기 (STRtree 공간 인덱스)"""
+        return load_gu_index(json_path).lookup(lng, lat)
+
+    def find_gu_bulk(self, lngs, lats, json_path: str):
+        """
+        좌표 배열 -> 구명 배열 (속한 구가 없으면 None)
+        사건/CCTV 좌표처럼 점이 많을 때 한 번에 처리
+        """
+        return load_gu_index(json_path).lookup_many(lngs, lats)
 
     def map_police_to_gu(self, crime_df: pd.DataFrame, json_path: str, police_col: str = '관서명'):
         """경찰서를 구로 매핑하여 구명 컬럼 추가"""
         if not self.gmaps._api_key:
             raise ValueError("Kakao Map API 키가 설정되지 않았습니다. KAKAO_MAP_API_KEY 환경변수를 설정하세요.")
         
-        gu_list = []
-        for police_name in crime_df[police_col]:
-            coords = self._geocode_police_station(police_name)
-            if coords:
-                gu_name = self._find_gu_by_coordinates(coords[0], coords[1], json_path)
-                gu_list.append(gu_name if gu_name else None)
-            else:
-                gu_list.append(None)    
+        station_coords = self._geocode_police_stations(crime_df[police_col].dropna().unique())
+        # 좌표가 없는 경찰서는 NaN -> 어느 구에도 속하지 않아 None
+        coords = np.array([station_coords.get(name) or (np.nan, np.nan) for name in crime_df[police_col]],
+                          dtype=float).reshape(-1, 2)
+        gu_list = list(self.find_gu_bulk(coords[:, 0], coords[:, 1], json_path))
         
         crime_df = crime_df.copy()
         crime_df['구명'] = gu_list
@@ -370,7 +378,8 @@ class SeoulMethod:
         
         return buffer
     
-    def create_crime_rate_map(self, crime_rate_df: pd.DataFrame, json_path: str, crime_type: str = '전체') -> str:
+    def create_crime_rate_map(self, crime_rate_df: pd.DataFrame, json_path: str, crime_type: str = '전체',
+                              html_path: str = None) -> str:
         """
         범죄율 Choropleth 지도 생성
         
@@ -378,13 +387,13 @@ class SeoulMethod:
             crime_rate_df: 자치구별 범죄율 DataFrame (인덱스: 자치구명, 컬럼: 범죄 유형별 발생률)
             json_path: 서울시 자치구 GeoJSON 파일 경로
             crime_type: 범죄 유형 ('살인', '강도', '강간', '절도', '폭력', '전체')
+            html_path: 저장할 HTML 경로 (기본: GeoJSON 옆 crime_rate_map_{crime_type}.html)
         
         Returns:
             str: HTML 파일 경로
         """
-        # GeoJSON 파일 로드
-        with open(json_path, 'r', encoding='utf-8') as f:
-            seoul_geo = json.load(f)
+        # GeoJSON 파일 로드 (프로세스 안에서 재사용)
+        seoul_geo = self._load_geojson(json_path)
         
         # 데이터 준비
         df = crime_rate_df.copy()
@@ -428,12 +437,14 @@ class SeoulMethod:
         folium.LayerControl().add_to(m)
         
         # HTML 파일로 저장
-        html_path = Path(json_path).parent / f'crime_rate_map_{crime_type}.html'
+        if html_path is None:
+            html_path = Path(json_path).parent / f'crime_rate_map_{crime_type}.html'
         m.save(str(html_path))
         
         return str(html_path)
     
-    def create_arrest_rate_map(self, arrest_rate_df: pd.DataFrame, json_path: str, crime_type: str = '전체') -> str:
+    def create_arrest_rate_map(self, arrest_rate_df: pd.DataFrame, json_path: str, crime_type: str = '전체',
+                              html_path: str = None) -> str:
         """
         검거율 Choropleth 지도 생성
         
@@ -441,13 +452,13 @@ class SeoulMethod:
             arrest_rate_df: 자치구별 검거율 DataFrame (인덱스: 자치구명, 컬럼: 범죄 유형별 검거율)
             json_path: 서울시 자치구 GeoJSON 파일 경로
             crime_type: 범죄 유형 ('살인', '강도', '강간', '절도', '폭력', '전체')
+            html_path: 저장할 HTML 경로 (기본: GeoJSON 옆 arrest_rate_map_{crime_type}.html)
         
         Returns:
             str: HTML 파일 경로
         """
-        # GeoJSON 파일 로드
-        with open(json_path, 'r', encoding='utf-8') as f:
-            seoul_geo = json.load(f)
+        # GeoJSON 파일 로드 (프로세스 안에서 재사용)
+        seoul_geo = self._load_geojson(json_path)
         
         # 데이터 준비
         df = arrest_rate_df.copy()
@@ -491,7 +502,8 @@ class SeoulMethod:
         folium.LayerControl().add_to(m)
         
         # HTML 파일로 저장
-        html_path = Path(json_path).parent / f'arrest_rate_map_{crime_type}.html'
+        if html_path is None:
+            html_path = Path(json_path).parent / f'arrest_rate_map_{crime_type}.html'
         m.save(str(html_path))
         
         return str(html_path)
@@ -1,12 +1,114 @@
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import StreamingResponse, FileResponse
-from typing import Dict, Any, Optional
-from app.seoul_crime.seoul_service import SeoulService
-from io import BytesIO
+import asyncio
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import FileResponse
+from typing import Dict, Any, List, Optional
+from app.seoul_crime.seoul_service import SeoulService, RENDER_KINDS, render_variants
+from app.seoul_crime import seoul_jobs
+from app.jobs.job_runner import job_runner, QUEUED, RUNNING
+from app.jobs.job_router import job_accepted
+from app.geo.geo_payload import etag_matches
+import logging
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/seoul", tags=["seoul"])
 seoul_service = SeoulService()
 
+# 렌더링 캐시 키 -> 미리 렌더링 중인 작업 id (그 사이 들어온 요청은 같은 작업을 기다림)
+_warm_up_jobs: Dict[str, str] = {}
+
+
+def warm_up_renders(_result: Any = None) -> List[str]:
+    """
+    히트맵 2개 + 지도 12개를 작업 프로세스들에서 미리 렌더링 (전처리 완료 시 호출)
+    - 무거운 히트맵은 각각 별도 작업, 지도는 GeoJSON을 한 번만 읽도록 한 작업으로 묶어 병렬 실행
+    - 결과는 렌더링 캐시에 파일 단위로 원자적으로 저장되고, 키에 데이터 버전이 들어가므로
+      요청은 이전/새 데이터 결과가 섞이지 않음
+    Returns: 제출한 작업 id 목록 (이미 캐시에 있으면 제출하지 않음)
+    """
+    _prune_warm_up_jobs()
+    pending = []
+    for kind, crime_type in render_variants():
+        key, path = seoul_service.get_cached_render(kind, crime_type)
+        if path is None:
+            pending.append((kind, crime_type, key))
+    groups = [[v] for v in pending if not v[0].endswith('_map')]
+    maps = [v for v in pending if v[0].endswith('_map')]
+    if maps:
+        groups.append(maps)
+
+    job_ids = []
+    for group in groups:
+        keys = [key for _, _, key in group]
+        job_id = job_runner.submit(
+            "seoul.render.warm-up", seoul_jobs.render_many_job, [(kind, crime_type) for kind, crime_type, _ in group],
+            on_done=lambda _result, keys=keys: _drop_warm_up_keys(keys)
+        )
+        for key in keys:
+            _warm_up_jobs[key] = job_id
+        job_ids.append(job_id)
+    logger.info(f"렌더링 미리 생성: {len(pending)}개 ({len(job_ids)}개 작업)")
+    return job_ids
+
+
+def _drop_warm_up_keys(keys: List[str]):
+    """미리 렌더링이 끝난 키 정리 (결과는 렌더링 캐시에 있으므로 더 기다릴 작업이 없음)"""
+    for key in keys:
+        _warm_up_jobs.pop(key, None)
+
+
+def _prune_warm_up_jobs():
+    """
+    대기/실행 중이 아닌 작업의 키 정리
+    (실패/취소되어 on_done이 호출되지 않은 작업, 작업 기록이 만료된 경우)
+    """
+    for key, job_id in list(_warm_up_jobs.items()):
+        job = job_runner.get(job_id)
+        if job is None or job["status"] not in (QUEUED, RUNNING):
+            _warm_up_jobs.pop(key, None)
+
+
+async def _wait_warm_up(key: str):
+    """키를 미리 렌더링 중이면 끝날 때까지 기다림 (요청이 끊겨도 작업은 취소하지 않음)"""
+    job_id = _warm_up_jobs.get(key)
+    if job_id is None:
+        return
+    job = job_runner.get(job_id)
+    if job is not None and job["status"] in (QUEUED, RUNNING):
+        try:
+            await asyncio.shield(job_runner.wait(job_id))
+        except Exception:
+            pass
+    _warm_up_jobs.pop(key, None)
+
+
+async def _rendered_response(request: Request, job_name: str, kind: str, media_type: str,
+                             filename: str, crime_type: str = '전체', inline: bool = False) -> Response:
+    """
+    렌더링 결과 응답 (캐시 키를 ETag로 사용)
+    - If-None-Match가 같으면 304 (렌더링/파일 읽기 없음)
+    - 캐시에 있으면 저장된 파일, 미리 렌더링 중이면 그 작업을 기다리고, 없을 때만 작업 프로세스에서 렌더링
+    """
+    etag = seoul_service.render_key(kind, crime_type)
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    path = seoul_service.render_cache.get(etag, RENDER_KINDS[kind])
+    if path is None:
+        await _wait_warm_up(etag)
+        path = seoul_service.render_cache.get(etag, RENDER_KINDS[kind])
+    if path is None:
+        # 작업 프로세스의 데이터 버전 기준 (그 사이 전처리가 끝났으면 새 키)
+        etag, path = await job_runner.run(job_name, seoul_jobs.render_job, kind, crime_type)
+        headers["ETag"] = f'"{etag}"'
+    return FileResponse(
+        path,
+        media_type=media_type,
+        headers=headers,
+        filename=filename,
+        content_disposition_type="inline" if inline else "attachment"
+    )
+
 
 @router.get("/top5", response_model=Dict[str, Any])
 async def get_top5():
@@ -16,12 +118,31 @@ async def get_top5():
 
 @router.get("/preprocess", response_model=Dict[str, Any])
 async def run_preprocess():
-    """데이터 전처리 실행"""
-    return seoul_service.preprocess()
+    """데이터 전처리 실행 (작업 프로세스에서 실행, 이벤트 루프는 막지 않음, 끝나면 히트맵/지도 미리 렌더링)"""
+    return await job_runner.run("seoul.preprocess", seoul_jobs.preprocess_job, on_done=warm_up_renders)
+
+
+@router.post("/jobs/preprocess", response_model=Dict[str, Any], status_code=202)
+async def submit_preprocess_job():
+    """전처리 작업 제출 (상태/결과: /jobs/{job_id}, /jobs/{job_id}/result, 끝나면 히트맵/지도 미리 렌더링)"""
+    return job_accepted(job_runner.submit("seoul.preprocess", seoul_jobs.preprocess_job, on_done=warm_up_renders))
+
+
+@router.post("/jobs/warm-up", response_model=Dict[str, Any], status_code=202)
+async def submit_warm_up_jobs():
+    """
+    히트맵/지도 전체 미리 렌더링 (전처리 없이 배포 직후 등에 사용)
+    이미 캐시에 있는 조합은 건너뜀
+    """
+    try:
+        job_ids = warm_up_renders()
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=f"데이터 파일을 찾을 수 없습니다: {str(e)}")
+    return {"jobs": [job_accepted(job_id) for job_id in job_ids]}
 
 
 @router.get("/heatmap/crime-rate")
-async def get_crime_rate_heatmap():
+async def get_crime_rate_heatmap(request: Request):
     """
     서울시 자치구별 범죄율 히트맵 이미지 반환
     
@@ -29,11 +150,8 @@ async def get_crime_rate_heatmap():
         PNG 이미지 (image/png)
     """
     try:
-        image_bytes = seoul_service.get_crime_rate_heatmap_image()
-        return StreamingResponse(
-            BytesIO(image_bytes),
-            media_type="image/png",
-            headers={"Content-Disposition": "inline; filename=crime_rate_heatmap.png"}
+        return await _rendered_response(
+            request, "seoul.heatmap.crime-rate", "crime_rate_heatmap", "image/png", "crime_rate_heatmap.png", inline=True
         )
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=f"데이터 파일을 찾을 수 없습니다: {str(e)}")
@@ -44,7 +162,7 @@ async def get_crime_rate_heatmap():
 
 
 @router.get("/heatmap/arrest-rate")
-async def get_arrest_rate_heatmap():
+async def get_arrest_rate_heatmap(request: Request):
     """
     서울시 자치구별 범죄 검거율 히트맵 이미지 반환
     
@@ -52,11 +170,8 @@ async def get_arrest_rate_heatmap():
         PNG 이미지 (image/png)
     """
     try:
-        image_bytes = seoul_service.get_arrest_rate_heatmap_image()
-        return StreamingResponse(
-            BytesIO(image_bytes),
-            media_type="image/png",
-            headers={"Content-Disposition": "inline; filename=arrest_rate_heatmap.png"}
+        return await _rendered_response(
+            request, "seoul.heatmap.arrest-rate", "arrest_rate_heatmap", "image/png", "arrest_rate_heatmap.png", inline=True
         )
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=f"데이터 파일을 찾을 수 없습니다: {str(e)}")
@@ -75,7 +190,7 @@ async def get_heatmap_data():
         dict: 범죄율/검거율 데이터와 통계 정보
     """
     try:
-        return seoul_service.get_heatmap_data()
+        return await job_runner.run("seoul.heatmap.data", seoul_jobs.heatmap_data_job)
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=f"데이터 파일을 찾을 수 없습니다: {str(e)}")
     except Exception as e:
@@ -84,6 +199,7 @@ async def get_heatmap_data():
 
 @router.get("/map/crime-rate")
 async def get_crime_rate_map(
+    request: Request,
     crime_type: str = Query('전체', description="범죄 유형 (살인, 강도, 강간, 절도, 폭력, 전체)")
 ):
     """
@@ -108,11 +224,8 @@ async def get_crime_rate_map(
                 detail="crime_type은 '살인', '강도', '강간', '절도', '폭력', '전체' 중 하나여야 합니다."
             )
         
-        html_path = seoul_service.get_crime_rate_map(crime_type)
-        return FileResponse(
-            html_path,
-            media_type="text/html",
-            filename=f"crime_rate_map_{crime_type}.html"
+        return await _rendered_response(
+            request, "seoul.map.crime-rate", "crime_rate_map", "text/html", f"crime_rate_map_{crime_type}.html", crime_type
         )
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=f"데이터 파일을 찾을 수 없습니다: {str(e)}")
@@ -124,6 +237,7 @@ async def get_crime_rate_map(
 
 @router.get("/map/arrest-rate")
 async def get_arrest_rate_map(
+    request: Request,
     crime_type: str = Query('전체', description="범죄 유형 (살인, 강도, 강간, 절도, 폭력, 전체)")
 ):
     """
@@ -148,11 +262,8 @@ async def get_arrest_rate_map(
                 detail="crime_type은 '살인', '강도', '강간', '절도', '폭력', '전체' 중 하나여야 합니다."
             )
         
-        html_path = seoul_service.get_arrest_rate_map(crime_type)
-        return FileResponse(
-            html_path,
-            media_type="text/html",
-            filename=f"arrest_rate_map_{crime_type}.html"
+        return await _rendered_response(
+            request, "seoul.map.arrest-rate", "arrest_rate_map", "text/html", f"arrest_rate_map_{crime_type}.html", crime_type
         )
     except FileNotFoundError as e:
         raise HTTPException(status_code=404, detail=f"데이터 파일을 찾을 수 없습니다: {str(e)}")
@@ -160,3 +271,42 @@ async def get_arrest_rate_map(
         import traceback
         error_detail = f"{str(e)}\n{traceback.format_exc()}"
         raise HTTPException(status_code=500, detail=f"지도 생성 실패: {error_detail}")
+
+
+@router.get("/geo/boundaries")
+async def get_geo_boundaries(request: Request):
+    """
+    서울시 자치구 경계 (클라이언트 지도 렌더링용)
+    
+    지도 HTML 대신 단순화/좌표 축소 GeoJSON만 반환 (gzip/br 압축, ETag)
+    feature.id가 자치구명이므로 `/seoul/geo/values`의 values 키와 바로 매칭됩니다.
+    """
+    try:
+        return seoul_service.get_boundaries_payload().response(request, max_age=3600)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=f"데이터 파일을 찾을 수 없습니다: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"경계 데이터 생성 실패: {str(e)}")
+
+
+@router.get("/geo/values")
+async def get_geo_values(
+    request: Request,
+    metric: str = Query('crime_rate', description="값 종류 (crime_rate: 인구 10만명당 범죄율, arrest_rate: 검거율)")
+):
+    """
+    서울시 자치구별 지도 값 (클라이언트 지도 렌더링용)
+    
+    **반환:**
+    - `columns`: 범죄 유형 (살인, 강도, 강간, 절도, 폭력, 전체)
+    - `values`: {자치구명: columns 순서의 값 배열}
+    - `version`: 데이터 버전 (전처리 후 바뀜)
+    """
+    if metric not in ('crime_rate', 'arrest_rate'):
+        raise HTTPException(status_code=400, detail="metric은 'crime_rate', 'arrest_rate' 중 하나여야 합니다.")
+    try:
+        return seoul_service.get_map_values_payload(metric).response(request)
+    except FileNotFoundError as e:
+        raise HTTPException(status_code=404, detail=f"데이터 파일을 찾을 수 없습니다: {str(e)}")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"데이터 로드 실패: {str(e)}")
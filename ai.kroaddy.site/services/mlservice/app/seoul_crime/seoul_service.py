@@ -1,16 +1,40 @@
 import pandas as pd
 import numpy as np
+import hashlib
+from io import BytesIO
 from pathlib import Path
-from typing import Dict, Any
-from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
 import os
 from app.seoul_crime.seoul_method import SeoulMethod
 from app.seoul_crime.seoul_data import SeoulData
 from app.seoul_crime.kakao_map_singleton import KakaoMapSingleton
+from app.seoul_crime.render_cache import RenderCache
+from app.geo.geo_payload import CompressedPayload, compact_geojson
+import json
 import logging
 
 logger = logging.getLogger(__name__)
 
+# 렌더링 종류 -> 파일 확장자
+RENDER_KINDS = {
+    'crime_rate_heatmap': 'png',
+    'arrest_rate_heatmap': 'png',
+    'crime_rate_map': 'html',
+    'arrest_rate_map': 'html',
+}
+# 지도 crime_type 값
+CRIME_TYPES = ['살인', '강도', '강간', '절도', '폭력', '전체']
+# 클라이언트 지도용 경계 단순화 허용 오차(도, 약 50m)와 좌표 소수점 자릿수(약 10m)
+GEO_TOLERANCE = 0.0005
+GEO_PRECISION = 4
+
+
+def render_variants():
+    """미리 렌더링할 전체 조합 [(kind, crime_type)] (히트맵 2개 + 범죄율/검거율 지도 12개)"""
+    heatmaps = [('crime_rate_heatmap', '전체'), ('arrest_rate_heatmap', '전체')]
+    maps = [(kind, crime_type) for kind in ('crime_rate_map', 'arrest_rate_map') for crime_type in CRIME_TYPES]
+    return heatmaps + maps
+
 class SeoulService:
     """서울 데이터 처리 및 ML 서비스"""
     
@@ -20,6 +44,14 @@ class SeoulService:
        # save 폴더 경로 설정
        self.save_dir = Path(self.data.sname)
        os.makedirs(self.save_dir, exist_ok=True)  # save 폴더가 없으면 생성
+       # prepare_heatmap_data 결과 (save/crime.csv 내용 해시 기준, 워커 프로세스마다 하나)
+       self._heatmap_cache: Optional[Tuple[str, Dict[str, Any]]] = None
+       self._crime_digest: Optional[Tuple[Tuple[int, int], str]] = None
+       # 히트맵 PNG / 지도 HTML (작업 프로세스들이 디스크를 공유)
+       self.render_cache = RenderCache()
+       # 클라이언트 지도용 응답 본문 (경계: GeoJSON mtime 기준, 값: (metric, 데이터 버전) 기준)
+       self._boundaries_payload: Optional[Tuple[int, CompressedPayload]] = None
+       self._values_payloads: Dict[str, Tuple[str, CompressedPayload]] = {}
 
     def get_top5(self):
         """각 데이터의 상위 5개 반환"""
@@ -66,8 +98,10 @@ class SeoulService:
         station_names = ['서울' + str(name[:-1]) + '경찰서' for name in crime['관서명']]
         station_addrs = []
         
+        # 캐시에 없는 경찰서만 동시에 조회 (다시 전처리하면 API 호출 없음)
+        geocoded = gmaps.geocode_many(station_names, language='ko')
         for name in station_names:
-            tmp = gmaps.geocode(name, language='ko')
+            tmp = geocoded.get(name)
             if tmp and len(tmp) > 0:
                 addr = tmp[0].get("formatted_address")
                 location = tmp[0].get("geometry", {}).get("location", {})
@@ -160,7 +194,11 @@ class SeoulService:
         # 정제화된 데이터를 save 폴더에 crime.csv로 저장
         save_path = Path(self.data.sname) / 'crime.csv'
         save_path.parent.mkdir(parents=True, exist_ok=True)
-        final_merged.to_csv(save_path, index=False, encoding='utf-8-sig')
+        # 다른 워커가 읽는 중일 수 있으므로 임시 파일에 쓴 뒤 교체
+        tmp_path = save_path.with_suffix('.csv.tmp')
+        final_merged.to_csv(tmp_path, index=False, encoding='utf-8-sig')
+        os.replace(tmp_path, save_path)
+        self.invalidate_heatmap_cache()
         print(f"✓ 정제화된 데이터가 저장되었습니다: {save_path}")
         logger.info(f"정제화된 데이터 저장 완료: {save_path}")
 
@@ -175,7 +213,8 @@ class SeoulService:
                 "merged_columns": len(final_merged.columns),
                 "crime_merged": crime_merged,
                 "crime_mapped_count": crime_mapped_count,
-                "saved_path": str(save_path)
+                "saved_path": str(save_path),
+                "geocode": gmaps.stats()
             },
             "merged_data": final_merged.replace({np.nan: None}).to_dict(orient='records')
         }
@@ -194,18 +233,39 @@ class SeoulService:
         # NaN을 0으로 변환 후 float로 변환
         return pd.to_numeric(cleaned, errors='coerce').fillna(0).astype(float)
     
+    def invalidate_heatmap_cache(self):
+        """전처리 후 호출 (다른 워커 프로세스는 파일 변경으로 다시 계산)"""
+        self._heatmap_cache = None
+        self._crime_digest = None
+
+    def _crime_data_version(self, crime_path: Path) -> Tuple[str, Optional[bytes]]:
+        """
+        save/crime.csv 내용 해시
+        파일이 바뀌지 않았으면(mtime, 크기) 저장된 해시 사용, 바뀌었으면 읽은 내용도 함께 반환
+        """
+        stat = crime_path.stat()
+        stat_key = (stat.st_mtime_ns, stat.st_size)
+        if self._crime_digest is not None and self._crime_digest[0] == stat_key:
+            return self._crime_digest[1], None
+        raw = crime_path.read_bytes()
+        digest = hashlib.sha256(raw).hexdigest()[:16]
+        self._crime_digest = (stat_key, digest)
+        return digest, raw
+
     def prepare_heatmap_data(self):
         """
         히트맵 생성을 위한 데이터 전처리
         - 자치구별 집계 (관서별 → 자치구별)
         - 범죄율 계산 (인구 10만명당)
         - 검거율 계산
+        crime.csv 내용이 같으면 계산 결과를 재사용 (반환된 DataFrame은 수정하지 말 것)
         
         Returns:
             dict: {
                 'crime_rate_df': DataFrame (자치구별 범죄율),
                 'arrest_rate_df': DataFrame (자치구별 검거율),
-                'summary': dict (통계 정보)
+                'summary': dict (통계 정보),
+                'version': str (crime.csv 내용 해시)
             }
         """
         # save/crime.csv 파일 읽기
@@ -213,8 +273,20 @@ class SeoulService:
         if not crime_path.exists():
             raise FileNotFoundError(f"crime.csv 파일을 찾을 수 없습니다: {crime_path}")
         
-        df = self.method.csv_to_df(str(crime_path))
-        
+        version, raw = self._crime_data_version(crime_path)
+        if self._heatmap_cache is not None and self._heatmap_cache[0] == version:
+            return self._heatmap_cache[1]
+        
+        if raw is None:
+            raw = crime_path.read_bytes()
+        heatmap_data = self._build_heatmap_data(pd.read_csv(BytesIO(raw)))
+        heatmap_data['version'] = version
+        self._heatmap_cache = (version, heatmap_data)
+        logger.info(f"히트맵 데이터 계산 완료 (version={version})")
+        return heatmap_data
+
+    def _build_heatmap_data(self, df: pd.DataFrame) -> Dict[str, Any]:
+        """정제된 crime.csv DataFrame -> 자치구별 범죄율/검거율, 통계"""
         # 숫자 컬럼 정리 (쉼표 제거)
         crime_cols = ['CRIME_살인 발생', 'CRIME_살인 검거', 'CRIME_강도 발생', 'CRIME_강도 검거',
                      'CRIME_강간 발생', 'CRIME_강간 검거', 'CRIME_절도 발생', 'CRIME_절도 검거',
@@ -311,6 +383,76 @@ class SeoulService:
             'summary': summary
         }
     
+    def render_key(self, kind: str, crime_type: str = '전체') -> str:
+        """
+        렌더링 결과 캐시 키 (ETag로 사용, 렌더링하지 않고 crime.csv 해시만 확인)
+        
+        Args:
+            kind: RENDER_KINDS 중 하나
+            crime_type: 범죄 유형 (지도만 사용)
+        """
+        crime_path = Path(self.data.sname) / 'crime.csv'
+        if not crime_path.exists():
+            raise FileNotFoundError(f"crime.csv 파일을 찾을 수 없습니다: {crime_path}")
+        version, _ = self._crime_data_version(crime_path)
+        return self.render_cache.key(version, kind, self._render_params(kind, crime_type))
+
+    def get_cached_render(self, kind: str, crime_type: str = '전체') -> Tuple[str, Optional[Path]]:
+        """(캐시 키, 캐시 파일 경로 또는 None)"""
+        key = self.render_key(kind, crime_type)
+        return key, self.render_cache.get(key, RENDER_KINDS[kind])
+
+    def render(self, kind: str, crime_type: str = '전체') -> Tuple[str, str]:
+        """
+        히트맵/지도 렌더링 (같은 데이터/파라미터면 캐시 파일 재사용)
+        
+        Returns:
+            (캐시 키, 파일 경로)
+        """
+        if kind not in RENDER_KINDS:
+            raise ValueError(f"지원하지 않는 렌더링 종류: {kind}")
+        heatmap_data = self.prepare_heatmap_data()
+        key = self.render_cache.key(heatmap_data['version'], kind, self._render_params(kind, crime_type))
+        path = self.render_cache.get_or_create(
+            key, RENDER_KINDS[kind],
+            lambda tmp_path: self._render_to(kind, crime_type, heatmap_data, tmp_path)
+        )
+        return key, str(path)
+
+    def render_many(self, variants) -> List[Dict[str, Any]]:
+        """
+        여러 조합을 한 프로세스에서 렌더링 (히트맵 데이터/GeoJSON은 한 번만 로드)
+        실패한 조합은 error만 기록하고 나머지는 계속 진행
+        """
+        results = []
+        for kind, crime_type in variants:
+            try:
+                key, path = self.render(kind, crime_type)
+                results.append({'kind': kind, 'crime_type': crime_type, 'key': key, 'path': path})
+            except Exception as e:
+                logger.warning(f"{kind} 렌더링 실패 (crime_type={crime_type}): {str(e)}")
+                results.append({'kind': kind, 'crime_type': crime_type, 'error': str(e)})
+        return results
+
+    def _render_params(self, kind: str, crime_type: str) -> Dict[str, Any]:
+        if not kind.endswith('_map'):
+            return {}
+        # 지도는 GeoJSON도 결과에 포함되므로 파일이 바뀌면 다시 렌더링
+        json_stat = (Path(self.data.dname) / 'kr-state.json').stat()
+        return {'crime_type': crime_type, 'geojson': [json_stat.st_mtime_ns, json_stat.st_size]}
+
+    def _render_to(self, kind: str, crime_type: str, heatmap_data: Dict[str, Any], path: Path):
+        json_path = Path(self.data.dname) / 'kr-state.json'
+        if kind == 'crime_rate_heatmap':
+            path.write_bytes(self.method.create_crime_rate_heatmap(heatmap_data['crime_rate_df']).getvalue())
+        elif kind == 'arrest_rate_heatmap':
+            path.write_bytes(self.method.create_arrest_rate_heatmap(heatmap_data['arrest_rate_df']).getvalue())
+        elif kind == 'crime_rate_map':
+            self.method.create_crime_rate_map(heatmap_data['crime_rate_df'], str(json_path), crime_type, str(path))
+        else:
+            self.method.create_arrest_rate_map(heatmap_data['arrest_rate_df'], str(json_path), crime_type, str(path))
+        logger.info(f"{kind} 렌더링 완료 (crime_type={crime_type})")
+
     def get_crime_rate_heatmap_image(self) -> bytes:
         """
         범죄율 히트맵 이미지 생성 및 반환
@@ -318,20 +460,8 @@ class SeoulService:
         Returns:
             bytes: PNG 이미지 바이너리 데이터
         """
-        heatmap_data = self.prepare_heatmap_data()
-        buffer = self.method.create_crime_rate_heatmap(heatmap_data['crime_rate_df'])
-        # buffer.seek(0)이 이미 seoul_method.py에서 호출됨
-        image_bytes = buffer.read()
-        
-        # save 폴더에 저장
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"crime_rate_heatmap_{timestamp}.png"
-        save_filepath = self.save_dir / filename
-        with open(save_filepath, 'wb') as f:
-            f.write(image_bytes)
-        logger.info(f"범죄율 히트맵 저장 완료: {save_filepath}")
-        
-        return image_bytes
+        _, path = self.render('crime_rate_heatmap')
+        return Path(path).read_bytes()
     
     def get_arrest_rate_heatmap_image(self) -> bytes:
         """
@@ -340,20 +470,8 @@ class SeoulService:
         Returns:
             bytes: PNG 이미지 바이너리 데이터
         """
-        heatmap_data = self.prepare_heatmap_data()
-        buffer = self.method.create_arrest_rate_heatmap(heatmap_data['arrest_rate_df'])
-        # buffer.seek(0)이 이미 seoul_method.py에서 호출됨
-        image_bytes = buffer.read()
-        
-        # save 폴더에 저장
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"arrest_rate_heatmap_{timestamp}.png"
-        save_filepath = self.save_dir / filename
-        with open(save_filepath, 'wb') as f:
-            f.write(image_bytes)
-        logger.info(f"검거율 히트맵 저장 완료: {save_filepath}")
-        
-        return image_bytes
+        _, path = self.render('arrest_rate_heatmap')
+        return Path(path).read_bytes()
     
     def get_heatmap_data(self) -> Dict[str, Any]:
         """
@@ -368,9 +486,65 @@ class SeoulService:
             'status': 'success',
             'crime_rate': heatmap_data['crime_rate_df'].to_dict(orient='index'),
             'arrest_rate': heatmap_data['arrest_rate_df'].to_dict(orient='index'),
-            'summary': heatmap_data['summary']
+            'summary': heatmap_data['summary'],
+            'version': heatmap_data['version']
         }
     
+    def get_boundaries_payload(self) -> CompressedPayload:
+        """
+        자치구 경계 (단순화/좌표 축소 GeoJSON, 속성은 name만, feature.id = 자치구명)
+        지도 HTML 대신 클라이언트가 직접 그릴 때 사용 (값은 get_map_values_payload)
+        """
+        json_path = Path(self.data.dname) / 'kr-state.json'
+        mtime = json_path.stat().st_mtime_ns
+        if self._boundaries_payload is None or self._boundaries_payload[0] != mtime:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                geojson = json.load(f)
+            payload = CompressedPayload.from_json(compact_geojson(geojson, GEO_TOLERANCE, GEO_PRECISION))
+            self._boundaries_payload = (mtime, payload)
+            logger.info(f"자치구 경계 응답 생성: {payload.sizes()}")
+        return self._boundaries_payload[1]
+
+    def get_map_values(self, metric: str = 'crime_rate') -> Dict[str, Any]:
+        """
+        자치구별 지도 값 (crime_type 순서의 배열, 지도와 같은 '전체' 포함)
+        
+        Args:
+            metric: 'crime_rate' (인구 10만명당 발생률, 전체=합계) 또는 'arrest_rate' (검거율 %, 전체=평균)
+        """
+        if metric not in ('crime_rate', 'arrest_rate'):
+            raise ValueError(f"지원하지 않는 metric: {metric}")
+        heatmap_data = self.prepare_heatmap_data()
+        df = heatmap_data[f'{metric}_df']
+        suffix = '발생률' if metric == 'crime_rate' else '검거율'
+        df = df.rename(columns={col: col[:-len(suffix)] for col in df.columns if col.endswith(suffix)})
+        rate_cols = [col for col in CRIME_TYPES if col in df.columns]
+        df = df[rate_cols].copy()
+        df['전체'] = df[rate_cols].sum(axis=1) if metric == 'crime_rate' else df[rate_cols].mean(axis=1)
+        df = df.round(1).replace([np.inf, -np.inf], np.nan)
+        df = df.astype(object).where(df.notna(), None)
+        return {
+            'version': heatmap_data['version'],
+            'metric': metric,
+            'unit': '인구 10만명당' if metric == 'crime_rate' else '%',
+            'key_on': 'feature.id',
+            'columns': list(df.columns),
+            'values': {gu: list(row) for gu, row in zip(df.index, df.itertuples(index=False))}
+        }
+
+    def get_map_values_payload(self, metric: str = 'crime_rate') -> CompressedPayload:
+        """get_map_values 응답 본문 (데이터 버전이 같으면 재사용)"""
+        crime_path = Path(self.data.sname) / 'crime.csv'
+        if not crime_path.exists():
+            raise FileNotFoundError(f"crime.csv 파일을 찾을 수 없습니다: {crime_path}")
+        version, _ = self._crime_data_version(crime_path)
+        cached = self._values_payloads.get(metric)
+        if cached is None or cached[0] != version:
+            values = self.get_map_values(metric)
+            cached = (values['version'], CompressedPayload.from_json(values))
+            self._values_payloads[metric] = cached
+        return cached[1]
+
     def get_crime_rate_map(self, crime_type: str = '전체') -> str:
         """
         범죄율 Choropleth 지도 생성 및 저장
@@ -381,25 +555,8 @@ class SeoulService:
         Returns:
             str: HTML 파일 경로
         """
-        heatmap_data = self.prepare_heatmap_data()
-        json_path = Path(self.data.dname) / 'kr-state.json'
-        
-        html_path = self.method.create_crime_rate_map(
-            heatmap_data['crime_rate_df'],
-            str(json_path),
-            crime_type
-        )
-        
-        # save 폴더로 복사
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        save_filename = f"crime_rate_map_{crime_type}_{timestamp}.html"
-        save_filepath = self.save_dir / save_filename
-        
-        import shutil
-        shutil.copy(html_path, save_filepath)
-        logger.info(f"범죄율 지도 저장 완료: {save_filepath}")
-        
-        return str(save_filepath)
+        _, path = self.render('crime_rate_map', crime_type)
+        return path
     
     def get_arrest_rate_map(self, crime_type: str = '전체') -> str:
         """
@@ -411,22 +568,5 @@ class SeoulService:
         Returns:
             str: HTML 파일 경로
         """
-        heatmap_data = self.prepare_heatmap_data()
-        json_path = Path(self.data.dname) / 'kr-state.json'
-        
-        html_path = self.method.create_arrest_rate_map(
-            heatmap_data['arrest_rate_df'],
-            str(json_path),
-            crime_type
-        )
-        
-        # save 폴더로 복사
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        save_filename = f"arrest_rate_map_{crime_type}_{timestamp}.html"
-        save_filepath = self.save_dir / save_filename
-        
-        import shutil
-        shutil.copy(html_path, save_filepath)
-        logger.info(f"검거율 지도 저장 완료: {save_filepath}")
-        
-        return str(save_filepath)
\ No newline at end of file
+        _, path = self.render('arrest_rate_map', crime_type)
+        return path
@@ -0,0 +1,168 @@
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import joblib
+import pandas as pd
+
+from app.titanic.titanic_registry import file_digest
+from app.titanic.titanic_transformer import PREPROCESS_VERSION
+
+# 로깅 설정
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+    from common.utils import setup_logging
+    logger = setup_logging("titanic_cache")
+except ImportError:
+    import logging
+    logger = logging.getLogger("titanic_cache")
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+# pyarrow가 있으면 Parquet(컬럼 기반), 없으면 pickle로 저장
+try:
+    import pyarrow  # noqa: F401
+    FRAME_FORMAT = "parquet"
+except ImportError:
+    FRAME_FORMAT = "pickle"
+
+
+CACHE_DIR = Path(os.environ.get("TITANIC_CACHE_DIR", Path(__file__).parent / "cache"))
+FRAMES = ("train", "test", "label")
+
+
+def _write_frame(df: pd.DataFrame, path: Path):
+    if FRAME_FORMAT == "parquet":
+        df.to_parquet(path, index=True)
+    else:
+        df.to_pickle(path)
+
+
+def _read_frame(path: Path) -> pd.DataFrame:
+    if FRAME_FORMAT == "parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+class PreprocessCache:
+    """
+    전처리 결과 캐시 (cache/preprocess_<key>/)
+    - 키: 입력 CSV 내용 해시 + PREPROCESS_VERSION + 전처리 설정
+    - 입력 해시는 (경로, mtime, 크기)가 같으면 다시 계산하지 않음 (파일 stat만 확인)
+    - train/test/label은 Parquet, 학습된 변환기는 joblib, 나머지 메타데이터는 meta.json
+    - 진단 정보(diagnostics.json)는 요청된 경우에만 만들어 같은 항목에 추가 저장
+    """
+
+    def __init__(self, cache_dir: Path = CACHE_DIR):
+        self.cache_dir = Path(cache_dir)
+        self._lock = threading.Lock()
+        self._digests: Dict[Tuple, str] = {}
+
+    def data_digest(self, paths: List[Path]) -> str:
+        """입력 파일 내용 해시 (파일이 바뀌지 않았으면 메모리에 있는 값 사용)"""
+        stat_key = tuple((str(p), p.stat().st_mtime_ns, p.stat().st_size) for p in paths)
+        with self._lock:
+            digest = self._digests.get(stat_key)
+        if digest is None:
+            digest = file_digest(paths)
+            with self._lock:
+                self._digests[stat_key] = digest
+        return digest
+
+    def key(self, data_digest: str, config: Dict[str, Any]) -> str:
+        h = hashlib.sha256()
+        h.update(data_digest.encode())
+        h.update(PREPROCESS_VERSION.encode())
+        h.update(json.dumps(config, sort_keys=True, default=str).encode())
+        return h.hexdigest()[:16]
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"preprocess_{key}"
+
+    def _frame_path(self, key: str, name: str) -> Path:
+        return self._path(key) / f"{name}.{FRAME_FORMAT}"
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        캐시 항목 로드
+        Returns: {"train", "test", "label", "transformer", "meta"} (없거나 손상되었으면 None)
+        """
+        path = self._path(key)
+        if not (path / "meta.json").exists():
+            return None
+        try:
+            with open(path / "meta.json", "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            entry = {name: _read_frame(self._frame_path(key, name)) for name in FRAMES}
+            entry["label"] = entry["label"].iloc[:, 0]
+            entry["transformer"] = joblib.load(path / "transformer.joblib")
+            entry["meta"] = meta
+        except Exception as e:
+            logger.warning(f"전처리 캐시 로드 실패 ({path.name}): {str(e)}")
+            return None
+        return entry
+
+    def save(self, key: str, train: pd.DataFrame, test: pd.DataFrame, label: pd.Series,
+             transformer: Any, meta: Dict[str, Any]) -> Path:
+        """임시 디렉터리에 모두 쓴 뒤 rename (동시에 저장해도 완성된 항목만 보임)"""
+        def write_frames(tmp_dir: Path):
+            _write_frame(train, tmp_dir / f"train.{FRAME_FORMAT}")
+            _write_frame(test, tmp_dir / f"test.{FRAME_FORMAT}")
+            _write_frame(label.to_frame(), tmp_dir / f"label.{FRAME_FORMAT}")
+            return transformer, meta
+        return self.save_with(key, write_frames)
+
+    def save_with(self, key: str, write_frames: Callable[[Path], Tuple[Any, Dict[str, Any]]]) -> Path:
+        """
+        write_frames(임시 디렉터리)가 train/test/label 파일을 직접 기록하고 (변환기, 메타데이터)를 반환
+        스트리밍 전처리는 이 방식으로 Parquet를 청크 단위로 바로 캐시에 기록
+        """
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._path(key)
+        tmp_dir = Path(tempfile.mkdtemp(dir=self.cache_dir, prefix=f".{path.name}."))
+        try:
+            transformer, meta = write_frames(tmp_dir)
+            joblib.dump(transformer, tmp_dir / "transformer.joblib")
+            with open(tmp_dir / "meta.json", "w", encoding="utf-8") as f:
+                json.dump(meta, f, ensure_ascii=False, indent=2, default=str)
+            os.rename(tmp_dir, path)
+            logger.info(f"✅ 전처리 캐시 저장: {path.name} ({FRAME_FORMAT})")
+        except OSError:
+            # 다른 요청이 같은 키를 먼저 저장한 경우
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+        except BaseException:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+            raise
+        return path
+
+    def load_diagnostics(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key) / "diagnostics.json"
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save_diagnostics(self, key: str, diagnostics: Dict[str, Any]):
+        path = self._path(key)
+        if not path.exists():
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=path, prefix=".diagnostics.json.")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(diagnostics, f, ensure_ascii=False, default=str)
+        os.replace(tmp_path, path / "diagnostics.json")
+
+    def clear(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
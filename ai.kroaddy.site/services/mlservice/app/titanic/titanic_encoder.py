@@ -0,0 +1,103 @@
+import re
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from app.titanic.titanic_transformer import FEATURE_COLUMNS, TITLE_PATTERN, bin_index
+
+TITLE_REGEX = re.compile(TITLE_PATTERN)
+
+
+def _field(record: Dict[str, Any], *names: str) -> Any:
+    """alias(Sex)와 필드명(sex) 모두 허용"""
+    for name in names:
+        if name in record:
+            return record[name]
+    return None
+
+
+class PassengerEncoder:
+    """
+    학습된 전처리 파라미터(TitanicTransformer.fitted_params_)로 승객 레코드를 특성 벡터로 변환
+    - TitanicTransformer.transform과 같은 결과를 pandas DataFrame 없이 dict → NumPy 배열로 바로 변환 (온라인 추론용)
+    - 여러 건은 컬럼 단위 NumPy 연산으로 한 번에 처리
+    - 구간화는 pd.cut(include_lowest=True)과 같은 결과가 되도록 searchsorted 사용,
+      학습 구간 밖의 값은 가장 가까운 구간으로 보냄
+    """
+
+    def __init__(self, params: Dict[str, Any], feature_columns: Optional[Sequence[str]] = None):
+        self.params = params
+        self.feature_columns = list(feature_columns or FEATURE_COLUMNS)
+        self.fare_bins = np.asarray(params["fare_bins"], dtype=float)
+        self.age_bins = np.asarray(params["age_bins"], dtype=float)
+        self.fare_median = float(params["fare_median"])
+        self.age_median = float(params["age_median"])
+        self.embarked_mapping = params["embarked_mapping"]
+        self.embarked_default = self.embarked_mapping[params["embarked_mode"]]
+        self.gender_mapping = params["gender_mapping"]
+
+        # 원래 타이틀 -> 최종 코드 (Miss→Ms, royal→Royal, rare→Rare 적용 후 title_mapping)
+        title_mapping = params["title_mapping"]
+        self.title_default = title_mapping.get('Rare', 6)
+        self.title_codes = dict(title_mapping)
+        self.title_codes['Miss'] = title_mapping['Ms']
+        for title in params.get("royal_titles", []):
+            self.title_codes[title] = title_mapping['Royal']
+        for title in params.get("rare_titles", []):
+            self.title_codes[title] = self.title_default
+
+        self._column_index = {name: i for i, name in enumerate(self.feature_columns)}
+
+    def _title_code(self, name: Optional[str]) -> int:
+        match = TITLE_REGEX.search(name or "")
+        if not match:
+            return self.title_default
+        return self.title_codes.get(match.group(1), self.title_default)
+
+    def transform(self, records: List[Dict[str, Any]]) -> np.ndarray:
+        """승객 레코드 목록 -> (n, 특성 수) 배열"""
+        n = len(records)
+        pclass = np.fromiter((int(_field(r, 'Pclass', 'pclass')) for r in records), dtype=float, count=n)
+        fare = np.array([_field(r, 'Fare', 'fare') for r in records], dtype=float)
+        age = np.array([_field(r, 'Age', 'age') for r in records], dtype=float)
+        fare = np.where(np.isnan(fare), self.fare_median, fare)
+        age = np.where(np.isnan(age), self.age_median, age)
+
+        embarked = np.fromiter(
+            (self.embarked_mapping.get(_field(r, 'Embarked', 'embarked'), self.embarked_default) for r in records),
+            dtype=float, count=n
+        )
+        gender = np.fromiter(
+            (self.gender_mapping[_field(r, 'Sex', 'sex', 'Gender', 'gender')] for r in records),
+            dtype=float, count=n
+        )
+        title = np.fromiter((self._title_code(_field(r, 'Name', 'name')) for r in records), dtype=float, count=n)
+
+        columns = {
+            'Pclass': pclass,
+            'Fare': bin_index(fare, self.fare_bins),
+            'Embarked_encoded': embarked,
+            'Gender_encoded': gender,
+            'Age_encoded': bin_index(age, self.age_bins),
+            'Title_encoded': title,
+        }
+        X = np.empty((n, len(self.feature_columns)), dtype=float)
+        for name, i in self._column_index.items():
+            X[:, i] = columns[name]
+        return X
+
+    def transform_one(self, record: Dict[str, Any]) -> np.ndarray:
+        """승객 1명 -> (1, 특성 수) 배열 (NumPy 벡터 연산 없이 스칼라 계산)"""
+        fare = _field(record, 'Fare', 'fare')
+        age = _field(record, 'Age', 'age')
+        fare = self.fare_median if fare is None else float(fare)
+        age = self.age_median if age is None else float(age)
+        values = {
+            'Pclass': int(_field(record, 'Pclass', 'pclass')),
+            'Fare': int(bin_index(fare, self.fare_bins)),
+            'Embarked_encoded': self.embarked_mapping.get(_field(record, 'Embarked', 'embarked'), self.embarked_default),
+            'Gender_encoded': self.gender_mapping[_field(record, 'Sex', 'sex', 'Gender', 'gender')],
+            'Age_encoded': int(bin_index(age, self.age_bins)),
+            'Title_encoded': self._title_code(_field(record, 'Name', 'name')),
+        }
+        return np.array([[values[name] for name in self.feature_columns]], dtype=float)
@@ -0,0 +1,52 @@
+"""
+작업 프로세스에서 실행되는 타이타닉 파이프라인 (app.jobs.job_runner에서 호출)
+
+전처리 결과(cache/)와 학습된 모델(models/)은 디스크에 저장되므로
+서버 프로세스는 작업이 끝난 뒤 저장된 모델을 다시 로드하기만 하면 됩니다.
+"""
+from typing import Any, Dict, List, Optional
+
+from app.titanic.titanic_service import TitanicService
+from app.titanic.titanic_tuning import default_tuner
+
+# 워커 프로세스마다 하나 (교차검증 fold 캐시, 전처리 결과를 작업 간에 재사용)
+_service: Optional[TitanicService] = None
+
+
+def _worker_service() -> TitanicService:
+    global _service
+    if _service is None:
+        _service = TitanicService()
+    return _service
+
+
+def preprocess_job(diagnostics: bool = False, streaming: Optional[bool] = None) -> Dict[str, Any]:
+    result = _worker_service().preprocess(diagnostics=diagnostics, streaming=streaming)
+    if result.get("status") == "error":
+        raise RuntimeError(result.get("message", "전처리 실패"))
+    return result
+
+
+def evaluate_job() -> Dict[str, Any]:
+    """전처리 → 모델 생성 → 학습 → 평가 (GET /titanic/evaluate와 같은 응답)"""
+    service = _worker_service()
+    preprocess_result = preprocess_job()
+    service.modeling()
+    service.learning()
+    evaluate_result = service.evaluate()
+    if evaluate_result is None:
+        raise RuntimeError("모델 평가 실패")
+    return {
+        "status": "success",
+        "message": "모델 평가 완료",
+        "preprocessing": preprocess_result,
+        "evaluation": evaluate_result
+    }
+
+
+def tuning_job(search_id: str, strategy: str, model_names: Optional[List[str]], n_iter: int, factor: int) -> Dict[str, Any]:
+    """하이퍼파라미터 탐색 (진행 상황은 tuning/searches/<search_id>.json에 기록)"""
+    service = _worker_service()
+    preprocess_job()
+    X, y = service._training_data()
+    return default_tuner().search(X, y, search_id, strategy=strategy, model_names=model_names, n_iter=n_iter, factor=factor)
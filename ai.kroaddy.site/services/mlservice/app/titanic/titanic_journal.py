@@ -0,0 +1,155 @@
+import json
+import os
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+# 로깅 설정
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+    from common.utils import setup_logging
+    logger = setup_logging("titanic_journal")
+except ImportError:
+    import logging
+    logger = logging.getLogger("titanic_journal")
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+
+# docker-compose에서 볼륨으로 마운트되는 디렉터리 (재시작해도 유지)
+STORE_DIR = Path(os.environ.get("TITANIC_STORE_DIR", Path(__file__).parent / "store"))
+SNAPSHOT_FILE = "snapshot.json"
+JOURNAL_FILE = "journal.jsonl"
+# 저널이 이 개수만큼 쌓이면 스냅샷으로 압축
+COMPACT_EVERY = int(os.environ.get("TITANIC_STORE_COMPACT_EVERY", "1000"))
+# 기록마다 fsync (false면 OS 버퍼에 맡겨 더 빠르지만 전원 장애 시 마지막 기록이 유실될 수 있음)
+FSYNC = os.environ.get("TITANIC_STORE_FSYNC", "true").lower() == "true"
+
+
+class PassengerJournal:
+    """
+    승객 변경 로그 (write-ahead log + 스냅샷)
+    - journal.jsonl : 변경 한 건당 한 줄 {"seq", "op": "put"|"delete"|"clear", "id", "record"} 추가 기록 (O(1))
+    - snapshot.json : 압축 시점의 전체 레코드와 마지막 seq (임시 파일 → rename으로 원자적 교체)
+    - 시작 시 스냅샷(없으면 train.csv)을 읽고 seq가 더 큰 로그만 재생
+    - 기록 도중 종료되어 잘린 마지막 줄은 재생 시 버림
+    """
+
+    def __init__(self, store_dir: Path = STORE_DIR, compact_every: int = COMPACT_EVERY, fsync: bool = FSYNC):
+        self.store_dir = Path(store_dir)
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self._lock = threading.Lock()
+        self._file = None
+        self._seq = 0
+        self._pending = 0  # 마지막 스냅샷 이후 기록 수
+
+    @property
+    def snapshot_path(self) -> Path:
+        return self.store_dir / SNAPSHOT_FILE
+
+    @property
+    def journal_path(self) -> Path:
+        return self.store_dir / JOURNAL_FILE
+
+    # ==================== 복구 ====================
+
+    def load_snapshot(self) -> Optional[List[Dict[str, Any]]]:
+        """스냅샷 레코드 (스냅샷이 없으면 None → 호출 측에서 train.csv 사용)"""
+        if not self.snapshot_path.exists():
+            return None
+        with open(self.snapshot_path, "r", encoding="utf-8") as f:
+            snapshot = json.load(f)
+        self._seq = snapshot.get("seq", 0)
+        return snapshot["records"]
+
+    def replay(self) -> Iterator[Dict[str, Any]]:
+        """스냅샷 이후의 변경 기록 (잘린 마지막 줄은 잘라내고 중단)"""
+        if not self.journal_path.exists():
+            return
+        snapshot_seq = self._seq
+        good_offset = 0
+        with open(self.journal_path, "rb") as f:
+            for line in f:
+                try:
+                    if not line.endswith(b"\n"):
+                        raise ValueError("incomplete line")
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning(f"저널 마지막 기록이 손상되어 무시합니다 (offset {good_offset})")
+                    break
+                good_offset += len(line)
+                if entry["seq"] <= snapshot_seq:
+                    continue
+                self._seq = entry["seq"]
+                self._pending += 1
+                yield entry
+        if good_offset < self.journal_path.stat().st_size:
+            with open(self.journal_path, "r+b") as f:
+                f.truncate(good_offset)
+
+    # ==================== 기록 ====================
+
+    def _open(self):
+        if self._file is None:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.journal_path, "a", encoding="utf-8")
+        return self._file
+
+    def append(self, op: str, passenger_id: Optional[int] = None, record: Optional[Dict[str, Any]] = None) -> int:
+        """변경 한 건 기록 (메모리에 반영하기 전에 호출), seq 반환"""
+        with self._lock:
+            self._seq += 1
+            entry = {"seq": self._seq, "op": op, "id": passenger_id, "record": record}
+            f = self._open()
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            if self.fsync:
+                os.fsync(f.fileno())
+            self._pending += 1
+            return self._seq
+
+    def needs_compaction(self) -> bool:
+        return self._pending >= self.compact_every
+
+    def compact(self, records: Iterable[Dict[str, Any]]):
+        """
+        현재 전체 레코드를 스냅샷으로 저장하고 저널 비우기
+        스냅샷 교체 후 저널을 비우기 전에 종료되어도 seq로 중복 재생을 막음
+        """
+        with self._lock:
+            self.store_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.store_dir, prefix=f".{SNAPSHOT_FILE}.")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"seq": self._seq, "records": list(records)}, f, ensure_ascii=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.snapshot_path)
+
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            open(self.journal_path, "w").close()
+            logger.info(f"✅ 승객 저널 압축: seq {self._seq}, 기록 {self._pending}건 → {SNAPSHOT_FILE}")
+            self._pending = 0
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "seq": self._seq,
+            "pending": self._pending,
+            "compact_every": self.compact_every,
+            "journal_bytes": self.journal_path.stat().st_size if self.journal_path.exists() else 0,
+            "snapshot": self.snapshot_path.exists(),
+        }
+
+    def close(self):
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
@@ -4,9 +4,10 @@ import numpy as np
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, Iterator, List, Optional
 from pandas import DataFrame
 from app.titanic.titanic_dataset import TitanicDataset
+from app.titanic.titanic_transformer import EMBARKED_MAPPING, FEATURE_COLUMNS, GENDER_MAPPING, TitanicTransformer, gender_column
 
 # 로깅 설정
 try:
@@ -24,16 +25,83 @@ except ImportError:
         logger.addHandler(handler)
 
 
+# 스트리밍 전처리: 한 번에 읽는 행 수와 Fare/Age 분위수 학습용 표본 크기
+# (train이 표본 크기 이하이면 전체 데이터로 학습한 것과 결과가 같음)
+CHUNK_ROWS = int(os.environ.get("TITANIC_CHUNK_ROWS", "200000"))
+FIT_SAMPLE_ROWS = int(os.environ.get("TITANIC_FIT_SAMPLE_ROWS", "1000000"))
+
+# 스트리밍 모드에서 CSV를 읽을 때의 dtype (문자열은 pyarrow 문자열, 범주는 category, 정수는 int8)
+# Age/Fare는 구간 경계가 일반 모드와 같도록 float64 유지
+STREAM_DTYPES = {
+    'PassengerId': 'int64',
+    'Survived': 'int8',
+    'Pclass': 'int8',
+    'Name': 'string[pyarrow]',
+    'Sex': pd.CategoricalDtype(list(GENDER_MAPPING)),
+    'gender': pd.CategoricalDtype(list(GENDER_MAPPING)),
+    'Age': 'float64',
+    'SibSp': 'Int8',
+    'Parch': 'Int8',
+    'Ticket': 'string[pyarrow]',
+    'Fare': 'float64',
+    'Cabin': 'string[pyarrow]',
+    'Embarked': pd.CategoricalDtype(list(EMBARKED_MAPPING)),
+}
+# 전처리 후 컬럼은 모두 작은 정수 (구간 번호/인코딩 값)
+STREAM_OUTPUT_DTYPE = 'int8'
+
+
+class _Reservoir:
+    """
+    고정 크기 균등 표본 (reservoir sampling, 청크 단위 벡터 연산)
+    지금까지 본 행 수가 size 이하이면 모든 행을 순서대로 가지고 있음
+    """
+
+    def __init__(self, size: int, n_columns: int, seed: int = 42):
+        self.size = size
+        self.sample = np.empty((size, n_columns), dtype=float)
+        self.seen = 0
+        self._rng = np.random.default_rng(seed)
+
+    def add(self, values: np.ndarray):
+        n = len(values)
+        fill = max(0, min(self.size - self.seen, n))
+        self.sample[self.seen:self.seen + fill] = values[:fill]
+        rest = values[fill:]
+        if len(rest):
+            # 전체에서 i번째(0부터) 행은 size/(i+1) 확률로 표본의 임의 위치를 대체
+            positions = np.arange(self.seen + fill, self.seen + n) + 1
+            slots = (self._rng.random(len(rest)) * positions).astype(np.int64)
+            accepted = slots < self.size
+            slots, rows = slots[accepted], rest[accepted]
+            # 같은 위치가 여러 번 뽑히면 마지막 행이 남음 (순차 처리와 동일)
+            _, last = np.unique(slots[::-1], return_index=True)
+            keep = len(slots) - 1 - last
+            self.sample[slots[keep]] = rows[keep]
+        self.seen += n
+
+    def frame(self, columns: List[str]) -> pd.DataFrame:
+        return pd.DataFrame(self.sample[:min(self.seen, self.size)], columns=columns)
+
+
 class TitanicMethod(object):
     """타이타닉 데이터 전처리 메서드"""
 
     def __init__(self):
         self.dataset = TitanicDataset()
+        # train 기준으로 학습되는 전처리 변환기 (fit_transform, 단계별 메서드, 스트리밍 전처리가 모두 사용)
+        self.transformer = TitanicTransformer()
+        self.dropped_features = []
+
+    @property
+    def fitted_params(self) -> dict:
+        """train 기준으로 학습된 전처리 값 (중앙값, 구간 경계, 매핑 등) - 모델과 함께 저장되어 추론에 재사용"""
+        return {**self.transformer.fitted_params_, "dropped_features": list(self.dropped_features)}
 
 
 
-    def read_csv(self, fname: str ) -> pd.DataFrame:
-        return pd.read_csv(fname)
+    def read_csv(self, fname: str, nrows: Optional[int] = None) -> pd.DataFrame:
+        return pd.read_csv(fname, nrows=nrows)
     
 
     def create_df(self, df: DataFrame, label: str) -> pd.DataFrame:
@@ -45,14 +113,37 @@ class TitanicMethod(object):
 
 
 
-    def drop_features(self, this, *feature: str) -> object:
-        [i.drop(j, axis=1, inplace=True) for j in feature for i in [this.train,this.test ] ]
+    def fit_transform(self, this, *drop_features: str) -> TitanicDataset:
+        """
+        train으로 변환기를 한 번 학습(fit)한 뒤 train/test를 모델 입력(PassengerId + FEATURE_COLUMNS)으로 변환
+        - 결과는 아래 단계별 전처리(drop_features → ... → title_nominal → Name 제거)와 같음
+        - 입력 DataFrame은 변경하지 않고 새 데이터셋을 반환
+        """
+        self.transformer.fit(this.train)
+        self.dropped_features.extend(list(drop_features) + ['Name'])
+        return self._apply(this, self.transform_frame)
 
-        # for i in [this.train, this.test]:
-        #     for j in feature:
-        #         i.drop(j, axis=1, inplace=True)
- 
-        return this
+    def transform_frame(self, df: DataFrame) -> DataFrame:
+        """학습된 변환기로 원본 승객 DataFrame 변환 (PassengerId는 그대로 맨 앞에 유지)"""
+        features = self.transformer.transform(df)
+        features.insert(0, 'PassengerId', df['PassengerId'])
+        return features
+
+    # ==================== 단계별 전처리 ====================
+    # 변환 단계를 하나씩 확인하기 위한 메서드 (TitanicTransformer의 fit_*/transform_*를 그대로 사용)
+    # 각 단계는 입력 데이터셋을 변경하지 않고 변환된 새 데이터셋을 반환
+
+    @staticmethod
+    def _apply(this, transform) -> TitanicDataset:
+        """train/test에 같은 변환을 적용한 새 데이터셋"""
+        result = TitanicDataset()
+        result.train = transform(this.train)
+        result.test = transform(this.test)
+        return result
+
+    def drop_features(self, this, *feature: str) -> object:
+        self.dropped_features.extend(feature)
+        return self._apply(this, lambda df: df.drop(columns=list(feature)))
 
 
     def check_null(self, this) -> None:
@@ -76,8 +167,7 @@ class TitanicMethod(object):
         - 기존 Pclass를 그대로 유지합니다 (이미 순서형이므로 추가 변환 불필요).
         """
         # Pclass는 이미 1, 2, 3의 순서형 값이므로 그대로 사용
-        for df in [this.train, this.test]:
-            df['Pclass'] = df['Pclass'].astype(int)
+        this = self._apply(this, lambda df: df.assign(Pclass=self.transformer.transform_pclass(df)))
         
         logger.debug('✓ Pclass 전처리 완료: 정수형 변환')
         return this
@@ -86,33 +176,17 @@ class TitanicMethod(object):
         """
         Fare: 요금 (연속형 ratio 척도이지만, 여기서는 구간화하여 서열형으로 사용)
         - 결측치가 있으면 중앙값으로 채웁니다.
-        - Fare를 사분위수 또는 적절한 구간으로 binning 하여 ordinal 피처를 만듭니다.
+        - Fare를 사분위수 구간으로 binning 하여 ordinal 피처를 만듭니다.
         - train 데이터의 사분위수 기준을 test에도 동일하게 적용합니다.
         """
         if 'Fare' not in this.train.columns:
             return this
         
-        # 결측치 처리: 중앙값으로 채우기 (train 기준)
-        fare_median = this.train['Fare'].median()
-        
-        # train 데이터로 사분위수 구간 경계값 계산
-        _, bins = pd.qcut(
-            this.train['Fare'], 
-            q=4, 
-            labels=[0, 1, 2, 3],
-            retbins=True,
-            duplicates='drop'
-        )
+        # train 데이터로 중앙값과 사분위수 구간 경계값 학습
+        self.transformer.fit_fare(this.train)
         
         # train과 test 모두 동일한 bins로 구간화
-        for df in [this.train, this.test]:
-            df['Fare'] = df['Fare'].fillna(fare_median)
-            df['Fare'] = pd.cut(
-                df['Fare'],
-                bins=bins,
-                labels=[0, 1, 2, 3],
-                include_lowest=True
-            ).astype(int)
+        this = self._apply(this, lambda df: df.assign(Fare=self.transformer.transform_fare(df)))
 
         logger.debug('✓ Fare 전처리 완료: train 기준 bins 적용, 구간화 완료')
         return this
@@ -128,19 +202,14 @@ class TitanicMethod(object):
         if 'Embarked' not in this.train.columns:
             return this
         
-        # 결측치 처리: 최빈값으로 채우기 (train 기준)
-        embarked_mode = this.train['Embarked'].mode()[0] if not this.train['Embarked'].mode().empty else 'S'
-        
-        # Label encoding 매핑 (C=0, Q=1, S=2)
-        embarked_mapping = {'C': 0, 'Q': 1, 'S': 2}
+        # 결측치 처리용 최빈값 학습 (train 기준)
+        self.transformer.fit_embarked(this.train)
         
         # train과 test 모두 동일한 매핑 적용
-        for df in [this.train, this.test]:
-            df['Embarked'] = df['Embarked'].fillna(embarked_mode)
-            df['Embarked_encoded'] = df['Embarked'].map(embarked_mapping).astype(int)
-            df.drop(columns=['Embarked'], inplace=True)
+        this = self._apply(this, lambda df: df.assign(
+            Embarked_encoded=self.transformer.transform_embarked(df)).drop(columns=['Embarked']))
         
-        logger.debug(f'✓ Embarked 전처리 완료: 최빈값={embarked_mode}, Label encoding (C=0, Q=1, S=2)')
+        logger.debug(f'✓ Embarked 전처리 완료: 최빈값={self.transformer.embarked_mode_}, Label encoding (C=0, Q=1, S=2)')
         return this
 
     def gender_nominal(self, this) -> object:
@@ -148,36 +217,24 @@ class TitanicMethod(object):
         Gender: 성별 (male, female)
         - nominal 척도입니다.
         - 이진 인코딩으로 변환합니다 (male=0, female=1).
-        - train.csv는 'Sex' 컬럼을 'Gender'로 변환합니다.
-        - test.csv는 이미 'gender' 컬럼이 있으므로 그대로 사용합니다.
+        - train.csv는 'Sex', test.csv는 'gender' 컬럼일 수 있으므로 둘 다 처리합니다.
         """
-        # train: 'Sex' 컬럼을 'Gender'로 변경
-        if 'Sex' in this.train.columns and 'Gender' not in this.train.columns:
-            this.train['Gender'] = this.train['Sex']
-            this.train = this.train.drop(columns=['Sex'])
-        
-        # test: 'gender' 컬럼이 있으면 'Gender'로 표준화 (대소문자 통일)
-        if 'gender' in this.test.columns:
-            this.test['Gender'] = this.test['gender']
-            this.test = this.test.drop(columns=['gender'])
-        elif 'Sex' in this.test.columns:
-            # 혹시 test에도 'Sex'가 있는 경우를 대비
-            this.test['Gender'] = this.test['Sex']
-            this.test = this.test.drop(columns=['Sex'])
-        
-        if 'Gender' not in this.train.columns or 'Gender' not in this.test.columns:
+        if gender_column(this.train) is None or gender_column(this.test) is None:
             logger.warning('Gender 컬럼이 없습니다.')
             return this
         
         # 이진 인코딩: male=0, female=1 (train과 test 모두)
-        gender_mapping = {'male': 0, 'female': 1}
-        for df in [this.train, this.test]:
-            df['Gender_encoded'] = df['Gender'].map(gender_mapping).astype(int)
-            df.drop(columns=['Gender'], inplace=True)
+        this = self._apply(this, self._replace_gender)
         
         logger.debug('✓ Gender 전처리 완료: 이진 인코딩 완료')
         return this
 
+    def _replace_gender(self, df: DataFrame) -> DataFrame:
+        encoded = self.transformer.transform_gender(df)
+        df = df.drop(columns=[gender_column(df)])
+        df['Gender_encoded'] = encoded
+        return df
+
 
     def age_ratio(self, this) -> object:
         """
@@ -191,21 +248,12 @@ class TitanicMethod(object):
         if 'Age' not in this.train.columns:
             return this
         
-        bins = [-1, 0, 5, 12, 18, 24, 35, 60, np.inf]
-
-        # 결측치 처리: 중앙값으로 채우기 (train 기준)
-        age_median = this.train['Age'].median()
+        # 결측치 처리용 중앙값 학습 (train 기준)
+        self.transformer.fit_age(this.train)
         
         # Label Encoding (0~7) - 숫자형만 사용
-        for df in [this.train, this.test]:
-            df['Age'] = df['Age'].fillna(age_median)
-            df['Age_encoded'] = pd.cut(
-                df['Age'], 
-                bins=bins, 
-                labels=False,
-                include_lowest=True
-            ).astype(int)
-            df.drop(columns=['Age'], inplace=True)
+        this = self._apply(this, lambda df: df.assign(
+            Age_encoded=self.transformer.transform_age(df)).drop(columns=['Age']))
         
         logger.debug('✓ Age 전처리 완료: 구간화 완료 (0~7 숫자 인코딩)')
         return this
@@ -215,43 +263,111 @@ class TitanicMethod(object):
         Title: 명칭 (Mr, Mrs, Miss, Master, Dr, etc.)
         - Name 컬럼에서 추출한 타이틀입니다.
         - nominal 척도입니다.
-        - 희소한 타이틀은 "Rare" 그룹으로 묶습니다.
+        - Miss는 Ms로, 귀족 타이틀은 Royal로 묶고, 희소한 타이틀은 "Rare" 그룹으로 묶습니다.
         - train 데이터 기준으로 rare를 판단하여 test에도 동일하게 적용합니다.
         """
         if 'Name' not in this.train.columns or 'Name' not in this.test.columns:
             return this
         
-        # Name에서 Title 추출 (정규표현식 사용)
-        # 예: "Braund, Mr. Owen Harris" -> "Mr"
-        for df in [this.train, this.test]:
-            df['Title'] = df['Name'].str.extract(r',\s*([^\.]+)\.', expand=False)
+        # train 데이터 기준으로 희소한 타이틀 학습
+        self.transformer.fit_title(this.train)
         
-        # Miss를 Ms로 통일 (title_mapping에 맞추기)
-        for df in [this.train, this.test]:
-            df['Title'] = df['Title'].replace('Miss', 'Ms')
+        # train과 test 모두 동일한 rare_titles 기준 적용 (매핑되지 않은 것은 6(Rare)로)
+        this = self._apply(this, lambda df: df.assign(Title_encoded=self.transformer.transform_title(df)))
         
-        # Royal 타이틀 그룹화 (Lady, Countess, Sir, Don, Dona 등)
-        royal_titles = ['Lady', 'Countess', 'Sir', 'Don', 'Dona', 'Jonkheer']
-        for df in [this.train, this.test]:
-            df['Title'] = df['Title'].replace(royal_titles, 'Royal')
+        logger.debug(f'✓ Title 전처리 완료: train 기준 rare_titles={self.transformer.rare_titles_}')
+        return this
+
+    # ==================== 스트리밍 전처리 ====================
+    # 메모리보다 큰 CSV용: 청크 단위로 읽고(STREAM_DTYPES) 학습된 변환기를 청크마다 적용해 Parquet로 기록
+    # 1차: train 전체를 훑으며 결측치/타이틀/항구 집계 + Fare/Age 표본 → 변환기 학습
+    # 2차: 필요한 컬럼만 읽어 변환 후 행 그룹 단위로 기록 (메모리 사용량은 CHUNK_ROWS에 비례)
+
+    def read_csv_chunks(self, fname: str, usecols=None, chunksize: int = CHUNK_ROWS) -> Iterator[pd.DataFrame]:
+        return pd.read_csv(fname, chunksize=chunksize, usecols=usecols, dtype=STREAM_DTYPES)
+
+    def fit_stream(self, train_path: str, label: str = 'Survived', chunksize: int = CHUNK_ROWS,
+                   sample_rows: int = FIT_SAMPLE_ROWS) -> Dict[str, Any]:
+        """
+        train을 청크 단위로 읽어 변환기 학습
+        - Embarked 최빈값, 희소 타이틀: 전체 집계 (정확)
+        - Fare 중앙값/사분위 구간, Age 중앙값: sample_rows 크기 균등 표본
+        Returns: 전처리 전 요약 (행 수, 컬럼, 결측치 수)
+        """
+        reservoir = _Reservoir(sample_rows, 2)
+        embarked_counts = pd.Series(dtype='int64')
+        title_counts = pd.Series(dtype='int64')
+        columns, rows, null_count = None, 0, 0
         
-        # title_mapping 정의
-        title_mapping = {'Mr': 1, 'Ms': 2, 'Mrs': 3, 'Master': 4, 'Royal': 5, 'Rare': 6}
+        for chunk in self.read_csv_chunks(train_path, chunksize=chunksize):
+            chunk = chunk.drop(columns=[label], errors='ignore')
+            columns = columns or chunk.columns.tolist()
+            rows += len(chunk)
+            null_count += int(chunk.isnull().sum().sum())
+            reservoir.add(chunk[['Fare', 'Age']].to_numpy(dtype=float))
+            embarked_counts = embarked_counts.add(chunk['Embarked'].value_counts(), fill_value=0)
+            title_counts = title_counts.add(self.transformer.extract_title(chunk['Name']).value_counts(), fill_value=0)
         
-        # train 데이터 기준으로 희소한 타이틀을 "Rare"로 그룹화
-        # 주요 타이틀: Mr, Ms, Mrs, Master, Royal
-        title_counts = this.train['Title'].value_counts()
-        rare_titles = title_counts[title_counts < 10].index.tolist()
+        sample = reservoir.frame(['Fare', 'Age'])
+        self.transformer.fit_fare(sample)
+        self.transformer.fit_age(sample)
+        self.transformer.fit_embarked_counts(embarked_counts)
+        self.transformer.fit_title_counts(title_counts.astype('int64'))
+        logger.info(f"✓ 스트리밍 학습 완료: {rows:,}행 (분위수 표본 {len(sample):,}행), rare_titles={self.transformer.rare_titles_}")
+        return {"rows": rows, "columns": columns or [], "null_count": null_count, "sample_rows": len(sample)}
 
-        # title_mapping에 없는 타이틀만 Rare로 변경
-        rare_titles = [t for t in rare_titles if t not in title_mapping]
-        
-        # train과 test 모두 동일한 rare_titles 기준 적용
-        for df in [this.train, this.test]:
-            df['Title'] = df['Title'].replace(rare_titles, 'Rare')
-            df['Title_encoded'] = df['Title'].map(title_mapping).fillna(6).astype(int)  # 매핑되지 않은 것은 6(Rare)로
-            df.drop(columns=['Title'], inplace=True)
+    def transform_stream(self, fname: str, out_path: Path, label: Optional[str] = None,
+                         label_path: Optional[Path] = None, chunksize: int = CHUNK_ROWS) -> Dict[str, Any]:
+        """
+        학습된 변환기를 청크마다 적용해 Parquet로 기록 (PassengerId + FEATURE_COLUMNS, int8)
+        label이 있으면 label_path에 따로 기록
+        """
+        import pyarrow as pa
+        import pyarrow.parquet as pq
         
-        logger.debug(f'✓ Title 전처리 완료: train 기준 rare_titles={rare_titles}')
-        return this
+        needed = {'PassengerId', 'Pclass', 'Name', 'Sex', 'gender', 'Age', 'Fare', 'Embarked'}
+        if label:
+            needed.add(label)
+        writer, label_writer = None, None
+        rows, null_count = 0, 0
+        try:
+            for chunk in self.read_csv_chunks(fname, usecols=lambda c: c in needed, chunksize=chunksize):
+                features = self.transform_frame(chunk).astype({c: STREAM_OUTPUT_DTYPE for c in FEATURE_COLUMNS})
+                null_count += int(features.isnull().sum().sum())
+                table = pa.Table.from_pandas(features, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(out_path, table.schema)
+                writer.write_table(table)
+                if label:
+                    label_table = pa.Table.from_pandas(chunk[[label]], preserve_index=False)
+                    if label_writer is None:
+                        label_writer = pq.ParquetWriter(label_path, label_table.schema)
+                    label_writer.write_table(label_table)
+                rows += len(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+            if label_writer is not None:
+                label_writer.close()
+        return {"rows": rows, "null_count": null_count}
 
+    def preprocess_stream(self, train_path: str, test_path: str, out_dir: Path, drop_features: List[str],
+                          label: str = 'Survived', chunksize: int = CHUNK_ROWS,
+                          sample_rows: int = FIT_SAMPLE_ROWS) -> Dict[str, Any]:
+        """
+        train/test CSV → out_dir/train.parquet, test.parquet, label.parquet
+        결과 컬럼/값은 fit_transform과 같고 특성 dtype만 int8
+        """
+        out_dir = Path(out_dir)
+        before = self.fit_stream(train_path, label=label, chunksize=chunksize, sample_rows=sample_rows)
+        self.dropped_features.extend(list(drop_features) + ['Name'])
+        train = self.transform_stream(train_path, out_dir / 'train.parquet', label=label,
+                                      label_path=out_dir / 'label.parquet', chunksize=chunksize)
+        test = self.transform_stream(test_path, out_dir / 'test.parquet', chunksize=chunksize)
+        logger.info(f"✓ 스트리밍 전처리 완료: train {train['rows']:,}행, test {test['rows']:,}행 → Parquet ({chunksize:,}행 단위)")
+        return {
+            "before": before,
+            "after": {"columns": ['PassengerId'] + FEATURE_COLUMNS, "null_count": train["null_count"]},
+            "train_rows": train["rows"],
+            "test_rows": test["rows"],
+        }
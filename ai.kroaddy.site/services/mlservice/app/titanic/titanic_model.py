@@ -1,5 +1,5 @@
 from pydantic import BaseModel, Field
-from typing import Optional
+from typing import List, Optional
 from enum import Enum
 
 
@@ -43,6 +43,29 @@ class Passenger(BaseModel):
         use_enum_values = True  # Enum 값을 실제 값으로 사용
 
 
+class PredictPassenger(BaseModel):
+    """생존 예측 입력 (모델이 사용하는 필드만 필수)"""
+    
+    passenger_id: Optional[int] = Field(None, alias="PassengerId", description="승객 ID (응답에 그대로 반환)")
+    pclass: int = Field(..., alias="Pclass", ge=1, le=3, description="승객 등급 (1, 2, 3)")
+    name: str = Field("", alias="Name", description="승객 이름 (타이틀 추출용, 예: 'Braund, Mr. Owen Harris')")
+    sex: SexEnum = Field(..., alias="Sex", description="성별")
+    age: Optional[float] = Field(None, alias="Age", ge=0, le=120, description="나이 (없으면 학습 데이터 중앙값)")
+    fare: Optional[float] = Field(None, alias="Fare", ge=0, description="요금 (없으면 학습 데이터 중앙값)")
+    embarked: Optional[EmbarkedEnum] = Field(None, alias="Embarked", description="승선 항구 (없으면 최빈값)")
+    
+    class Config:
+        """Pydantic 설정"""
+        populate_by_name = True
+        use_enum_values = True
+
+
+class PredictBatchRequest(BaseModel):
+    """여러 승객 생존 예측 입력"""
+    
+    passengers: List[PredictPassenger] = Field(..., min_length=1, max_length=10000, description="예측할 승객 목록")
+
+
 class TitanicModels:
     def __init__(self) -> None:
        pass
\ No newline at end of file
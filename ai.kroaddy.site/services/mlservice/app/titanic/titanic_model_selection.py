@@ -0,0 +1,162 @@
+import hashlib
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.base import clone
+from sklearn.ensemble import GradientBoostingClassifier, RandomForestClassifier
+from sklearn.linear_model import LogisticRegression
+from sklearn.model_selection import StratifiedKFold
+from sklearn.svm import SVC
+
+# 로깅 설정
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+    from common.utils import setup_logging
+    logger = setup_logging("titanic_model_selection")
+except ImportError:
+    import logging
+    logger = logging.getLogger("titanic_model_selection")
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+
+# 후보 모델 (이름 -> 생성 함수)
+# SVC는 probability=True를 쓰지 않음 (내부 5-fold Platt scaling으로 학습 비용이 몇 배가 됨)
+ESTIMATORS: Dict[str, Callable[[], Any]] = {
+    'RandomForest': lambda: RandomForestClassifier(n_estimators=200, max_depth=6, random_state=42),
+    'GradientBoosting': lambda: GradientBoostingClassifier(random_state=42),
+    'LogisticRegression': lambda: LogisticRegression(max_iter=1000),
+    'SVM': lambda: SVC(random_state=42),
+}
+
+
+def create_estimators(names: Optional[List[str]] = None) -> Dict[str, Any]:
+    """이름 목록으로 후보 모델 생성 (없으면 전체)"""
+    names = names or list(ESTIMATORS)
+    unknown = [name for name in names if name not in ESTIMATORS]
+    if unknown:
+        raise ValueError(f"알 수 없는 모델: {unknown} (사용 가능: {list(ESTIMATORS)})")
+    return {name: ESTIMATORS[name]() for name in names}
+
+
+def data_fingerprint(X: pd.DataFrame, y: pd.Series) -> str:
+    """학습 데이터 내용 해시 (fold 결과 캐시 키)"""
+    h = hashlib.sha256()
+    h.update(pd.util.hash_pandas_object(X, index=False).values.tobytes())
+    h.update(pd.util.hash_pandas_object(pd.Series(y), index=False).values.tobytes())
+    h.update(",".join(X.columns).encode())
+    return h.hexdigest()[:16]
+
+
+def estimator_key(estimator) -> str:
+    """모델 종류 + 하이퍼파라미터 문자열 (파라미터가 바뀌면 캐시가 무효화됨)"""
+    params = sorted(estimator.get_params(deep=False).items())
+    return f"{type(estimator).__name__}({params})"
+
+
+def _fit_fold(estimator, X: np.ndarray, y: np.ndarray, train_idx: np.ndarray, test_idx: np.ndarray) -> Dict[str, float]:
+    """fold 하나 학습/평가 (워커 프로세스에서 실행)"""
+    model = clone(estimator)
+    start = time.perf_counter()
+    model.fit(X[train_idx], y[train_idx])
+    fit_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    predictions = model.predict(X[test_idx])
+    predict_time = time.perf_counter() - start
+
+    return {
+        "accuracy": float(np.mean(predictions == y[test_idx])),
+        "fit_time": fit_time,
+        "predict_time": predict_time,
+    }
+
+
+class TitanicModelSelector:
+    """
+    k-fold 교차검증 기반 모델 선택
+    - (모델 × fold) 작업을 joblib으로 여러 코어에 병렬 분산
+    - fold 결과를 (데이터 해시, 모델 파라미터, k, fold) 키로 캐시하여 같은 입력은 다시 학습하지 않음
+    - 모델별 평균/표준편차 정확도와 fit/predict 소요 시간을 함께 보고
+    """
+
+    def __init__(self, n_splits: int = 5, n_jobs: int = -1, random_state: int = 42):
+        self.n_splits = n_splits
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self._fold_cache: Dict[tuple, Dict[str, float]] = {}
+
+    def cross_validate(self, estimators: Dict[str, Any], X: pd.DataFrame, y: pd.Series) -> Dict[str, Dict[str, Any]]:
+        """
+        후보 모델 전체를 k-fold로 평가
+
+        Returns:
+            {모델명: {"accuracy", "accuracy_std", "fold_scores", "fit_time", "predict_time", "cached_folds"}}
+        """
+        fingerprint = data_fingerprint(X, y)
+        X_values = X.to_numpy()
+        y_values = pd.Series(y).to_numpy()
+        folds = list(StratifiedKFold(
+            n_splits=self.n_splits, shuffle=True, random_state=self.random_state
+        ).split(X_values, y_values))
+
+        # 캐시에 없는 (모델, fold) 작업만 병렬 실행
+        pending = []
+        for name, estimator in estimators.items():
+            for fold, (train_idx, test_idx) in enumerate(folds):
+                key = (fingerprint, estimator_key(estimator), self.n_splits, self.random_state, fold)
+                if key not in self._fold_cache:
+                    pending.append((key, estimator, train_idx, test_idx))
+
+        if pending:
+            logger.info(f"▶ 교차검증 실행: {len(pending)}개 fold 작업 (모델 {len(estimators)}개 × {self.n_splits}-fold, n_jobs={self.n_jobs})")
+            outputs = Parallel(n_jobs=self.n_jobs)(
+                delayed(_fit_fold)(estimator, X_values, y_values, train_idx, test_idx)
+                for _, estimator, train_idx, test_idx in pending
+            )
+            for (key, *_), output in zip(pending, outputs):
+                self._fold_cache[key] = output
+
+        results = {}
+        pending_keys = {key for key, *_ in pending}
+        for name, estimator in estimators.items():
+            keys = [
+                (fingerprint, estimator_key(estimator), self.n_splits, self.random_state, fold)
+                for fold in range(len(folds))
+            ]
+            fold_results = [self._fold_cache[key] for key in keys]
+            scores = [r["accuracy"] for r in fold_results]
+            results[name] = {
+                "accuracy": float(np.mean(scores)),
+                "accuracy_std": float(np.std(scores)),
+                "fold_scores": [round(s, 4) for s in scores],
+                "fit_time": round(float(np.mean([r["fit_time"] for r in fold_results])), 4),
+                "predict_time": round(float(np.mean([r["predict_time"] for r in fold_results])), 4),
+                "cached_folds": sum(1 for key in keys if key not in pending_keys),
+            }
+            logger.info(
+                f"{name}: 정확도 {results[name]['accuracy']:.4f} (±{results[name]['accuracy_std']:.4f}) | "
+                f"fit {results[name]['fit_time']:.3f}s, predict {results[name]['predict_time']:.4f}s (fold 평균)"
+            )
+        return results
+
+    def clear_cache(self):
+        self._fold_cache.clear()
+
+
+def default_selector() -> TitanicModelSelector:
+    """환경변수 기반 설정 (TITANIC_CV_FOLDS, TITANIC_N_JOBS)"""
+    return TitanicModelSelector(
+        n_splits=int(os.environ.get("TITANIC_CV_FOLDS", "5")),
+        n_jobs=int(os.environ.get("TITANIC_N_JOBS", "-1")),
+    )
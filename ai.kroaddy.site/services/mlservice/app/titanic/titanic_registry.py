@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+import joblib
+import sklearn
+
+# 로깅 설정
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+    from common.utils import setup_logging
+    logger = setup_logging("titanic_registry")
+except ImportError:
+    import logging
+    logger = logging.getLogger("titanic_registry")
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+
+# docker-compose에서 볼륨으로 마운트되는 디렉터리 (재시작해도 유지)
+MODEL_DIR = Path(os.environ.get("TITANIC_MODEL_DIR", Path(__file__).parent / "models"))
+LATEST_FILE = "latest.json"
+
+
+def file_digest(paths: Iterable[Path]) -> str:
+    """입력 파일 내용 해시"""
+    h = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+    return h.hexdigest()
+
+
+def artifact_key(data_digest: str, params: Dict[str, Any]) -> str:
+    """데이터 해시 + 학습 설정(전처리 버전, 모델 파라미터, CV 설정)으로 아티팩트 키 생성"""
+    h = hashlib.sha256()
+    h.update(data_digest.encode())
+    h.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return h.hexdigest()[:16]
+
+
+class TitanicModelRegistry:
+    """
+    학습된 모델 저장소 (joblib)
+    - models/titanic_<key>.joblib : 전처리 파라미터 + 학습된 최고 모델 + 평가 결과
+    - models/latest.json          : 가장 최근 아티팩트 정보 (시작 시 이것만 읽음)
+    - 모델 본체는 처음 필요할 때 로드 (lazy)
+    """
+
+    def __init__(self, model_dir: Path = MODEL_DIR):
+        self.model_dir = Path(model_dir)
+        self._lock = threading.Lock()
+        self._loaded: Dict[str, Dict[str, Any]] = {}
+
+    def _path(self, key: str) -> Path:
+        return self.model_dir / f"titanic_{key}.joblib"
+
+    def exists(self, key: str) -> bool:
+        return self._path(key).exists()
+
+    def latest_info(self) -> Optional[Dict[str, Any]]:
+        """최근 아티팩트 메타데이터 (모델은 로드하지 않음)"""
+        path = self.model_dir / LATEST_FILE
+        if not path.exists():
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"latest.json 읽기 실패: {str(e)}")
+            return None
+
+    def save(self, key: str, artifact: Dict[str, Any]) -> Path:
+        """아티팩트 저장 후 latest 포인터 갱신 (임시 파일 → rename으로 원자적 교체)"""
+        self.model_dir.mkdir(parents=True, exist_ok=True)
+        artifact = {
+            **artifact,
+            "key": key,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "sklearn_version": sklearn.__version__,
+        }
+        path = self._path(key)
+        fd, tmp_path = tempfile.mkstemp(dir=self.model_dir, prefix=f".{path.name}.")
+        os.close(fd)
+        joblib.dump(artifact, tmp_path, compress=3)
+        os.replace(tmp_path, path)
+
+        info = {
+            "key": key,
+            "file": path.name,
+            "model_name": artifact.get("model_name"),
+            "accuracy": artifact.get("accuracy"),
+            "created_at": artifact["created_at"],
+            "sklearn_version": artifact["sklearn_version"],
+        }
+        fd, tmp_path = tempfile.mkstemp(dir=self.model_dir, prefix=f".{LATEST_FILE}.")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(info, f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, self.model_dir / LATEST_FILE)
+
+        with self._lock:
+            self._loaded[key] = artifact
+        logger.info(f"✅ 모델 저장: {path.name} ({artifact.get('model_name')})")
+        return path
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """키에 해당하는 아티팩트 로드 (한 번 로드하면 메모리에 유지)"""
+        with self._lock:
+            if key in self._loaded:
+                return self._loaded[key]
+            path = self._path(key)
+            if not path.exists():
+                return None
+            try:
+                artifact = joblib.load(path)
+            except Exception as e:
+                logger.warning(f"모델 로드 실패 ({path.name}): {str(e)}")
+                return None
+            if artifact.get("sklearn_version") != sklearn.__version__:
+                logger.warning(
+                    f"모델 학습 시 scikit-learn {artifact.get('sklearn_version')} / 현재 {sklearn.__version__}"
+                )
+            self._loaded[key] = artifact
+            logger.info(f"✅ 모델 로드: {path.name} ({artifact.get('model_name')})")
+            return artifact
+
+    def load_latest(self) -> Optional[Dict[str, Any]]:
+        info = self.latest_info()
+        return self.load(info["key"]) if info else None
@@ -1,14 +1,22 @@
 from fastapi import APIRouter, HTTPException, Query, Path, Body
 from typing import List, Optional, Dict, Any
+import uuid
 from pydantic import BaseModel
 from icecream import ic
-from app.titanic.titanic_model import Passenger
+from app.titanic.titanic_model import Passenger, PredictPassenger, PredictBatchRequest
 from app.titanic.titanic_service import TitanicService
+from app.titanic.titanic_jobs import preprocess_job, evaluate_job, tuning_job
+from app.titanic.titanic_tuning import SEARCH_SPACES, candidate_configs, default_tuner
+from app.jobs.job_runner import job_runner
+from app.jobs.job_router import job_accepted
 
 router = APIRouter(prefix="/titanic", tags=["titanic"])
 
 # 서비스 인스턴스 생성
 titanic_service = TitanicService()
+# 하이퍼파라미터 탐색 진행 상황 조회용 (탐색은 작업 프로세스에서 실행)
+titanic_tuner = default_tuner()
+tuning_jobs: Dict[str, str] = {}  # search_id -> job_id
 
 
 # ==================== CREATE ====================
@@ -164,19 +172,19 @@ async def get_statistics():
 
 
 @router.get("/preprocess", response_model=Dict[str, Any])
-async def run_preprocess():
+async def run_preprocess(
+    diagnostics: bool = Query(False, description="전처리 전후 상세 정보(샘플 행, 컬럼 타입, 결측치) 포함 여부"),
+    streaming: Optional[bool] = Query(None, description="청크 단위 스트리밍 전처리 (없으면 train.csv 크기로 결정)")
+):
     """
-    데이터 전처리 실행
+    데이터 전처리 실행 (작업 프로세스에서 실행, 이벤트 루프는 막지 않음)
+    입력 CSV가 바뀌지 않았으면 캐시된 전처리 결과를 반환합니다.
     """
     try:
-        result = titanic_service.preprocess()
-        if result.get("status") == "error":
-            error_msg = result.get("message", "전처리 중 에러 발생")
-            ic(f"❌ 전처리 에러: {error_msg}")
-            raise HTTPException(status_code=500, detail=error_msg)
-        return result
-    except HTTPException:
-        raise
+        return await job_runner.run("titanic.preprocess", preprocess_job, diagnostics=diagnostics, streaming=streaming)
+    except RuntimeError as e:
+        ic(f"❌ 전처리 에러: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         import traceback
         error_detail = f"서버 에러: {str(e)}\n{traceback.format_exc()}"
@@ -261,40 +269,173 @@ async def delete_all_passengers():
     return None
 
 
+@router.get("/model", response_model=Dict[str, Any])
+async def get_model_info():
+    """
+    현재 사용 중인(또는 가장 최근 저장된) 모델 정보
+    """
+    info = titanic_service.model_info()
+    if info is None:
+        raise HTTPException(status_code=404, detail="저장된 모델이 없습니다. /titanic/evaluate를 먼저 실행하세요.")
+    return {
+        "status": "success",
+        "model": info
+    }
+
+
+# ==================== PREDICT ====================
+
+@router.post("/predict", response_model=Dict[str, Any])
+async def predict_passenger(passenger: PredictPassenger):
+    """
+    승객 1명 생존 예측 (저장된 최고 모델 사용)
+    
+    - **Pclass**, **Sex** 필수 / **Name**, **Age**, **Fare**, **Embarked** 선택
+    """
+    result = titanic_service.predict([passenger.model_dump(by_alias=True)])
+    if result is None:
+        raise HTTPException(status_code=503, detail="학습된 모델이 없습니다. /titanic/evaluate를 먼저 실행하세요.")
+    return {
+        "status": "success",
+        "model": result["model"],
+        **result["predictions"][0]
+    }
+
+
+@router.post("/predict/batch", response_model=Dict[str, Any])
+async def predict_passengers(request: PredictBatchRequest):
+    """
+    여러 승객 생존 예측 (NumPy 벡터 연산으로 한 번에 변환/예측)
+    """
+    passengers = [p.model_dump(by_alias=True) for p in request.passengers]
+    result = titanic_service.predict(passengers)
+    if result is None:
+        raise HTTPException(status_code=503, detail="학습된 모델이 없습니다. /titanic/evaluate를 먼저 실행하세요.")
+    return {
+        "status": "success",
+        "model": result["model"],
+        "count": len(result["predictions"]),
+        "predictions": result["predictions"]
+    }
+
+
 @router.get("/evaluate", response_model=Dict[str, Any])
 async def evaluate_model():
     """
     모델 평가 실행
-    전처리 → 모델 생성 → 학습 → 평가까지 전체 파이프라인 실행
+    전처리 → 모델 생성 → 학습 → 평가까지 전체 파이프라인을 작업 프로세스에서 실행하고 결과를 기다림
+    (오래 걸리면 POST /titanic/jobs/evaluate로 제출 후 /jobs/{job_id}로 조회)
     """
     try:
-        # 1. 전처리
-        preprocess_result = titanic_service.preprocess()
-        if preprocess_result.get("status") == "error":
-            raise HTTPException(status_code=500, detail=preprocess_result.get("message", "전처리 실패"))
-        
-        # 2. 모델 생성
-        titanic_service.modeling()
-        
-        # 3. 모델 학습
-        titanic_service.learning()
-        
-        # 4. 모델 평가
-        evaluate_result = titanic_service.evaluate()
-        
-        if evaluate_result is None:
-            raise HTTPException(status_code=500, detail="모델 평가 실패")
-        
-        return {
-            "status": "success",
-            "message": "모델 평가 완료",
-            "preprocessing": preprocess_result,
-            "evaluation": evaluate_result
-        }
-    except HTTPException:
-        raise
+        return await job_runner.run("titanic.evaluate", evaluate_job, on_done=titanic_service.reload_model)
+    except RuntimeError as e:
+        raise HTTPException(status_code=500, detail=str(e))
     except Exception as e:
         import traceback
         error_detail = f"서버 에러: {str(e)}\n{traceback.format_exc()}"
         ic(f"❌ 예상치 못한 에러: {error_detail}")
-        raise HTTPException(status_code=500, detail=f"서버 에러: {str(e)}")
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=f"서버 에러: {str(e)}")
+
+
+# ==================== JOBS ====================
+
+@router.post("/jobs/preprocess", response_model=Dict[str, Any], status_code=202)
+async def submit_preprocess_job(
+    diagnostics: bool = Query(False, description="전처리 전후 상세 정보 포함 여부"),
+    streaming: Optional[bool] = Query(None, description="청크 단위 스트리밍 전처리 (없으면 train.csv 크기로 결정)")
+):
+    """전처리 작업 제출 (상태/결과: /jobs/{job_id}, /jobs/{job_id}/result)"""
+    return job_accepted(job_runner.submit("titanic.preprocess", preprocess_job, diagnostics=diagnostics, streaming=streaming))
+
+
+@router.post("/jobs/evaluate", response_model=Dict[str, Any], status_code=202)
+async def submit_evaluate_job():
+    """전체 학습/평가 파이프라인 작업 제출 (완료되면 예측에 새 모델 사용)"""
+    return job_accepted(job_runner.submit("titanic.evaluate", evaluate_job, on_done=titanic_service.reload_model))
+
+
+# ==================== TUNING ====================
+
+@router.post("/tuning", response_model=Dict[str, Any], status_code=202)
+async def start_tuning(
+    strategy: str = Query("halving", description="탐색 방식 (grid / random / halving)"),
+    models: Optional[str] = Query(None, description="탐색할 모델 (쉼표 구분, 없으면 전체)"),
+    n_iter: int = Query(20, ge=1, le=500, description="random/halving에서 모델별 후보 수"),
+    factor: int = Query(3, ge=2, le=10, description="halving 단계마다 후보를 1/factor로 줄임")
+):
+    """
+    하이퍼파라미터 탐색 작업 제출
+    - 진행 상황: GET /titanic/tuning/{search_id}
+    - 리더보드: GET /titanic/tuning/{search_id}/leaderboard
+    - 설정별 fold 점수는 디스크에 캐시되어 같은 탐색을 다시 실행하면 새 설정/fold만 학습합니다.
+    """
+    model_names = [m.strip() for m in models.split(",") if m.strip()] if models else None
+    try:
+        n_configs = len(candidate_configs(strategy, model_names or list(SEARCH_SPACES), n_iter))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    
+    search_id = uuid.uuid4().hex[:12]
+    job_id = job_runner.submit("titanic.tuning", tuning_job, search_id, strategy, model_names, n_iter, factor)
+    tuning_jobs[search_id] = job_id
+    return {
+        "search_id": search_id,
+        "strategy": strategy,
+        "n_configs": n_configs,
+        **job_accepted(job_id),
+        "progress_url": f"/titanic/tuning/{search_id}",
+        "leaderboard_url": f"/titanic/tuning/{search_id}/leaderboard",
+    }
+
+
+def _tuning_progress(search_id: str) -> Dict[str, Any]:
+    """탐색 진행 상황 (작업이 아직 시작 전이면 작업 상태만)"""
+    progress = titanic_tuner.progress(search_id)
+    job = job_runner.get(tuning_jobs[search_id]) if search_id in tuning_jobs else None
+    if progress is None:
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Search {search_id} not found")
+        return {"search_id": search_id, "status": job["status"], "job": job, "leaderboard": []}
+    if job is not None:
+        progress["job"] = job
+        # 작업이 실패/취소되어 진행 파일이 갱신되지 않은 경우
+        if progress["status"] == "running" and job["status"] in ("failed", "cancelled"):
+            progress["status"] = job["status"]
+    return progress
+
+
+@router.get("/tuning/{search_id}", response_model=Dict[str, Any])
+async def get_tuning_progress(search_id: str = Path(..., description="탐색 ID")):
+    """탐색 진행 상황 (단계, 학습/캐시 fold 수, 현재 리더보드 상위 5개)"""
+    progress = _tuning_progress(search_id)
+    return {**progress, "leaderboard": progress["leaderboard"][:5]}
+
+
+@router.get("/tuning/{search_id}/leaderboard", response_model=Dict[str, Any])
+async def get_tuning_leaderboard(
+    search_id: str = Path(..., description="탐색 ID"),
+    top: int = Query(10, ge=1, le=100, description="상위 개수")
+):
+    """
+    설정별 교차검증 정확도 순위
+    평가한 fold가 많은 설정(halving에서 끝까지 살아남은 설정)이 먼저 오고, 같으면 정확도 순입니다.
+    """
+    progress = _tuning_progress(search_id)
+    return {
+        "search_id": search_id,
+        "status": progress["status"],
+        "leaderboard": progress["leaderboard"][:top]
+    }
+
+
+@router.delete("/tuning/{search_id}", response_model=Dict[str, Any])
+async def cancel_tuning(search_id: str = Path(..., description="탐색 ID")):
+    """탐색 중단 (대기 중이면 작업 취소, 실행 중이면 다음 fold 결과를 받은 시점에 중단하고 그때까지의 결과를 남김)"""
+    job = job_runner.get(tuning_jobs[search_id]) if search_id in tuning_jobs else None
+    if job is not None and job["status"] == "queued":
+        job = job_runner.cancel(tuning_jobs[search_id])
+    # 작업이 시작됐지만 아직 진행 파일을 쓰기 전(전처리, fold 준비 중)이어도 중단 표시를 남김
+    started = job is not None and job["status"] == "running"
+    if not titanic_tuner.request_cancel(search_id, force=started) and job is None:
+        raise HTTPException(status_code=404, detail=f"Search {search_id} not found")
+    return _tuning_progress(search_id)
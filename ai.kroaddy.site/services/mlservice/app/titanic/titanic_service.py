@@ -5,13 +5,25 @@ from sklearn.model_selection import train_test_split
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+from joblib import Parallel, delayed
 import os
 import sys
+import threading
+import time
 from typing import List, Optional, Tuple, Dict, Any
 from pathlib import Path
 
 from app.titanic.titanic_dataset import TitanicDataset
-from app.titanic.titanic_method import TitanicMethod
+from app.titanic.titanic_method import CHUNK_ROWS, FIT_SAMPLE_ROWS, TitanicMethod
+from app.titanic.titanic_transformer import PREPROCESS_VERSION
+from app.titanic.titanic_model_selection import create_estimators, default_selector, estimator_key
+from app.titanic.titanic_encoder import PassengerEncoder
+from app.titanic.titanic_registry import TitanicModelRegistry, artifact_key
+from app.titanic.titanic_cache import FRAME_FORMAT, PreprocessCache
+from app.titanic.titanic_model import Passenger
+from app.titanic.titanic_store import PassengerStore
+from app.titanic.titanic_journal import PassengerJournal
+from pydantic import ValidationError
 
 # 공통 모듈 경로 추가
 sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
@@ -31,13 +43,107 @@ except ImportError:
         logger.addHandler(handler)
 
 
+# 모델 입력에서 제외하는 원본 컬럼
+PREPROCESS_DROP_FEATURES = ('SibSp', 'Parch', 'Ticket', 'Cabin')
+# 변화 요약에 표시하는 전처리 단계 (TitanicTransformer.transform이 적용하는 변환 순서)
+PREPROCESS_STEPS = [
+    f"drop_features: {list(PREPROCESS_DROP_FEATURES)}", "pclass_ordinal", "fare_ordinal", "embarked_ordinal",
+    "gender_nominal", "age_ratio", "title_nominal", "drop_features: ['Name']",
+]
+# train.csv / test.csv 위치와 제출 CSV 저장 위치 (벤치마크는 합성 데이터 디렉터리를 지정)
+DATA_DIR = Path(os.environ.get("TITANIC_DATA_DIR", Path(__file__).parent.parent / 'resources' / 'titanic'))
+DOWNLOAD_DIR = Path(os.environ.get("TITANIC_DOWNLOAD_DIR", Path(__file__).parent / 'download'))
+# train.csv가 이 크기 이상이면 청크 단위 스트리밍 전처리 (메모리 사용량이 데이터 크기와 무관)
+STREAM_MIN_BYTES = int(os.environ.get("TITANIC_STREAM_MIN_BYTES", str(256 * 1024 * 1024)))
+
+
 class TitanicService:
     """타이타닉 승객 데이터 처리 및 ML 서비스"""
     
-    def __init__(self):
+    def __init__(self, data_dir: Optional[Path] = None):
+        self.data_dir = Path(data_dir) if data_dir is not None else DATA_DIR
         self.processed_data = None  # 전처리된 데이터 저장
         self.train_label = None  # 원본 train의 Survived 레이블
         self.models = {}  # 학습된 모델 저장
+        self._fitted_keys = {}  # 모델명 -> 학습에 사용한 데이터/설정의 아티팩트 키
+        self.selector = default_selector()  # 교차검증 모델 선택 (fold 결과 캐시 유지)
+        self.registry = TitanicModelRegistry()  # 저장된 모델 (models/ 디렉터리)
+        self.artifact = None  # 현재 사용 중인 모델 아티팩트 (전처리 파라미터 + 모델)
+        self.data_digest = None  # train/test CSV 내용 해시
+        self.preprocess_cache = PreprocessCache()  # 전처리 결과 캐시 (cache/ 디렉터리)
+        self._preprocess_key = None  # 현재 processed_data의 캐시 키
+        self._preprocess_streaming = False  # 현재 processed_data가 스트리밍 전처리 결과인지
+        self.preprocess_changes = None  # 전처리 전후 변화 요약
+        self.preprocess_params = None  # train 기준 전처리 파라미터
+        self.transformer = None  # train 기준으로 학습된 전처리 변환기 (TitanicTransformer)
+        self.feature_columns = None  # 모델 입력 컬럼 순서
+        self._predictor = None  # (모델, 인코더, 아티팩트) 온라인 추론용
+        # 승객 CRUD/검색용 저장소 (train.csv + 변경 저널, 첫 조회 또는 서버 시작 시 로드)
+        self.store = PassengerStore(self._data_paths()[0], journal=PassengerJournal())
+    
+    # ==================== PASSENGER CRUD ====================
+    
+    def create_passenger(self, passenger: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """승객 추가 (이미 있는 PassengerId면 None)"""
+        result = self.store.add(passenger)
+        if result is None:
+            logger.warning(f"이미 존재하는 PassengerId: {passenger.get('PassengerId')}")
+        return result
+    
+    def create_passenger_from_dict(self, data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """검증되지 않은 딕셔너리로 승객 추가 (Passenger 모델로 검증)"""
+        try:
+            passenger = Passenger(**data).model_dump(by_alias=True)
+        except ValidationError as e:
+            logger.warning(f"승객 데이터 검증 실패: {e.errors()}")
+            return None
+        return self.create_passenger(passenger)
+    
+    def get_all_passengers(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        return self.store.page(limit=limit, offset=offset)
+    
+    def get_passenger_by_id(self, passenger_id: int) -> Optional[Dict[str, Any]]:
+        return self.store.get(passenger_id)
+    
+    def search_passengers(self, **filters) -> List[Dict[str, Any]]:
+        """이름/성별/생존/등급/나이·요금 범위 검색 (PassengerStore.search 참고)"""
+        return self.store.search(**filters)
+    
+    def get_top_passengers_by_fare(self, top_n: int = 10) -> List[Dict[str, Any]]:
+        return self.store.top_by('Fare', top_n)
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        return self.store.statistics()
+    
+    def update_passenger(self, passenger_id: int, passenger: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """승객 전체 수정 (없으면 None)"""
+        return self.store.replace(passenger_id, passenger)
+    
+    def update_passenger_partial(self, passenger_id: int, updates: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        승객 부분 수정 (필드명/alias 모두 허용, 수정 후 레코드를 Passenger 모델로 검증)
+        없거나 검증에 실패하면 None
+        """
+        current = self.store.get(passenger_id)
+        if current is None:
+            return None
+        try:
+            aliases = {field.alias: name for name, field in Passenger.model_fields.items() if field.alias}
+            merged = Passenger(**current).model_dump()
+            merged.update({aliases.get(key, key): value for key, value in updates.items()})
+            merged['passenger_id'] = passenger_id
+            passenger = Passenger(**merged).model_dump(by_alias=True)
+        except ValidationError as e:
+            logger.warning(f"승객 데이터 검증 실패: {e.errors()}")
+            return None
+        return self.store.replace(passenger_id, passenger)
+    
+    def delete_passenger(self, passenger_id: int) -> bool:
+        return self.store.remove(passenger_id)
+    
+    def delete_all_passengers(self) -> bool:
+        self.store.clear()
+        return True
     
     # ==================== ML 파이프라인 ====================
     
@@ -112,58 +218,28 @@ class TitanicService:
             "preprocessing_steps": preprocessing_steps
         }
     
-    def preprocess(self):
-        """
-        타이타닉 데이터 전처리 실행
-        Returns:
-            전처리 결과 정보 딕셔너리
-        """
-        logger.info("▶ 전처리 시작")
-        
-        the_method = TitanicMethod()
-        
-        # 파일 경로 설정
-        data_path = Path(__file__).parent.parent / 'resources' / 'titanic'
-        train_path = data_path / 'train.csv'
-        test_path = data_path / 'test.csv'
-        
-        # 파일 존재 확인
-        if not train_path.exists():
-            logger.error(f"train.csv 파일을 찾을 수 없습니다: {train_path}")
-            return {"status": "error", "message": f"train.csv 파일을 찾을 수 없습니다: {train_path}"}
-        if not test_path.exists():
-            logger.error(f"test.csv 파일을 찾을 수 없습니다: {test_path}")
-            return {"status": "error", "message": f"test.csv 파일을 찾을 수 없습니다: {test_path}"}
-        
-        # 데이터 읽기
-        df_train = the_method.read_csv(str(train_path))
-        df_test = the_method.read_csv(str(test_path))
-        
-        # 원본 train에서 Survived 라벨 저장
-        self.train_label = df_train['Survived'].copy()
-        
+    def _data_paths(self) -> Tuple[Path, Path]:
+        return self.data_dir / 'train.csv', self.data_dir / 'test.csv'
+
+    def _read_raw(self, the_method: TitanicMethod, train_path: Path, test_path: Path,
+                  nrows: Optional[int] = None) -> Tuple[pd.DataFrame, pd.DataFrame, pd.Series]:
+        """원본 CSV 읽기 -> (train 특성, test 특성, Survived 라벨)"""
+        df_train = the_method.read_csv(str(train_path), nrows=nrows)
+        df_test = the_method.read_csv(str(test_path), nrows=nrows)
         this_train = the_method.create_df(df_train, 'Survived')
         this_test = the_method.create_df(df_test, 'Survived') if 'Survived' in df_test.columns else df_test
-        
+        return this_train, this_test, df_train['Survived'].copy()
+
+    def _run_preprocess(self, train_path: Path, test_path: Path) -> Dict[str, Any]:
+        """CSV 읽기부터 전처리 단계 전체 실행 (캐시에 없을 때만)"""
+        the_method = TitanicMethod()
+        this_train, this_test, train_label = self._read_raw(the_method, train_path, test_path)
 
-        # 전처리 전 데이터 정보 수집
-        before_info = self._collect_dataframe_info(this_train, sample_size=5)
-        before_info_test = self._collect_dataframe_info(this_test, sample_size=5)
+        before_columns = this_train.columns.tolist()
         null_count = int(this_train.isnull().sum().sum())
         null_count_test = int(this_test.isnull().sum().sum())
         
         logger.info(f"📊 전처리 전 | Train: {this_train.shape[0]}행×{this_train.shape[1]}열 (결측치: {null_count:,}) | Test: {this_test.shape[0]}행×{this_test.shape[1]}열 (결측치: {null_count_test:,})")
-        
-        # DataFrame 간결하게 출력 (3행만, 핵심 컬럼만)
-        sample_df = this_train.head(3).replace({np.nan: None})
-        if len(sample_df.columns) > 8:
-            # 컬럼이 많으면 일부만 표시
-            key_cols = ['PassengerId', 'Pclass', 'Age', 'Fare', 'Sex', 'Embarked'] + [c for c in sample_df.columns if c not in ['PassengerId', 'Pclass', 'Age', 'Fare', 'Sex', 'Embarked']][:2]
-            key_cols = [c for c in key_cols if c in sample_df.columns]
-            sample_df = sample_df[key_cols]
-        df_str = sample_df.to_string(index=False, justify='left', max_colwidth=15)
-        logger.info(f"Train 샘플 (상위 3행):\n{df_str}")
-
 
         # 전처리 전 데이터 객체 생성
         this = TitanicDataset()
@@ -173,111 +249,317 @@ class TitanicService:
         # 결측치 확인
         the_method.check_null(this)
 
-        # 전처리 수행
+        # 전처리 수행: train으로 변환기를 한 번 학습한 뒤 train/test에 같은 변환 적용 (원본 DataFrame은 변경하지 않음)
         logger.info("▶ 전처리 수행 중...")
-        preprocessing_steps = []
-        
-        drop_features = ['SibSp', 'Parch', 'Ticket', 'Cabin']
-        this = the_method.drop_features(this, *drop_features)
-        preprocessing_steps.append(f"drop_features: {drop_features}")
-        
-        this = the_method.pclass_ordinal(this)
-        preprocessing_steps.append("pclass_ordinal")
-        
-        this = the_method.fare_ordinal(this)
-        preprocessing_steps.append("fare_ordinal")
-        
-        this = the_method.embarked_ordinal(this)
-        preprocessing_steps.append("embarked_ordinal")
-        
-        this = the_method.gender_nominal(this)
-        preprocessing_steps.append("gender_nominal")
-        
-        this = the_method.age_ratio(this)
-        preprocessing_steps.append("age_ratio")
-        
-        this = the_method.title_nominal(this)
-        preprocessing_steps.append("title_nominal")
-
-        drop_name = ['Name']
-        this = the_method.drop_features(this, *drop_name)
-        preprocessing_steps.append(f"drop_features: {drop_name}")
-
-
+        this = the_method.fit_transform(this, *PREPROCESS_DROP_FEATURES)
 
-
-        # 전처리 후 정보 수집
-        logger.info("▶ 전처리 완료!")
-        
         # 결측치 확인
         the_method.check_null(this)
         
-        # train.csv 정보
-        after_info = self._collect_dataframe_info(this.train, sample_size=5)
         null_count_after = int(this.train.isnull().sum().sum())
-        
-        # test.csv 정보
-        after_info_test = self._collect_dataframe_info(this.test, sample_size=5)
         null_count_after_test = int(this.test.isnull().sum().sum())
-        
         logger.info(f"📊 전처리 후 | Train: {this.train.shape[0]}행×{this.train.shape[1]}열 (결측치: {null_count_after:,}) | Test: {this.test.shape[0]}행×{this.test.shape[1]}열 (결측치: {null_count_after_test:,})")
-        
-        # DataFrame 간결하게 출력 (3행만)
-        sample_df_after = this.train.head(3).replace({np.nan: None})
-        if len(sample_df_after.columns) > 8:
-            key_cols = ['PassengerId', 'Pclass', 'Fare', 'Embarked_encoded', 'Gender_encoded', 'Age_encoded', 'Title_encoded']
-            key_cols = [c for c in key_cols if c in sample_df_after.columns][:8]
-            sample_df_after = sample_df_after[key_cols]
-        df_str_after = sample_df_after.to_string(index=False, justify='left', max_colwidth=15)
-        logger.info(f"Train 샘플 (상위 3행):\n{df_str_after}")
 
+        # 변화 정보 계산 (컬럼 목록과 결측치 수만 필요)
+        changes_info = self._calculate_changes(
+            {"columns": before_columns, "null_count": null_count},
+            {"columns": this.train.columns.tolist(), "null_count": null_count_after},
+            list(PREPROCESS_DROP_FEATURES) + ['Name'],
+            PREPROCESS_STEPS
+        )
+        
+        return {
+            "train": this.train,
+            "test": this.test,
+            "label": train_label,
+            "transformer": the_method.transformer,
+            "meta": {
+                "preprocess_params": the_method.fitted_params,
+                "feature_columns": [c for c in this.train.columns if c != 'PassengerId'],
+                "changes": changes_info,
+            },
+        }
 
-        # 변화 정보 계산
-        removed_columns = drop_features + drop_name
+    def _run_preprocess_stream(self, train_path: Path, test_path: Path, out_dir: Path) -> Tuple[Any, Dict[str, Any]]:
+        """
+        청크 단위 스트리밍 전처리 (out_dir에 train/test/label Parquet 기록)
+        Returns: (학습된 변환기, 캐시 메타데이터)
+        """
+        the_method = TitanicMethod()
+        result = the_method.preprocess_stream(str(train_path), str(test_path), out_dir, list(PREPROCESS_DROP_FEATURES))
+        before, after = result["before"], result["after"]
+        logger.info(f"📊 스트리밍 전처리 | Train: {result['train_rows']:,}행 (결측치: {before['null_count']:,}) → {len(after['columns'])}열 | Test: {result['test_rows']:,}행")
+        
         changes_info = self._calculate_changes(
-            before_info, 
-            after_info, 
-            removed_columns, 
-            preprocessing_steps
+            before, after,
+            list(PREPROCESS_DROP_FEATURES) + ['Name'],
+            PREPROCESS_STEPS
         )
+        return the_method.transformer, {
+            "preprocess_params": the_method.fitted_params,
+            "feature_columns": after["columns"][1:],
+            "changes": changes_info,
+            "streaming": {"chunk_rows": CHUNK_ROWS, "fit_sample_rows": before["sample_rows"], "train_rows": result["train_rows"]},
+        }
+
+    def _preprocess_diagnostics(self, train_path: Path, test_path: Path) -> Dict[str, Any]:
+        """
+        전처리 전후 DataFrame 정보 (샘플 행, 컬럼 타입, 결측치) - 요청한 경우에만 계산
+        스트리밍 모드로 전처리한 데이터는 원본 CSV의 앞 CHUNK_ROWS행만 읽어 전처리 전 정보를 만듦
+        """
+        cached = self.preprocess_cache.load_diagnostics(self._preprocess_key)
+        if cached is not None:
+            return cached
+        
+        nrows = CHUNK_ROWS if self._preprocess_streaming else None
+        this_train, this_test, _ = self._read_raw(TitanicMethod(), train_path, test_path, nrows=nrows)
+        diagnostics = {
+            "before_preprocessing": self._collect_dataframe_info(this_train, sample_size=5),
+            "after_preprocessing": self._collect_dataframe_info(self.processed_data.train, sample_size=5),
+            "before_preprocessing_test": self._collect_dataframe_info(this_test, sample_size=5),
+            "after_preprocessing_test": self._collect_dataframe_info(self.processed_data.test, sample_size=5),
+        }
+        
+        # DataFrame 간결하게 출력 (3행만, 핵심 컬럼만)
+        key_cols = [c for c in ['PassengerId', 'Pclass', 'Age', 'Fare', 'Sex', 'Embarked'] if c in this_train.columns]
+        df_str = this_train[key_cols].head(3).replace({np.nan: None}).to_string(index=False, justify='left', max_colwidth=15)
+        logger.info(f"Train 샘플 (전처리 전 상위 3행):\n{df_str}")
+        df_str_after = self.processed_data.train.head(3).to_string(index=False, justify='left', max_colwidth=15)
+        logger.info(f"Train 샘플 (전처리 후 상위 3행):\n{df_str_after}")
+        
+        self.preprocess_cache.save_diagnostics(self._preprocess_key, diagnostics)
+        return diagnostics
+
+    def preprocess(self, diagnostics: bool = False, streaming: Optional[bool] = None):
+        """
+        타이타닉 데이터 전처리 실행
+        - 입력 CSV와 PREPROCESS_VERSION이 같으면 메모리/디스크(cache/)의 결과를 그대로 사용
+        - diagnostics=True일 때만 전처리 전후 상세 정보(샘플 행, 컬럼 타입 등)를 계산
+        - streaming: 청크 단위 전처리 → Parquet (None이면 train.csv가 STREAM_MIN_BYTES 이상일 때)
+          결과 값은 같고 특성 dtype이 int8, train이 FIT_SAMPLE_ROWS보다 크면 Fare/Age 분위수는 표본 기준
+        Returns:
+            전처리 결과 정보 딕셔너리
+        """
+        train_path, test_path = self._data_paths()
         
-        # 변화 요약 출력
+        # 파일 존재 확인
+        if not train_path.exists():
+            logger.error(f"train.csv 파일을 찾을 수 없습니다: {train_path}")
+            return {"status": "error", "message": f"train.csv 파일을 찾을 수 없습니다: {train_path}"}
+        if not test_path.exists():
+            logger.error(f"test.csv 파일을 찾을 수 없습니다: {test_path}")
+            return {"status": "error", "message": f"test.csv 파일을 찾을 수 없습니다: {test_path}"}
+        
+        # 입력 파일 내용 해시 (변경이 없으면 전처리 결과와 저장된 모델 재사용)
+        self.data_digest = self.preprocess_cache.data_digest([train_path, test_path])
+        if streaming is None:
+            streaming = train_path.stat().st_size >= STREAM_MIN_BYTES
+        if streaming and FRAME_FORMAT != "parquet":
+            logger.warning("pyarrow가 없어 스트리밍 전처리를 사용할 수 없습니다. 전체 로드로 전처리합니다.")
+            streaming = False
+        config = {"drop_features": PREPROCESS_DROP_FEATURES}
+        if streaming:
+            config["streaming"] = {"fit_sample_rows": FIT_SAMPLE_ROWS}
+        key = self.preprocess_cache.key(self.data_digest, config)
+        
+        if self._preprocess_key == key and self.processed_data is not None:
+            source = "memory"
+        else:
+            entry = self.preprocess_cache.load(key)
+            source = "disk"
+            if entry is None:
+                logger.info("▶ 전처리 시작" + (" (스트리밍)" if streaming else ""))
+                start = time.perf_counter()
+                if streaming:
+                    # 청크마다 캐시 디렉터리에 바로 기록한 뒤 int8 특성만 메모리로 로드
+                    self.preprocess_cache.save_with(key, lambda out_dir: self._run_preprocess_stream(train_path, test_path, out_dir))
+                    entry = self.preprocess_cache.load(key)
+                    if entry is None:
+                        return {"status": "error", "message": "스트리밍 전처리 결과를 저장하지 못했습니다."}
+                else:
+                    entry = self._run_preprocess(train_path, test_path)
+                    self.preprocess_cache.save(key, entry["train"], entry["test"], entry["label"], entry["transformer"], entry["meta"])
+                source = None
+                logger.info(f"✅ 전처리 완료 ({time.perf_counter() - start:.3f}s)")
+            
+            # 전처리된 데이터 저장
+            this = TitanicDataset()
+            this.train = entry["train"]
+            this.test = entry["test"]
+            self.processed_data = this
+            self.train_label = entry["label"]
+            self.transformer = entry["transformer"]
+            self.preprocess_params = entry["meta"]["preprocess_params"]
+            self.feature_columns = entry["meta"]["feature_columns"]
+            self.preprocess_changes = entry["meta"]["changes"]
+            self._preprocess_key = key
+            self._preprocess_streaming = "streaming" in entry["meta"]
+        
+        if source:
+            logger.info(f"✅ 입력 변경 없음: 전처리 결과 재사용 ({source}, key={key})")
+        
+        changes_info = self.preprocess_changes
         logger.info(f"📈 변화 요약 | 제거: {changes_info['columns_removed']}개 | 추가: {changes_info['columns_added']}개 | 결측치 처리: {changes_info['nulls_filled']:,}개")
-        logger.info(f"단계: {' → '.join([s.split(':')[0] if ':' in s else s for s in preprocessing_steps])}")
         
-        # 최종 응답 구성
-        response_data = {
+        data = {
+            "train_shape": list(self.processed_data.train.shape),
+            "test_shape": list(self.processed_data.test.shape),
+            "feature_columns": self.feature_columns,
+            "changes": changes_info,
+            "cache_key": key,
+            "from_cache": source,
+            "streaming": self._preprocess_streaming,
+        }
+        if diagnostics:
+            data.update(self._preprocess_diagnostics(train_path, test_path))
+        
+        return {
             "status": "success",
             "message": "전처리 완료",
-            "data": {
-                "before_preprocessing": before_info,
-                "after_preprocessing": after_info,
-                "changes": changes_info
-            }
+            "data": data
         }
-        
-        # 전처리된 데이터 저장
-        self.processed_data = this
-        
-        logger.info("✅ 전처리 완료")
-        return response_data
 
 
-    def modeling(self):
-        """모델 생성"""
-        logger.info("▶ 모델 생성 시작")
-        
-        from sklearn.svm import SVC
+    def _training_data(self) -> Tuple[pd.DataFrame, pd.Series]:
+        """학습용 X, y (PassengerId 제거, feature_columns 순서)"""
+        X = self.processed_data.train[self.feature_columns]
+        return X, self.train_label
+
+    def _ensure_fitted(self, model_name: str) -> float:
+        """
+        모델이 현재 데이터/설정(아티팩트 키)으로 학습되지 않았으면 전체 train으로 학습, 학습 시간 반환
+        (check_is_fitted는 어떤 데이터로 학습했는지 알 수 없으므로 학습할 때 기록한 키로 판단)
+        """
+        key = self._artifact_key()
+        if key is not None and self._fitted_keys.get(model_name) == key:
+            return 0.0
+        X, y = self._training_data()
+        start = time.perf_counter()
+        self.models[model_name].fit(X.to_numpy(), y.to_numpy())
+        self._fitted_keys[model_name] = key
+        return time.perf_counter() - start
+
+    # ==================== MODEL REGISTRY ====================
+
+    def _artifact_key(self) -> Optional[str]:
+        """현재 데이터 + 전처리 버전 + 후보 모델 파라미터 + CV 설정에 대한 아티팩트 키"""
+        if self.data_digest is None or not self.models:
+            return None
+        return artifact_key(self.data_digest, {
+            "preprocess_version": PREPROCESS_VERSION,
+            "models": {name: estimator_key(model) for name, model in self.models.items()},
+            "cv_folds": self.selector.n_splits,
+            "cv_random_state": self.selector.random_state,
+        })
+
+    def get_model(self) -> Optional[Dict[str, Any]]:
+        """사용 중인 모델 아티팩트 (없으면 최근 저장된 아티팩트를 로드)"""
+        if self.artifact is None:
+            self.artifact = self.registry.load_latest()
+        return self.artifact
+
+    def model_info(self) -> Optional[Dict[str, Any]]:
+        """모델 메타데이터 (모델 본체 로드 없이 반환 가능)"""
+        if self.artifact is not None:
+            return {k: v for k, v in self.artifact.items() if k not in ("model", "transformer", "preprocess_params")}
+        return self.registry.latest_info()
+
+    def reload_model(self, _result: Any = None):
+        """작업 프로세스에서 새 모델이 저장된 뒤 호출 - 다음 예측 때 최근 모델을 다시 로드"""
+        self.artifact = None
+        self._predictor = None
+
+    def warm_start(self):
+        """서버 시작 시 최근 모델을 백그라운드에서 로드 (시작은 막지 않음)"""
+        if self.registry.latest_info() is None:
+            logger.info("저장된 모델이 없습니다. /titanic/evaluate로 학습하세요.")
+            return
+        threading.Thread(target=self.get_model, daemon=True).start()
+
+    # ==================== PREDICT ====================
+
+    def _get_predictor(self) -> Optional[Tuple[Any, PassengerEncoder, Dict[str, Any]]]:
+        """(모델, 인코더, 아티팩트) - 아티팩트가 바뀔 때만 인코더를 새로 만듦"""
+        artifact = self.get_model()
+        if artifact is None:
+            return None
+        if self._predictor is None or self._predictor[2] is not artifact:
+            encoder = PassengerEncoder(artifact["preprocess_params"], artifact["feature_columns"])
+            self._predictor = (artifact["model"], encoder, artifact)
+        return self._predictor
+
+    @staticmethod
+    def _predict_proba(model, X: np.ndarray) -> np.ndarray:
+        """
+        소량 입력의 랜덤 포레스트는 트리별 predict_proba를 직접 평균 (RandomForest.predict_proba와 같은 결과)
+        (RandomForest.predict_proba는 호출마다 joblib 병렬 실행 준비와 트리별 입력 검증 비용이 커서 단건 추론에 부적합,
+         입력은 여기서 한 번만 float32로 바꾸고 트리에서는 check_input=False로 검증 생략)
+        """
+        if isinstance(model, RandomForestClassifier) and len(X) <= 64:
+            X32 = np.ascontiguousarray(X, dtype=np.float32)
+            proba = 0.0
+            for tree in model.estimators_:
+                proba = proba + tree.predict_proba(X32, check_input=False)
+            return proba / len(model.estimators_)
+        return model.predict_proba(X)
+
+    def predict(self, passengers: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        승객 생존 예측 (1명은 스칼라 변환, 여러 명은 NumPy 벡터 변환)
+        Returns: 모델이 없으면 None
+        """
+        predictor = self._get_predictor()
+        if predictor is None:
+            return None
+        model, encoder, artifact = predictor
+        
+        if len(passengers) == 1:
+            X = encoder.transform_one(passengers[0])
+        else:
+            X = encoder.transform(passengers)
+        
+        probabilities = None
+        if hasattr(model, "predict_proba"):
+            # 확률을 한 번만 계산하고 예측 클래스는 확률에서 도출 (predict + predict_proba 이중 계산 방지)
+            proba = self._predict_proba(model, X)
+            survived = model.classes_[np.argmax(proba, axis=1)]
+            probabilities = proba[:, list(model.classes_).index(1)]
+        else:
+            survived = model.predict(X)
+        
+        predictions = []
+        for i, passenger in enumerate(passengers):
+            prediction = {
+                "PassengerId": passenger.get("PassengerId", passenger.get("passenger_id")),
+                "Survived": int(survived[i])
+            }
+            if probabilities is not None:
+                prediction["probability"] = round(float(probabilities[i]), 4)
+            predictions.append(prediction)
         
-        # 모델 생성 (SVM만 사용)
-        self.models = {
-            'SVM': SVC(random_state=42, probability=True)
+        return {
+            "model": artifact["model_name"],
+            "model_key": artifact["key"],
+            "predictions": predictions
         }
+
+    def modeling(self, model_names: Optional[List[str]] = None):
+        """
+        후보 모델 생성
+        model_names가 없으면 TITANIC_MODELS 환경변수(쉼표 구분), 그것도 없으면 전체 후보
+        (RandomForest, GradientBoosting, LogisticRegression, SVM)
+        """
+        logger.info("▶ 모델 생성 시작")
         
-        logger.info("✅ 모델 생성 완료: SVM")
+        if model_names is None and os.environ.get("TITANIC_MODELS"):
+            model_names = [n.strip() for n in os.environ["TITANIC_MODELS"].split(",") if n.strip()]
+        self.models = create_estimators(model_names)
+        self._fitted_keys = {}
+        
+        logger.info(f"✅ 모델 생성 완료: {', '.join(self.models)}")
 
     def learning(self):
-        """모델 학습"""
+        """모델 학습 (전체 train 데이터, 모델별 병렬 학습)"""
         if self.processed_data is None:
             logger.error("전처리된 데이터가 없습니다. 먼저 preprocess()를 실행하세요.")
             return None
@@ -286,24 +568,44 @@ class TitanicService:
             logger.error("학습 레이블이 없습니다. 먼저 preprocess()를 실행하세요.")
             return None
         
+        # 같은 데이터/설정으로 학습된 모델이 저장되어 있으면 학습 생략
+        key = self._artifact_key()
+        if key and self.registry.exists(key):
+            artifact = self.registry.load(key)
+            if artifact is not None:
+                self.artifact = artifact
+                self.models[artifact["model_name"]] = artifact["model"]
+                self._fitted_keys[artifact["model_name"]] = key
+                logger.info(f"✅ 입력 변경 없음: 저장된 모델 사용 ({artifact['model_name']}, key={key}), 학습 생략")
+                return
+        
         logger.info("▶ 모델 학습 시작")
         
-        X_train = self.processed_data.train
-        y_train = self.train_label
+        X_train, y_train = self._training_data()
         
-        # PassengerId 제거 (학습에 불필요)
-        if 'PassengerId' in X_train.columns:
-            X_train = X_train.drop(columns=['PassengerId'])
+        # 모델 학습 (모델마다 별도 프로세스에서 학습 후 학습된 모델을 돌려받음)
+        # 컬럼명 없이 NumPy 배열로 학습 (온라인 추론도 같은 형식의 배열을 사용)
+        X_values, y_values = X_train.to_numpy(), y_train.to_numpy()
         
-        # 모델 학습
-        for name, model in self.models.items():
-            logger.debug(f"학습 중: {name}")
-            model.fit(X_train, y_train)
+        def fit(model):
+            start = time.perf_counter()
+            model.fit(X_values, y_values)
+            return model, time.perf_counter() - start
+        
+        names = list(self.models)
+        fitted = Parallel(n_jobs=self.selector.n_jobs)(delayed(fit)(self.models[name]) for name in names)
+        for name, (model, fit_time) in zip(names, fitted):
+            self.models[name] = model
+            self._fitted_keys[name] = key
+            logger.debug(f"학습 완료: {name} ({fit_time:.3f}s)")
         
         logger.info(f"✅ 모델 학습 완료: {len(self.models)}개 모델")
 
     def evaluate(self):
-        """모델 평가"""
+        """
+        모델 평가 (k-fold 교차검증으로 후보 모델 비교 후 최고 모델 선택)
+        fold 결과는 캐시되므로 데이터와 파라미터가 같으면 다시 학습하지 않습니다.
+        """
         if self.processed_data is None:
             logger.error("전처리된 데이터가 없습니다. 먼저 preprocess()를 실행하세요.")
             return None
@@ -316,59 +618,77 @@ class TitanicService:
             logger.error("학습된 모델이 없습니다. 먼저 modeling()과 learning()을 실행하세요.")
             return None
         
+        # 저장된 모델의 평가 결과 재사용 (교차검증 생략)
+        key = self._artifact_key()
+        if self.artifact is not None and self.artifact.get("key") == key:
+            evaluation = self.artifact["evaluation"]
+            logger.info(f"✅ 저장된 평가 결과 사용: {self.artifact['model_name']} (key={key})")
+            # 아티팩트는 같은 키의 데이터로 학습된 모델만 저장되므로 그대로 사용
+            self.models[self.artifact["model_name"]] = self.artifact["model"]
+            self._fitted_keys[self.artifact["model_name"]] = key
+            submission_path = self.generate_submission_csv(self.artifact["model_name"])
+            return {
+                "status": "success",
+                **evaluation,
+                "from_registry": True,
+                "model_key": key,
+                "submission_file": submission_path
+            }
+        
         logger.info("▶ 모델 평가 시작")
         
-        from sklearn.model_selection import train_test_split
+        X, y = self._training_data()
         
-        X = self.processed_data.train
-        y = self.train_label
+        # 후보 모델 × fold 교차검증 (병렬)
+        start = time.perf_counter()
+        cv_results = self.selector.cross_validate(self.models, X, y)
+        cv_time = time.perf_counter() - start
         
-        # PassengerId 제거
-        if 'PassengerId' in X.columns:
-            X = X.drop(columns=['PassengerId'])
+        results = {name: result["accuracy"] for name, result in cv_results.items()}
+        best_model_name = max(results, key=results.get)
+        best_accuracy = results[best_model_name]
         
-        # Train/Validation 분리
-        X_train, X_val, y_train, y_val = train_test_split(
-            X, y, test_size=0.2, random_state=42, stratify=y
-        )
-        
-        results = {}
-        best_model_name = None
-        best_model = None
-        best_accuracy = 0
+        logger.info(f"✅ 모델 평가 완료: 최고 모델 {best_model_name} (정확도 {best_accuracy:.4f}, 교차검증 {cv_time:.2f}s)")
         
-        # 각 모델 평가
-        for name, model in self.models.items():
-            # 재학습 (train 데이터로)
-            model.fit(X_train, y_train)
-            
-            # 검증 데이터로 평가
-            accuracy = model.score(X_val, y_val)
-            results[name] = accuracy
-            
-            logger.info(f"{name} 활용한 검증 정확도 {accuracy:.4f} ({accuracy*100:.2f}%)")
-            
-            # 최고 모델 업데이트
-            if accuracy > best_accuracy:
-                best_accuracy = accuracy
-                best_model_name = name
-                best_model = model
+        # 최고 모델로 test 데이터 예측 및 CSV 저장 (learning()에서 현재 데이터로 학습했으면 재사용)
+        submission_path = self.generate_submission_csv(best_model_name)
+        best_model = self.models[best_model_name]
         
-        logger.info("✅ 모델 평가 완료")
+        evaluation = {
+            "results": results,
+            "cv_results": cv_results,
+            "cv_folds": self.selector.n_splits,
+            "cv_time": round(cv_time, 3),
+            "best_model": best_model_name,
+            "best_accuracy": best_accuracy
+        }
         
-        # 최고 모델로 test 데이터 예측 및 CSV 저장
-        submission_path = self.generate_submission_csv(best_model, best_model_name)
+        # 전처리 파라미터 + 최고 모델 저장 (재시작 후 재학습 없이 사용)
+        # 이 키의 데이터로 학습된 모델만 저장 (이후 learning()/warm_start가 재학습 없이 그대로 사용하므로)
+        if key and self._fitted_keys.get(best_model_name) != key:
+            logger.warning(f"{best_model_name} 모델이 현재 데이터로 학습되지 않아 저장하지 않습니다. (key={key})")
+        elif key:
+            self.registry.save(key, {
+                "model_name": best_model_name,
+                "model": best_model,
+                "accuracy": best_accuracy,
+                "preprocess_params": self.preprocess_params,
+                "transformer": self.transformer,
+                "feature_columns": self.feature_columns,
+                "evaluation": evaluation
+            })
+            self.artifact = self.registry.load(key)
         
         return {
             "status": "success",
-            "results": results,
-            "best_model": best_model_name,
-            "best_accuracy": best_accuracy,
+            **evaluation,
+            "from_registry": False,
+            "model_key": key,
             "submission_file": submission_path
         }
 
 
-    def generate_submission_csv(self, model, model_name: str) -> str:
+    def generate_submission_csv(self, model_name: str) -> str:
         """최고 모델로 test 데이터 예측하여 캐글 제출용 CSV 생성"""
         if self.processed_data is None:
             logger.error("전처리된 데이터가 없습니다.")
@@ -376,16 +696,11 @@ class TitanicService:
         
         logger.info(f"▶ {model_name} 모델로 test 데이터 예측 시작")
         
-        # 전체 train 데이터로 최종 학습
-        X_train = self.processed_data.train
-        y_train = self.train_label
-        
-        # PassengerId 제거
-        if 'PassengerId' in X_train.columns:
-            X_train = X_train.drop(columns=['PassengerId'])
-        
-        # 최종 학습
-        model.fit(X_train, y_train)
+        # 전체 train 데이터로 최종 학습 (현재 데이터로 이미 학습된 모델이면 생략)
+        fit_time = self._ensure_fitted(model_name)
+        if fit_time:
+            logger.info(f"   {model_name} 전체 데이터 학습: {fit_time:.3f}s")
+        model = self.models[model_name]
         
         # Test 데이터 준비
         X_test = self.processed_data.test.copy()
@@ -397,12 +712,12 @@ class TitanicService:
         if 'PassengerId' in X_test.columns:
             X_test = X_test.drop(columns=['PassengerId'])
         
-        # 예측 수행
-        predictions = model.predict(X_test)
+        # 예측 수행 (학습과 같은 컬럼 순서의 NumPy 배열)
+        predictions = model.predict(X_test[self.feature_columns].to_numpy())
         
         # CSV 저장
-        download_dir = Path(__file__).parent / 'download'
-        download_dir.mkdir(exist_ok=True)
+        download_dir = DOWNLOAD_DIR
+        download_dir.mkdir(parents=True, exist_ok=True)
         
         # 파일명에 타임스탬프 추가
         from datetime import datetime
@@ -0,0 +1,461 @@
+import math
+import sys
+import threading
+from bisect import bisect_left, bisect_right, insort
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+import pandas as pd
+
+from app.titanic.titanic_journal import PassengerJournal
+
+# 로깅 설정
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+    from common.utils import setup_logging
+    logger = setup_logging("titanic_store")
+except ImportError:
+    import logging
+    logger = logging.getLogger("titanic_store")
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+
+# 승객 레코드 필드 (train.csv 컬럼 순서)
+PASSENGER_FIELDS = [
+    'PassengerId', 'Survived', 'Pclass', 'Name', 'Sex', 'Age',
+    'SibSp', 'Parch', 'Ticket', 'Fare', 'Cabin', 'Embarked'
+]
+# 값별 id 집합으로 색인하는 범주형 필드
+CATEGORY_FIELDS = ('Sex', 'Survived', 'Pclass')
+# (값, id) 정렬 리스트로 색인하는 수치 필드 (범위 검색 / 상위 N)
+RANGE_FIELDS = ('Fare', 'Age')
+# 이름 부분 일치 색인의 n-gram 최대 길이 (짧은 검색어는 그 길이의 gram으로 조회)
+NGRAM_SIZE = 3
+
+
+def _clean(value: Any) -> Any:
+    """NaN/NumPy 값을 JSON 직렬화 가능한 파이썬 값으로"""
+    if value is None:
+        return None
+    if isinstance(value, float) and math.isnan(value):
+        return None
+    if hasattr(value, "item"):
+        value = value.item()
+        if isinstance(value, float) and math.isnan(value):
+            return None
+    return value
+
+
+def name_grams(text: str, size: int) -> Set[str]:
+    text = text.lower()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class _RunningStats:
+    """합계/개수를 증감으로 유지하는 수치 통계 (최소/최대/중앙값은 정렬 색인에서 구함)"""
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+
+    def add(self, value: Optional[float], sign: int = 1):
+        if value is not None:
+            self.count += sign
+            self.total += sign * value
+
+    @property
+    def mean(self) -> Optional[float]:
+        return self.total / self.count if self.count else None
+
+
+class PassengerStore:
+    """
+    인메모리 승객 저장소 (train.csv에서 로드)
+    - PassengerId 해시 색인: 조회/수정/삭제 O(1)
+    - Fare/Age 정렬 색인 [(값, id)]: 범위 검색과 요금 상위 N을 bisect로 O(log n + k)
+    - Sex/Survived/Pclass 값별 id 집합
+    - 이름 n-gram 역색인: 부분 일치 검색 후보를 gram 교집합으로 좁힘
+    - 통계(인원, 생존자, 등급/성별 분포, 평균 나이/요금)는 추가/삭제 시 증감으로 유지
+
+    검색은 조건 중 후보가 가장 적은 색인 하나만 순회하고 나머지 조건은 레코드에서 확인합니다.
+    journal이 있으면 변경을 먼저 저널에 기록한 뒤 메모리에 반영하고 (train.csv는 수정하지 않음),
+    로드 시 스냅샷(없으면 train.csv) + 저널 재생으로 복구합니다.
+    """
+
+    def __init__(self, csv_path: Optional[Path] = None, journal: Optional[PassengerJournal] = None):
+        self.csv_path = Path(csv_path) if csv_path else None
+        self.journal = journal
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._reset()
+
+    def _reset(self):
+        self._records: Dict[int, Dict[str, Any]] = {}
+        self._ids: List[int] = []
+        self._sorted: Dict[str, List[tuple]] = {field: [] for field in RANGE_FIELDS}
+        self._category: Dict[str, Dict[Any, Set[int]]] = {field: {} for field in CATEGORY_FIELDS}
+        self._grams: Dict[str, Set[int]] = {}
+        self._survived = 0
+        self._group_counts: Dict[str, Dict[Any, List[int]]] = {'Pclass': {}, 'Sex': {}}
+        self._numeric = {field: _RunningStats() for field in RANGE_FIELDS}
+
+    # ==================== 로드 ====================
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            snapshot = self.journal.load_snapshot() if self.journal is not None else None
+            if snapshot is not None:
+                self.load_records(snapshot)
+                logger.info(f"✅ 승객 데이터 로드: {len(self._records)}명 (스냅샷)")
+            elif self.csv_path is not None and self.csv_path.exists():
+                df = pd.read_csv(self.csv_path)
+                self.load_records(df.reindex(columns=PASSENGER_FIELDS).to_dict('records'))
+                logger.info(f"✅ 승객 데이터 로드: {len(self._records)}명 ({self.csv_path.name})")
+            else:
+                logger.warning(f"승객 데이터 파일이 없습니다: {self.csv_path}")
+
+            if self.journal is not None:
+                replayed = 0
+                for entry in self.journal.replay():
+                    self._apply(entry["op"], entry["id"], entry["record"])
+                    replayed += 1
+                if replayed:
+                    logger.info(f"✅ 승객 저널 재생: {replayed}건 → {len(self._records)}명")
+            self._loaded = True
+
+    def load(self):
+        """서버 시작 시 미리 로드 (스냅샷 + 저널 재생)"""
+        self._ensure_loaded()
+
+    def load_records(self, records: Iterable[Dict[str, Any]]):
+        """레코드 일괄 적재 (정렬 색인은 마지막에 한 번만 정렬)"""
+        with self._lock:
+            self._reset()
+            for record in records:
+                record = {field: _clean(record.get(field)) for field in PASSENGER_FIELDS}
+                self._index(record, sort=False)
+            self._ids.sort()
+            for entries in self._sorted.values():
+                entries.sort()
+            self._loaded = True
+
+    # ==================== 색인 유지 ====================
+
+    def _index(self, record: Dict[str, Any], sort: bool = True):
+        pid = record['PassengerId']
+        self._records[pid] = record
+        if sort:
+            insort(self._ids, pid)
+        else:
+            self._ids.append(pid)
+
+        for field in RANGE_FIELDS:
+            value = record[field]
+            if value is not None:
+                if sort:
+                    insort(self._sorted[field], (value, pid))
+                else:
+                    self._sorted[field].append((value, pid))
+            self._numeric[field].add(value)
+
+        for field in CATEGORY_FIELDS:
+            self._category[field].setdefault(record[field], set()).add(pid)
+
+        for gram in self._record_grams(record):
+            self._grams.setdefault(gram, set()).add(pid)
+
+        survived = 1 if record['Survived'] == 1 else 0
+        self._survived += survived
+        for field, groups in self._group_counts.items():
+            counts = groups.setdefault(record[field], [0, 0])
+            counts[0] += 1
+            counts[1] += survived
+
+    def _unindex(self, record: Dict[str, Any]):
+        pid = record['PassengerId']
+        del self._records[pid]
+        del self._ids[bisect_left(self._ids, pid)]
+
+        for field in RANGE_FIELDS:
+            value = record[field]
+            if value is not None:
+                entries = self._sorted[field]
+                del entries[bisect_left(entries, (value, pid))]
+            self._numeric[field].add(value, sign=-1)
+
+        for field in CATEGORY_FIELDS:
+            ids = self._category[field].get(record[field])
+            if ids is not None:
+                ids.discard(pid)
+                if not ids:
+                    del self._category[field][record[field]]
+
+        for gram in self._record_grams(record):
+            ids = self._grams.get(gram)
+            if ids is not None:
+                ids.discard(pid)
+                if not ids:
+                    del self._grams[gram]
+
+        survived = 1 if record['Survived'] == 1 else 0
+        self._survived -= survived
+        for field, groups in self._group_counts.items():
+            counts = groups[record[field]]
+            counts[0] -= 1
+            counts[1] -= survived
+            if counts[0] == 0:
+                del groups[record[field]]
+
+    @staticmethod
+    def _record_grams(record: Dict[str, Any]) -> Set[str]:
+        name = record.get('Name') or ''
+        grams = set()
+        for size in range(1, NGRAM_SIZE + 1):
+            grams |= name_grams(name, size)
+        return grams
+
+    # ==================== 변경 적용 ====================
+
+    def _apply(self, op: str, passenger_id: Optional[int], record: Optional[Dict[str, Any]]):
+        """변경 한 건을 메모리 색인에 반영 (저널 재생과 일반 변경이 같은 경로 사용)"""
+        if op == "clear":
+            self._reset()
+            return
+        old = self._records.get(passenger_id)
+        if old is not None:
+            self._unindex(old)
+        if op == "put":
+            self._index(record)
+
+    def _commit(self, op: str, passenger_id: Optional[int] = None, record: Optional[Dict[str, Any]] = None):
+        """저널에 먼저 기록 후 메모리 반영, 저널이 충분히 쌓였으면 스냅샷으로 압축"""
+        if self.journal is not None:
+            self.journal.append(op, passenger_id, record)
+        self._apply(op, passenger_id, record)
+        if self.journal is not None and self.journal.needs_compaction():
+            self.journal.compact(self._records.values())
+
+    def compact(self):
+        """현재 상태를 스냅샷으로 저장하고 저널 비우기"""
+        if self.journal is None:
+            return
+        self._ensure_loaded()
+        with self._lock:
+            self.journal.compact(self._records.values())
+
+    def close(self):
+        """서버 종료 시 남은 저널을 스냅샷으로 압축하고 파일 닫기"""
+        if self.journal is None:
+            return
+        if self._loaded and self.journal.stats()["pending"]:
+            self.compact()
+        self.journal.close()
+
+    # ==================== CRUD ====================
+
+    def __len__(self) -> int:
+        self._ensure_loaded()
+        return len(self._records)
+
+    def get(self, passenger_id: int) -> Optional[Dict[str, Any]]:
+        self._ensure_loaded()
+        record = self._records.get(passenger_id)
+        return dict(record) if record is not None else None
+
+    def add(self, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """새 승객 추가 (이미 있는 PassengerId면 None)"""
+        self._ensure_loaded()
+        record = {field: _clean(record.get(field)) for field in PASSENGER_FIELDS}
+        with self._lock:
+            if record['PassengerId'] in self._records:
+                return None
+            self._commit("put", record['PassengerId'], record)
+        return dict(record)
+
+    def replace(self, passenger_id: int, record: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """승객 레코드 교체 (없으면 None)"""
+        self._ensure_loaded()
+        record = {field: _clean(record.get(field)) for field in PASSENGER_FIELDS}
+        record['PassengerId'] = passenger_id
+        with self._lock:
+            if passenger_id not in self._records:
+                return None
+            self._commit("put", passenger_id, record)
+        return dict(record)
+
+    def remove(self, passenger_id: int) -> bool:
+        self._ensure_loaded()
+        with self._lock:
+            if passenger_id not in self._records:
+                return False
+            self._commit("delete", passenger_id)
+        return True
+
+    def clear(self):
+        self._ensure_loaded()
+        with self._lock:
+            self._commit("clear")
+
+    # ==================== 조회 ====================
+
+    def page(self, limit: Optional[int] = None, offset: int = 0) -> List[Dict[str, Any]]:
+        """PassengerId 순 페이지 조회"""
+        self._ensure_loaded()
+        end = None if limit is None else offset + limit
+        return [dict(self._records[pid]) for pid in self._ids[offset:end]]
+
+    def _range_bounds(self, field: str, low: Optional[float], high: Optional[float]) -> tuple:
+        """정렬 색인에서 [low, high] 구간의 (시작, 끝) 위치"""
+        entries = self._sorted[field]
+        start = 0 if low is None else bisect_left(entries, (low, -math.inf))
+        end = len(entries) if high is None else bisect_right(entries, (high, math.inf))
+        return start, end
+
+    def _name_ids(self, name: str) -> Set[int]:
+        """부분 일치 후보 (검색어의 gram 교집합, 실제 포함 여부는 호출 측에서 확인)"""
+        query = name.lower()
+        size = min(len(query), NGRAM_SIZE)
+        grams = sorted(name_grams(query, size), key=lambda g: len(self._grams.get(g, ())))
+        if not grams:
+            return set(self._records)
+        ids = set(self._grams.get(grams[0], ()))
+        for gram in grams[1:]:
+            if not ids:
+                break
+            ids &= self._grams.get(gram, set())
+        return ids
+
+    def search(
+        self,
+        name: Optional[str] = None,
+        sex: Optional[str] = None,
+        survived: Optional[int] = None,
+        pclass: Optional[int] = None,
+        min_age: Optional[float] = None,
+        max_age: Optional[float] = None,
+        min_fare: Optional[float] = None,
+        max_fare: Optional[float] = None,
+        limit: int = 20
+    ) -> List[Dict[str, Any]]:
+        """다중 조건 검색 (PassengerId 순, 최대 limit건)"""
+        self._ensure_loaded()
+        with self._lock:
+            # 조건별 (후보 수, 후보 id를 만드는 함수) - 후보 목록은 순회할 색인 하나만 만듦
+            candidates = []
+            for field, value in (('Sex', sex), ('Survived', survived), ('Pclass', pclass)):
+                if value is not None:
+                    ids = self._category[field].get(value, set())
+                    candidates.append((len(ids), lambda ids=ids: ids))
+            for field, low, high in (('Age', min_age, max_age), ('Fare', min_fare, max_fare)):
+                if low is not None or high is not None:
+                    start, end = self._range_bounds(field, low, high)
+                    entries = self._sorted[field]
+                    candidates.append((end - start, lambda e=entries, s=start, t=end: [pid for _, pid in e[s:t]]))
+            if name:
+                ids = self._name_ids(name)
+                candidates.append((len(ids), lambda ids=ids: ids))
+
+            # 가장 작은 후보만 순회하고 나머지 조건은 레코드에서 확인
+            driver = sorted(min(candidates, key=lambda c: c[0])[1]()) if candidates else self._ids
+            query = name.lower() if name else None
+            results = []
+            for pid in driver:
+                record = self._records[pid]
+                if sex is not None and record['Sex'] != sex:
+                    continue
+                if survived is not None and record['Survived'] != survived:
+                    continue
+                if pclass is not None and record['Pclass'] != pclass:
+                    continue
+                if not self._in_range(record['Age'], min_age, max_age):
+                    continue
+                if not self._in_range(record['Fare'], min_fare, max_fare):
+                    continue
+                if query and query not in (record['Name'] or '').lower():
+                    continue
+                results.append(dict(record))
+                if len(results) >= limit:
+                    break
+            return results
+
+    @staticmethod
+    def _in_range(value: Optional[float], low: Optional[float], high: Optional[float]) -> bool:
+        if low is None and high is None:
+            return True
+        if value is None:
+            return False
+        return (low is None or value >= low) and (high is None or value <= high)
+
+    def top_by(self, field: str, top_n: int) -> List[Dict[str, Any]]:
+        """정렬 색인 끝에서 상위 N명 (값이 같으면 PassengerId가 작은 승객 우선)"""
+        self._ensure_loaded()
+        with self._lock:
+            entries = self._sorted[field]
+            results = []
+            i = len(entries)
+            while i > 0 and len(results) < top_n:
+                # 같은 값 구간을 찾아 id 오름차순으로 채움
+                value = entries[i - 1][0]
+                start = bisect_left(entries, (value, -math.inf), 0, i)
+                for _, pid in entries[start:i]:
+                    results.append(dict(self._records[pid]))
+                    if len(results) >= top_n:
+                        break
+                i = start
+            return results
+
+    def _median(self, field: str) -> Optional[float]:
+        entries = self._sorted[field]
+        n = len(entries)
+        if not n:
+            return None
+        mid = n // 2
+        return entries[mid][0] if n % 2 else (entries[mid - 1][0] + entries[mid][0]) / 2
+
+    def statistics(self) -> Dict[str, Any]:
+        """유지 중인 집계값으로 통계 구성 (레코드 순회 없음)"""
+        self._ensure_loaded()
+        with self._lock:
+            total = len(self._records)
+
+            def groups(field):
+                return {
+                    str(key): {
+                        "count": count,
+                        "survived": survived,
+                        "survival_rate": round(survived / count, 4) if count else 0.0
+                    }
+                    for key, (count, survived) in sorted(self._group_counts[field].items(), key=lambda x: str(x[0]))
+                }
+
+            def numeric(field):
+                entries = self._sorted[field]
+                mean = self._numeric[field].mean
+                return {
+                    "count": self._numeric[field].count,
+                    "missing": total - self._numeric[field].count,
+                    "mean": round(mean, 4) if mean is not None else None,
+                    "median": self._median(field),
+                    "min": entries[0][0] if entries else None,
+                    "max": entries[-1][0] if entries else None,
+                }
+
+            return {
+                "total_passengers": total,
+                "survived": self._survived,
+                "died": total - self._survived,
+                "survival_rate": round(self._survived / total, 4) if total else 0.0,
+                "by_class": groups('Pclass'),
+                "by_sex": groups('Sex'),
+                "age": numeric('Age'),
+                "fare": numeric('Fare'),
+            }
@@ -0,0 +1,166 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils.validation import check_is_fitted
+
+# 전처리 단계/규칙이 바뀌면 올려서 저장된 모델/캐시를 무효화
+PREPROCESS_VERSION = "1"
+
+# 모델 입력 컬럼 순서 (PassengerId 제외)
+FEATURE_COLUMNS = ['Pclass', 'Fare', 'Embarked_encoded', 'Gender_encoded', 'Age_encoded', 'Title_encoded']
+
+# 나이 구간: [-1,0]=태아, [0,5]=유아, [5,12]=어린이, [12,18]=청소년, [18,24]=청년, [24,35]=장년, [35,60]=중년, [60,inf]=노년
+AGE_BINS = (-1, 0, 5, 12, 18, 24, 35, 60, np.inf)
+EMBARKED_MAPPING = {'C': 0, 'Q': 1, 'S': 2}
+GENDER_MAPPING = {'male': 0, 'female': 1}
+TITLE_MAPPING = {'Mr': 1, 'Ms': 2, 'Mrs': 3, 'Master': 4, 'Royal': 5, 'Rare': 6}
+ROYAL_TITLES = ['Lady', 'Countess', 'Sir', 'Don', 'Dona', 'Jonkheer']
+
+# "Braund, Mr. Owen Harris" -> "Mr"
+TITLE_PATTERN = r',\s*([^\.]+)\.'
+
+
+def bin_index(values, bins) -> np.ndarray:
+    """
+    pd.cut(bins, labels=False, include_lowest=True)과 같은 구간 번호
+    학습 구간 밖의 값은 NaN 대신 가장 가까운 구간으로 보냄
+    """
+    bins = np.asarray(bins, dtype=float)
+    return np.clip(np.searchsorted(bins, values, side='left') - 1, 0, len(bins) - 2)
+
+
+def gender_column(df: pd.DataFrame) -> Optional[str]:
+    """성별 컬럼명 (train은 Sex, test는 gender인 경우가 있음)"""
+    for name in ('Gender', 'Sex', 'gender'):
+        if name in df.columns:
+            return name
+    return None
+
+
+class TitanicTransformer(BaseEstimator, TransformerMixin):
+    """
+    타이타닉 전처리 변환기 (scikit-learn Pipeline/ColumnTransformer 호환)
+    - fit: train에서 Fare 중앙값/사분위 구간, Embarked 최빈값, Age 중앙값, 희소 타이틀을 한 번만 학습
+    - transform: 학습된 값으로 원본 승객 DataFrame을 모델 입력 컬럼(FEATURE_COLUMNS)으로 변환
+      입력을 수정하지 않는 순수 함수이며 컬럼 단위 벡터 연산만 사용
+    - joblib으로 직렬화하여 학습/테스트/온라인 추론에 같은 변환을 적용
+
+    단계별 fit_*/transform_* 메서드는 TitanicMethod의 단계별 전처리에서도 사용합니다.
+    """
+
+    def __init__(self, fare_quantiles: int = 4, age_bins: Sequence[float] = AGE_BINS, rare_threshold: int = 10):
+        self.fare_quantiles = fare_quantiles
+        self.age_bins = age_bins
+        self.rare_threshold = rare_threshold
+
+    # ==================== 단계별 fit ====================
+
+    def fit_fare(self, df: pd.DataFrame) -> "TitanicTransformer":
+        """Fare 결측치용 중앙값과 사분위 구간 경계 학습"""
+        self.fare_median_ = float(df['Fare'].median())
+        _, bins = pd.qcut(df['Fare'], q=self.fare_quantiles, retbins=True, duplicates='drop')
+        self.fare_bins_ = [float(b) for b in bins]
+        return self
+
+    def fit_embarked(self, df: pd.DataFrame) -> "TitanicTransformer":
+        """Embarked 결측치용 최빈값 학습"""
+        return self.fit_embarked_counts(df['Embarked'].value_counts())
+
+    def fit_embarked_counts(self, counts: pd.Series) -> "TitanicTransformer":
+        """값별 등장 횟수로 최빈값 학습 (동률이면 Series.mode()처럼 정렬 순서상 앞의 값, 청크별 합계로도 같은 결과)"""
+        counts = counts[counts > 0]
+        if counts.empty:
+            self.embarked_mode_ = 'S'
+        else:
+            self.embarked_mode_ = sorted(counts[counts == counts.max()].index)[0]
+        return self
+
+    def fit_age(self, df: pd.DataFrame) -> "TitanicTransformer":
+        """Age 결측치용 중앙값 학습"""
+        self.age_median_ = float(df['Age'].median())
+        return self
+
+    def fit_title(self, df: pd.DataFrame) -> "TitanicTransformer":
+        """train에서 rare_threshold번 미만 등장한 타이틀(매핑에 없는 것)을 Rare로 학습"""
+        return self.fit_title_counts(self.extract_title(df['Name']).value_counts())
+
+    def fit_title_counts(self, counts: pd.Series) -> "TitanicTransformer":
+        """타이틀별 등장 횟수로 희소 타이틀 학습 (청크별 value_counts 합계 사용 가능, 집계 순서와 무관하게 정렬)"""
+        self.rare_titles_ = sorted(t for t in counts[counts < self.rare_threshold].index if t not in TITLE_MAPPING)
+        return self
+
+    def fit(self, X: pd.DataFrame, y=None) -> "TitanicTransformer":
+        self.fit_fare(X)
+        self.fit_embarked(X)
+        self.fit_age(X)
+        self.fit_title(X)
+        return self
+
+    # ==================== 단계별 transform ====================
+
+    def transform_pclass(self, df: pd.DataFrame) -> pd.Series:
+        return df['Pclass'].astype(int)
+
+    def transform_fare(self, df: pd.DataFrame) -> pd.Series:
+        fare = df['Fare'].fillna(self.fare_median_).to_numpy(dtype=float)
+        return pd.Series(bin_index(fare, self.fare_bins_), index=df.index, name='Fare')
+
+    def transform_embarked(self, df: pd.DataFrame) -> pd.Series:
+        embarked = df['Embarked'].fillna(self.embarked_mode_).map(EMBARKED_MAPPING)
+        return embarked.fillna(EMBARKED_MAPPING[self.embarked_mode_]).astype(int).rename('Embarked_encoded')
+
+    def transform_gender(self, df: pd.DataFrame) -> pd.Series:
+        return df[gender_column(df)].map(GENDER_MAPPING).astype(int).rename('Gender_encoded')
+
+    def transform_age(self, df: pd.DataFrame) -> pd.Series:
+        age = df['Age'].fillna(self.age_median_).to_numpy(dtype=float)
+        return pd.Series(bin_index(age, self.age_bins), index=df.index, name='Age_encoded')
+
+    @staticmethod
+    def extract_title(names: pd.Series) -> pd.Series:
+        """이름에서 타이틀 추출 후 Miss→Ms, 귀족 타이틀→Royal로 통일"""
+        titles = names.str.extract(TITLE_PATTERN, expand=False)
+        return titles.replace('Miss', 'Ms').replace(ROYAL_TITLES, 'Royal')
+
+    def transform_title(self, df: pd.DataFrame) -> pd.Series:
+        titles = self.extract_title(df['Name']).replace(self.rare_titles_, 'Rare')
+        return titles.map(TITLE_MAPPING).fillna(TITLE_MAPPING['Rare']).astype(int).rename('Title_encoded')
+
+    def transform(self, X: pd.DataFrame) -> pd.DataFrame:
+        """원본 승객 DataFrame -> 모델 입력 DataFrame (FEATURE_COLUMNS 순서, 입력은 변경하지 않음)"""
+        check_is_fitted(self, ['fare_bins_', 'embarked_mode_', 'age_median_', 'rare_titles_'])
+        return pd.DataFrame({
+            'Pclass': self.transform_pclass(X),
+            'Fare': self.transform_fare(X),
+            'Embarked_encoded': self.transform_embarked(X),
+            'Gender_encoded': self.transform_gender(X),
+            'Age_encoded': self.transform_age(X),
+            'Title_encoded': self.transform_title(X),
+        }, index=X.index)[FEATURE_COLUMNS]
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        return np.asarray(FEATURE_COLUMNS, dtype=object)
+
+    # ==================== 학습된 값 ====================
+
+    @property
+    def fitted_params_(self) -> Dict[str, Any]:
+        """학습된 전처리 값 (JSON 직렬화 가능, PassengerEncoder 입력)"""
+        params: Dict[str, Any] = {"version": PREPROCESS_VERSION}
+        if hasattr(self, 'fare_bins_'):
+            params["fare_median"] = self.fare_median_
+            params["fare_bins"] = self.fare_bins_
+        if hasattr(self, 'embarked_mode_'):
+            params["embarked_mode"] = self.embarked_mode_
+            params["embarked_mapping"] = EMBARKED_MAPPING
+        params["gender_mapping"] = GENDER_MAPPING
+        if hasattr(self, 'age_median_'):
+            params["age_median"] = self.age_median_
+            params["age_bins"] = [float(b) for b in self.age_bins]
+        if hasattr(self, 'rare_titles_'):
+            params["royal_titles"] = ROYAL_TITLES
+            params["rare_titles"] = list(self.rare_titles_)
+            params["title_mapping"] = TITLE_MAPPING
+        return params
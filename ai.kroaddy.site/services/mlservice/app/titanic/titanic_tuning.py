@@ -0,0 +1,301 @@
+import hashlib
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed
+from sklearn.model_selection import ParameterGrid, ParameterSampler, StratifiedKFold
+
+from app.titanic.titanic_model_selection import ESTIMATORS, _fit_fold, data_fingerprint, estimator_key
+
+# 로깅 설정
+try:
+    sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+    from common.utils import setup_logging
+    logger = setup_logging("titanic_tuning")
+except ImportError:
+    import logging
+    logger = logging.getLogger("titanic_tuning")
+    logger.setLevel(logging.INFO)
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        handler.setFormatter(formatter)
+        logger.addHandler(handler)
+
+
+# 탐색 결과(설정별 fold 점수 캐시, 탐색 진행 상황) 저장 디렉터리
+TUNING_DIR = Path(os.environ.get("TITANIC_TUNING_DIR", Path(__file__).parent / "tuning"))
+
+# 모델별 하이퍼파라미터 탐색 공간
+SEARCH_SPACES: Dict[str, Dict[str, List[Any]]] = {
+    'RandomForest': {
+        'n_estimators': [100, 200, 400],
+        'max_depth': [4, 6, 8, None],
+        'min_samples_leaf': [1, 2, 4],
+        'max_features': ['sqrt', 0.5],
+    },
+    'GradientBoosting': {
+        'n_estimators': [100, 200, 300],
+        'learning_rate': [0.03, 0.1, 0.3],
+        'max_depth': [2, 3, 4],
+        'subsample': [0.8, 1.0],
+    },
+    'LogisticRegression': {
+        'C': [0.01, 0.03, 0.1, 0.3, 1.0, 3.0, 10.0],
+        'class_weight': [None, 'balanced'],
+    },
+    'SVM': {
+        'C': [0.1, 0.3, 1.0, 3.0, 10.0, 30.0],
+        'gamma': ['scale', 0.01, 0.03, 0.1, 0.3],
+    },
+}
+
+STRATEGIES = ('grid', 'random', 'halving')
+
+
+def candidate_configs(strategy: str, model_names: List[str], n_iter: int = 20, random_state: int = 42) -> List[Dict[str, Any]]:
+    """
+    탐색할 (모델, 파라미터) 목록
+    - grid: 탐색 공간 전체 조합
+    - random/halving: 모델마다 최대 n_iter개 무작위 추출 (halving은 이 후보를 단계적으로 줄임)
+    """
+    unknown = [name for name in model_names if name not in SEARCH_SPACES]
+    if unknown:
+        raise ValueError(f"알 수 없는 모델: {unknown} (사용 가능: {list(SEARCH_SPACES)})")
+    if strategy not in STRATEGIES:
+        raise ValueError(f"알 수 없는 탐색 방식: {strategy} (사용 가능: {list(STRATEGIES)})")
+
+    configs = []
+    for name in model_names:
+        space = SEARCH_SPACES[name]
+        if strategy == 'grid':
+            params_list = list(ParameterGrid(space))
+        else:
+            n_total = len(ParameterGrid(space))
+            params_list = list(ParameterSampler(space, n_iter=min(n_iter, n_total), random_state=random_state))
+        configs.extend({"model": name, "params": params} for params in params_list)
+    return configs
+
+
+def _rung_folds(n_splits: int, factor: int, min_folds: int = 1) -> List[int]:
+    """successive halving 단계별 평가 fold 수 (예: 5-fold, factor 3 → [1, 3, 5])"""
+    rungs = []
+    folds = min_folds
+    while folds < n_splits:
+        rungs.append(folds)
+        folds *= factor
+    rungs.append(n_splits)
+    return rungs
+
+
+class TitanicTuner:
+    """
+    하이퍼파라미터 탐색 (grid / random / successive halving)
+    - (설정 × fold) 학습을 joblib 프로세스 풀로 병렬 실행
+    - fold 점수를 (데이터 해시, 모델 파라미터, CV 설정) 키로 디스크에 캐시 → 다시 실행하면 새 설정/fold만 학습
+    - halving: 모든 후보를 적은 fold로 평가한 뒤 상위 1/factor만 더 많은 fold로 평가 (가망 없는 설정 조기 제외)
+    - 진행 상황과 리더보드를 searches/<search_id>.json에 기록 (다른 프로세스의 API에서 조회)
+    """
+
+    def __init__(self, n_splits: int = 5, n_jobs: int = -1, random_state: int = 42, tuning_dir: Path = TUNING_DIR):
+        self.n_splits = n_splits
+        self.n_jobs = n_jobs
+        self.random_state = random_state
+        self.tuning_dir = Path(tuning_dir)
+        self.cache_dir = self.tuning_dir / "scores"
+        self.search_dir = self.tuning_dir / "searches"
+
+    # ==================== fold 점수 캐시 ====================
+
+    def _config_path(self, fingerprint: str, est_key: str) -> Path:
+        h = hashlib.sha256(f"{fingerprint}|{est_key}|{self.n_splits}|{self.random_state}".encode()).hexdigest()[:20]
+        return self.cache_dir / f"{h}.json"
+
+    def _load_scores(self, path: Path) -> Dict[int, Dict[str, float]]:
+        if not path.exists():
+            return {}
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return {int(fold): result for fold, result in json.load(f)["folds"].items()}
+        except (OSError, ValueError, KeyError):
+            return {}
+
+    def _save_scores(self, path: Path, est_key: str, folds: Dict[int, Dict[str, float]]):
+        _write_json(path, {"estimator": est_key, "folds": {str(k): v for k, v in sorted(folds.items())}})
+
+    # ==================== 진행 상황 ====================
+
+    def _search_path(self, search_id: str) -> Path:
+        return self.search_dir / f"{search_id}.json"
+
+    def _cancel_path(self, search_id: str) -> Path:
+        return self.search_dir / f"{search_id}.cancel"
+
+    def progress(self, search_id: str) -> Optional[Dict[str, Any]]:
+        path = self._search_path(search_id)
+        if not path.exists():
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def request_cancel(self, search_id: str, force: bool = False) -> bool:
+        """
+        실행 중인 탐색에 중단 요청 (학습 시작 전이면 바로, 학습 중이면 다음 fold 결과를 받은 시점에 중단)
+        force: 진행 파일이 아직 없어도 표시 (작업은 시작됐지만 첫 진행 상황을 기록하기 전인 경우)
+        """
+        if not force and not self._search_path(search_id).exists():
+            return False
+        self.search_dir.mkdir(parents=True, exist_ok=True)
+        self._cancel_path(search_id).touch()
+        return True
+
+    # ==================== 탐색 ====================
+
+    def search(self, X: pd.DataFrame, y: pd.Series, search_id: str, strategy: str = 'halving',
+               model_names: Optional[List[str]] = None, n_iter: int = 20, factor: int = 3,
+               leaderboard_size: int = 20) -> Dict[str, Any]:
+        model_names = model_names or list(SEARCH_SPACES)
+        configs = candidate_configs(strategy, model_names, n_iter, self.random_state)
+        rungs = _rung_folds(self.n_splits, factor) if strategy == 'halving' else [self.n_splits]
+
+        fingerprint = data_fingerprint(X, y)
+        X_values = X.to_numpy()
+        y_values = pd.Series(y).to_numpy()
+        folds = list(StratifiedKFold(
+            n_splits=self.n_splits, shuffle=True, random_state=self.random_state
+        ).split(X_values, y_values))
+
+        # 설정별 상태: 추정기, 캐시 파일, fold 점수
+        entries = []
+        for config in configs:
+            estimator = ESTIMATORS[config["model"]]().set_params(**config["params"])
+            est_key = estimator_key(estimator)
+            path = self._config_path(fingerprint, est_key)
+            entries.append({**config, "estimator": estimator, "key": est_key, "path": path, "scores": self._load_scores(path)})
+
+        state = {
+            "search_id": search_id,
+            "strategy": strategy,
+            "models": model_names,
+            "n_configs": len(configs),
+            "cv_folds": self.n_splits,
+            "rungs": rungs,
+            "status": "running",
+            "started_at": time.time(),
+            "trained_folds": 0,
+            "cached_folds": 0,
+        }
+        logger.info(f"▶ 하이퍼파라미터 탐색 시작: {strategy}, 설정 {len(configs)}개, 단계별 fold {rungs} ({search_id})")
+
+        alive = list(entries)
+        cancelled = False
+        for rung, n_folds in enumerate(rungs):
+            pending = [(entry, fold) for entry in alive for fold in range(n_folds) if fold not in entry["scores"]]
+            state.update({
+                "rung": rung,
+                "rung_folds": n_folds,
+                "configs_in_rung": len(alive),
+                "rung_tasks": len(pending),
+                "rung_done": 0,
+            })
+            state["cached_folds"] += len(alive) * n_folds - len(pending)
+            self._publish(state, entries, leaderboard_size)
+            # 전처리/fold 준비 중에 들어온 중단 요청은 학습을 시작하기 전에 반영
+            if self._cancel_path(search_id).exists():
+                cancelled = True
+                break
+
+            outputs = Parallel(n_jobs=self.n_jobs, return_as="generator")(
+                delayed(_fit_fold)(entry["estimator"], X_values, y_values, *folds[fold])
+                for entry, fold in pending
+            )
+            for done, ((entry, fold), output) in enumerate(zip(pending, outputs), start=1):
+                entry["scores"][fold] = output
+                state["rung_done"] = done
+                state["trained_folds"] += 1
+                # 설정의 이번 단계 fold가 모두 끝나면 디스크 캐시에 기록
+                if all(f in entry["scores"] for f in range(n_folds)):
+                    self._save_scores(entry["path"], entry["key"], entry["scores"])
+                if done % 10 == 0 or done == len(pending):
+                    self._publish(state, entries, leaderboard_size)
+                if self._cancel_path(search_id).exists():
+                    cancelled = True
+                    break
+            if cancelled:
+                outputs.close()
+                break
+
+            # 다음 단계로 상위 1/factor만 진행
+            if rung < len(rungs) - 1:
+                alive.sort(key=lambda e: self._mean(e, n_folds), reverse=True)
+                keep = max(1, math.ceil(len(alive) / factor))
+                for entry in alive[keep:]:
+                    entry["pruned_at"] = n_folds
+                logger.info(f"   단계 {rung}: {n_folds}-fold 평가 후 {keep}/{len(alive)}개 설정 유지")
+                alive = alive[:keep]
+
+        state["status"] = "cancelled" if cancelled else "completed"
+        state["finished_at"] = time.time()
+        state["elapsed"] = round(state["finished_at"] - state["started_at"], 3)
+        result = self._publish(state, entries, leaderboard_size)
+        self._cancel_path(search_id).unlink(missing_ok=True)
+        if result["leaderboard"]:
+            best = result["leaderboard"][0]
+            logger.info(f"✅ 탐색 {state['status']}: 최고 {best['model']} {best['params']} (정확도 {best['accuracy']:.4f}, {state['elapsed']}s)")
+        return result
+
+    @staticmethod
+    def _mean(entry: Dict[str, Any], n_folds: int) -> float:
+        scores = [entry["scores"][f]["accuracy"] for f in range(n_folds) if f in entry["scores"]]
+        return float(np.mean(scores)) if scores else -1.0
+
+    def _leaderboard(self, entries: List[Dict[str, Any]], size: int) -> List[Dict[str, Any]]:
+        """평가한 fold가 많은 순, 같으면 평균 정확도 순"""
+        rows = []
+        for entry in entries:
+            # 앞에서부터 연속으로 평가된 fold만 사용 (단계 간 비교 기준을 맞춤)
+            n_folds = next((i for i in range(self.n_splits) if i not in entry["scores"]), self.n_splits)
+            if n_folds == 0:
+                continue
+            scores = [entry["scores"][f]["accuracy"] for f in range(n_folds)]
+            rows.append({
+                "model": entry["model"],
+                "params": entry["params"],
+                "accuracy": round(float(np.mean(scores)), 4),
+                "accuracy_std": round(float(np.std(scores)), 4),
+                "folds": n_folds,
+                "fit_time": round(float(np.mean([entry["scores"][f]["fit_time"] for f in range(n_folds)])), 4),
+                "pruned": "pruned_at" in entry,
+            })
+        rows.sort(key=lambda r: (r["folds"], r["accuracy"]), reverse=True)
+        return rows[:size]
+
+    def _publish(self, state: Dict[str, Any], entries: List[Dict[str, Any]], size: int) -> Dict[str, Any]:
+        snapshot = {**state, "updated_at": time.time(), "leaderboard": self._leaderboard(entries, size)}
+        _write_json(self._search_path(state["search_id"]), snapshot)
+        return snapshot
+
+
+def _write_json(path: Path, data: Dict[str, Any]):
+    """임시 파일 → rename (읽는 쪽이 쓰다 만 파일을 보지 않도록)"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, default=str)
+    os.replace(tmp_path, path)
+
+
+def default_tuner() -> TitanicTuner:
+    """환경변수 기반 설정 (TITANIC_CV_FOLDS, TITANIC_N_JOBS)"""
+    return TitanicTuner(
+        n_splits=int(os.environ.get("TITANIC_CV_FOLDS", "5")),
+        n_jobs=int(os.environ.get("TITANIC_N_JOBS", "-1")),
+    )
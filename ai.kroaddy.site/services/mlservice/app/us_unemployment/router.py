@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import HTMLResponse
 from typing import Dict, Any
 from app.us_unemployment.service import USUnemploymentService
@@ -8,11 +8,10 @@ usa_service = USUnemploymentService()
 
 
 @router.get("/map", response_class=HTMLResponse)
-async def get_unemployment_map():
-    """미국 실업률 히트맵 생성 및 반환"""
+async def get_unemployment_map(request: Request):
+    """미국 실업률 히트맵 생성 및 반환 (처음 한 번만 생성, gzip/br 압축, ETag)"""
     try:
-        map_obj = usa_service.build_map()
-        return map_obj._repr_html_()
+        return usa_service.get_map_payload().response(request)
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"지도 생성 실패: {str(e)}")
 
@@ -50,3 +49,25 @@ async def get_unemployment_stats():
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"통계 계산 실패: {str(e)}")
 
+
+@router.get("/geo/boundaries")
+async def get_geo_boundaries(request: Request):
+    """
+    미국 주 경계 (클라이언트 지도 렌더링용)
+    
+    지도 HTML 대신 단순화/좌표 축소 GeoJSON만 반환 (gzip/br 압축, ETag)
+    feature.id가 주 약자(AL, AK, ...)이므로 `/usa/geo/values`의 values 키와 바로 매칭됩니다.
+    """
+    try:
+        return usa_service.get_boundaries_payload().response(request, max_age=3600)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"경계 데이터 로드 실패: {str(e)}")
+
+
+@router.get("/geo/values")
+async def get_geo_values(request: Request):
+    """주별 실업률 {주 약자: 실업률} (클라이언트 지도 렌더링용)"""
+    try:
+        return usa_service.get_values_payload().response(request)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"데이터 로드 실패: {str(e)}")
@@ -2,6 +2,11 @@ import requests
 import pandas as pd
 import folium
 from typing import Dict, Any, Optional
+from app.geo.geo_payload import CompressedPayload, compact_geojson
+
+# 클라이언트 지도용 경계 단순화 허용 오차(도, 약 1km)와 좌표 소수점 자릿수(약 100m)
+GEO_TOLERANCE = 0.01
+GEO_PRECISION = 3
 
 
 class USUnemploymentService:
@@ -15,6 +20,8 @@ class USUnemploymentService:
         self._state_geo: Optional[Dict[str, Any]] = None
         self._state_data: Optional[pd.DataFrame] = None
         self._map: Optional[folium.Map] = None
+        # 응답 본문 (원본 데이터는 한 번 로드하면 바뀌지 않으므로 프로세스 동안 재사용)
+        self._payloads: Dict[str, CompressedPayload] = {}
     
     @property
     def state_geo(self) -> Dict[str, Any]: return self._state_geo
@@ -77,4 +84,30 @@ class USUnemploymentService:
         self.create_map()
         self.add_choropleth()
         self.add_layer_control()
-        return self._map
\ No newline at end of file
+        return self._map
+    
+    def get_map_payload(self) -> CompressedPayload:
+        """지도 HTML (처음 한 번만 생성)"""
+        if "map" not in self._payloads:
+            html = self.build_map()._repr_html_()
+            self._payloads["map"] = CompressedPayload(html.encode("utf-8"), media_type="text/html")
+        return self._payloads["map"]
+    
+    def get_boundaries_payload(self) -> CompressedPayload:
+        """주 경계 (단순화/좌표 축소 GeoJSON, 속성은 name만, feature.id = 주 약자)"""
+        if "boundaries" not in self._payloads:
+            geo = compact_geojson(self.load_geo_data(), GEO_TOLERANCE, GEO_PRECISION)
+            self._payloads["boundaries"] = CompressedPayload.from_json(geo)
+        return self._payloads["boundaries"]
+    
+    def get_values_payload(self) -> CompressedPayload:
+        """주별 실업률 {주 약자: 실업률}"""
+        if "values" not in self._payloads:
+            data = self.load_unemployment_data()
+            self._payloads["values"] = CompressedPayload.from_json({
+                "metric": "unemployment",
+                "unit": "%",
+                "key_on": "feature.id",
+                "values": dict(zip(data["State"], data["Unemployment"].astype(float)))
+            })
+        return self._payloads["values"]
@@ -0,0 +1,296 @@
+"""
+타이타닉 파이프라인 벤치마크
+
+합성 승객 데이터(bench/synthetic.py)를 행 수별로 만들어 전처리부터 예측까지 측정합니다.
+행 수마다 별도 프로세스에서 실행하므로 메모리 측정이 서로 섞이지 않고,
+메모리 부족으로 프로세스가 종료되어도 그 크기를 실패로 기록하고 멈춥니다.
+
+측정 항목 (단계별 wall time, tracemalloc peak)
+- steps: 전처리 단계별 (read_csv → check_null → 변환기 fit → train/test transform)
+- preprocess: TitanicService.preprocess 캐시 없음(cold, 스트리밍 cold) / 디스크 캐시 / 메모리 캐시
+- learning: modeling + learning (후보 모델 전체 데이터 학습)
+- evaluate: k-fold 교차검증 + 제출 CSV 생성
+- predict: 단건 예측 p50/p95, 1,000건 일괄 예측
+- rss_peak_mb: 해당 크기 실행 중 프로세스 최대 RSS
+
+    python -m bench.bench_titanic --rows 10000,100000,1000000 --output bench_result.json
+    python -m bench.bench_titanic --rows 10000 --profile bench/.work/profile
+    python -m bench.bench_titanic --baseline bench_result.json --max-regression 0.2
+"""
+import argparse
+import cProfile
+import io
+import json
+import multiprocessing
+import os
+import pstats
+import resource
+import shutil
+import statistics
+import sys
+import time
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+
+from bench.synthetic import generate
+
+WORK_DIR = Path(__file__).parent / ".work"
+DEFAULT_ROWS = [10_000, 100_000, 1_000_000]
+# 이보다 행이 많으면 learning/evaluate 생략 (SVM 학습은 행 수의 제곱 이상으로 느려짐)
+DEFAULT_MAX_FIT_ROWS = 200_000
+PREDICT_BATCH = 1000
+
+# 벤치마크 결과물이 서비스의 실제 캐시/모델 디렉터리를 건드리지 않도록 작업 디렉터리로 돌림
+ARTIFACT_ENV = {
+    "TITANIC_CACHE_DIR": "cache",
+    "TITANIC_MODEL_DIR": "models",
+    "TITANIC_STORE_DIR": "store",
+    "TITANIC_TUNING_DIR": "tuning",
+    "TITANIC_DOWNLOAD_DIR": "download",
+}
+
+
+def _summary(samples):
+    """초 단위 샘플 -> ms 단위 통계"""
+    ordered = sorted(samples)
+    p95_index = max(0, int(round(len(ordered) * 0.95)) - 1)
+    return {
+        "runs": len(ordered),
+        "mean_ms": round(statistics.mean(ordered) * 1000, 3),
+        "p50_ms": round(statistics.median(ordered) * 1000, 3),
+        "p95_ms": round(ordered[p95_index] * 1000, 3),
+    }
+
+
+class Recorder:
+    """단계별 wall time / tracemalloc peak 측정 (profile_dir가 있으면 단계마다 cProfile 저장)"""
+
+    def __init__(self, memory=True, profile_dir=None):
+        self.memory = memory
+        self.profile_dir = Path(profile_dir) if profile_dir else None
+        self.results = {}
+
+    def measure(self, name, func, *args, **kwargs):
+        profiler = cProfile.Profile() if self.profile_dir else None
+        if self.memory:
+            tracemalloc.start()
+        if profiler:
+            profiler.enable()
+        start = time.perf_counter()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            wall = time.perf_counter() - start
+            if profiler:
+                profiler.disable()
+            peak = tracemalloc.get_traced_memory()[1] if self.memory else None
+            if self.memory:
+                tracemalloc.stop()
+
+        stats = {"wall_s": round(wall, 4)}
+        if peak is not None:
+            stats["peak_mb"] = round(peak / 1024 / 1024, 2)
+        if profiler:
+            stats["profile"] = self._save_profile(name, profiler)
+        self.results[name] = stats
+        return result
+
+    def _save_profile(self, name, profiler):
+        """<name>.prof (snakeviz 등으로 열기) + 누적 시간 상위 30개 텍스트"""
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        path = self.profile_dir / f"{name}.prof"
+        profiler.dump_stats(str(path))
+        out = io.StringIO()
+        pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(30)
+        path.with_suffix(".txt").write_text(out.getvalue(), encoding="utf-8")
+        return str(path)
+
+
+def bench_steps(recorder, data_dir):
+    """TitanicService._run_preprocess와 같은 순서로 측정 (변환기 학습, train/test 변환)"""
+    from app.titanic.titanic_dataset import TitanicDataset
+    from app.titanic.titanic_method import TitanicMethod
+
+    method = TitanicMethod()
+    df_train = recorder.measure("read_csv_train", method.read_csv, str(data_dir / "train.csv"))
+    df_test = recorder.measure("read_csv_test", method.read_csv, str(data_dir / "test.csv"))
+
+    this = TitanicDataset()
+    this.train = recorder.measure("create_df", method.create_df, df_train, "Survived")
+    this.test = df_test
+    recorder.measure("check_null", method.check_null, this)
+    recorder.measure("transformer_fit", method.transformer.fit, this.train)
+    train = recorder.measure("transform_train", method.transform_frame, this.train)
+    test = recorder.measure("transform_test", method.transform_frame, this.test)
+    return {"train_shape": list(train.shape), "test_shape": list(test.shape)}
+
+
+def bench_preprocess(recorder, data_dir):
+    """캐시 없음(전체 로드 / 청크 스트리밍) → 디스크 캐시(새 서비스 인스턴스) → 메모리 캐시"""
+    from app.titanic.titanic_service import TitanicService
+
+    shutil.rmtree(os.environ["TITANIC_CACHE_DIR"], ignore_errors=True)
+    cold = recorder.measure("preprocess_cold", TitanicService(data_dir).preprocess, streaming=False)
+    if cold.get("status") != "success":
+        raise RuntimeError(f"preprocess 실패: {cold.get('message')}")
+    recorder.measure("preprocess_stream_cold", TitanicService(data_dir).preprocess, streaming=True)
+    service = TitanicService(data_dir)
+    recorder.measure("preprocess_disk", service.preprocess)
+    recorder.measure("preprocess_memory", service.preprocess)
+    return service
+
+
+def bench_models(recorder, service):
+    """modeling + learning, evaluate (모델 저장소를 비워 매번 실제로 학습)"""
+    shutil.rmtree(os.environ["TITANIC_MODEL_DIR"], ignore_errors=True)
+    service.modeling()
+    recorder.measure("learning", service.learning)
+    result = recorder.measure("evaluate", service.evaluate)
+    if not result or result.get("status") != "success":
+        raise RuntimeError("evaluate 실패")
+    return {"best_model": result["best_model"], "best_accuracy": result["best_accuracy"], "models": list(service.models)}
+
+
+def bench_predict(recorder, service, data_dir, iterations):
+    """단건 지연(p50/p95)과 PREDICT_BATCH건 일괄 예측"""
+    import pandas as pd
+
+    passengers = pd.read_csv(data_dir / "test.csv", nrows=PREDICT_BATCH)
+    passengers = passengers.astype(object).where(passengers.notna(), None).to_dict("records")
+    service.predict(passengers[:1])  # 모델/인코더 로드
+
+    samples = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        service.predict([passengers[i % len(passengers)]])
+        samples.append(time.perf_counter() - start)
+    recorder.measure("predict_batch", service.predict, passengers)
+    return {"single": _summary(samples), "batch_size": len(passengers)}
+
+
+def run_size(rows, options):
+    """한 크기 전체 측정 (별도 프로세스에서 실행)"""
+    data_dir = Path(options.get("data_dir") or WORK_DIR / "data") / str(rows)
+    profile_dir = Path(options["profile"]) / str(rows) if options.get("profile") else None
+    report = {"rows": rows}
+
+    start = time.perf_counter()
+    generate(rows, data_dir, seed=options.get("seed", 42))
+    report["generate_s"] = round(time.perf_counter() - start, 3)
+
+    recorder = Recorder(memory=options.get("memory", True), profile_dir=profile_dir)
+    report["shapes"] = bench_steps(recorder, data_dir)
+    report["steps"] = recorder.results
+
+    recorder = Recorder(memory=options.get("memory", True), profile_dir=profile_dir)
+    service = bench_preprocess(recorder, data_dir)
+    if rows <= options.get("max_fit_rows", DEFAULT_MAX_FIT_ROWS):
+        report["models"] = bench_models(recorder, service)
+        report["predict"] = bench_predict(recorder, service, data_dir, options.get("iterations", 200))
+    else:
+        report["skipped"] = f"learning/evaluate/predict 생략 (rows > --max-fit-rows {options.get('max_fit_rows')})"
+    report["stages"] = recorder.results
+
+    # ru_maxrss: Linux는 KB, macOS는 byte
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    report["rss_peak_mb"] = round(maxrss / 1024 / (1024 if sys.platform == "darwin" else 1), 1)
+    return report
+
+
+def run(rows_list, options):
+    work_dir = Path(options.get("work_dir") or WORK_DIR)
+    for name, sub in ARTIFACT_ENV.items():
+        os.environ[name] = str(work_dir / sub)
+    if options.get("models"):
+        os.environ["TITANIC_MODELS"] = options["models"]
+
+    report = {"options": {k: v for k, v in options.items() if v is not None}, "sizes": {}}
+    for rows in rows_list:
+        print(f"▶ {rows:,}행 측정 중...", file=sys.stderr)
+        # 크기마다 새 프로세스 (spawn: 이전 크기의 메모리/캐시 상태를 물려받지 않음)
+        with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+            try:
+                report["sizes"][str(rows)] = pool.submit(run_size, rows, options).result()
+            except BrokenProcessPool:
+                report["sizes"][str(rows)] = {"rows": rows, "error": "작업 프로세스가 비정상 종료됨 (메모리 부족 가능)"}
+            except Exception as e:
+                report["sizes"][str(rows)] = {"rows": rows, "error": f"{type(e).__name__}: {e}"}
+        if "error" in report["sizes"][str(rows)]:
+            print(f"   {rows:,}행 실패: {report['sizes'][str(rows)]['error']} - 더 큰 크기는 생략", file=sys.stderr)
+            break
+    return report
+
+
+def compare(report, baseline, max_regression):
+    """기준 결과 대비 wall time이 max_regression 비율 이상 늘어난 단계 목록 (10ms 미만 단계는 제외)"""
+    regressions = []
+    for size, result in report.get("sizes", {}).items():
+        base_size = baseline.get("sizes", {}).get(size, {})
+        for section in ("steps", "stages"):
+            for name, stats in result.get(section, {}).items():
+                base = base_size.get(section, {}).get(name)
+                if not base or base["wall_s"] < 0.01:
+                    continue
+                ratio = stats["wall_s"] / base["wall_s"] - 1
+                if ratio > max_regression:
+                    regressions.append(f"{size}행 {section}.{name}: {base['wall_s']}s -> {stats['wall_s']}s (+{ratio:.0%})")
+    return regressions
+
+
+def _print_table(report):
+    """행 수별 주요 단계 요약 (stderr)"""
+    for size, result in report["sizes"].items():
+        if "error" in result:
+            print(f"{int(size):>12,}행  실패: {result['error']}", file=sys.stderr)
+            continue
+        parts = [f"{name} {stats['wall_s']:.3f}s" + (f"/{stats['peak_mb']}MB" if "peak_mb" in stats else "")
+                 for name, stats in result["stages"].items()]
+        slowest = max(result["steps"].items(), key=lambda item: item[1]["wall_s"])
+        print(f"{int(size):>12,}행  {' | '.join(parts)} | 가장 느린 단계 {slowest[0]} {slowest[1]['wall_s']:.3f}s"
+              f" | RSS {result['rss_peak_mb']}MB", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="타이타닉 파이프라인 벤치마크")
+    parser.add_argument("--rows", default=",".join(str(r) for r in DEFAULT_ROWS), help="train 행 수 목록 (쉼표 구분, 예: 10000,10000000)")
+    parser.add_argument("--models", default=None, help="후보 모델 (쉼표 구분, 기본: TITANIC_MODELS 또는 전체)")
+    parser.add_argument("--max-fit-rows", type=int, default=DEFAULT_MAX_FIT_ROWS, help="이보다 크면 learning/evaluate/predict 생략")
+    parser.add_argument("--iterations", type=int, default=200, help="단건 예측 반복 횟수")
+    parser.add_argument("--no-memory", action="store_true", help="tracemalloc 끄기 (측정 오버헤드 없이 시간만)")
+    parser.add_argument("--profile", default=None, help="단계별 cProfile 결과 저장 디렉터리")
+    parser.add_argument("--work-dir", default=str(WORK_DIR), help="합성 데이터/캐시/모델 저장 디렉터리")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="결과 JSON 저장 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="허용 wall time 증가율 (0.2 = 20%%)")
+    args = parser.parse_args()
+
+    options = {
+        "models": args.models,
+        "max_fit_rows": args.max_fit_rows,
+        "iterations": args.iterations,
+        "memory": not args.no_memory,
+        "profile": args.profile,
+        "work_dir": args.work_dir,
+        "data_dir": str(Path(args.work_dir) / "data"),
+        "seed": args.seed,
+    }
+    report = run([int(r) for r in args.rows.split(",") if r.strip()], options)
+    _print_table(report)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            regressions = compare(report, json.load(f), args.max_regression)
+        if regressions:
+            print("성능 저하 감지:")
+            for line in regressions:
+                print(f"  - {line}")
+            sys.exit(1)
+        print("기준 대비 성능 저하 없음")
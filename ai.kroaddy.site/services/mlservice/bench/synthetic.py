@@ -0,0 +1,110 @@
+"""
+합성 타이타닉 승객 데이터 생성
+
+원본 train.csv(891행)와 같은 컬럼/결측 패턴으로 행 수만 늘린 train.csv / test.csv를 만듭니다.
+생존 여부는 성별/객실 등급/나이에 따라 확률적으로 정해지므로 모델 학습 결과도 의미가 있습니다.
+1,000만 행도 메모리를 크게 쓰지 않도록 CHUNK_ROWS 단위로 나눠 CSV에 이어 씁니다.
+
+    python -m bench.synthetic --rows 1000000 --output bench/.work/data/1000000
+"""
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+CHUNK_ROWS = 500_000
+# 원본 데이터의 train:test 비율 (891:418)
+TEST_RATIO = 418 / 891
+
+COLUMNS = ["PassengerId", "Survived", "Pclass", "Name", "Sex", "Age", "SibSp",
+           "Parch", "Ticket", "Fare", "Cabin", "Embarked"]
+
+MALE_TITLES = np.array(["Mr", "Master", "Dr", "Rev", "Col", "Major", "Capt", "Sir", "Don", "Jonkheer"])
+MALE_TITLE_P = [0.80, 0.12, 0.02, 0.02, 0.01, 0.01, 0.005, 0.005, 0.005, 0.005]
+FEMALE_TITLES = np.array(["Miss", "Mrs", "Ms", "Mlle", "Mme", "Lady", "Countess", "Dona"])
+FEMALE_TITLE_P = [0.52, 0.44, 0.01, 0.01, 0.01, 0.005, 0.0025, 0.0025]
+
+
+def _chunk(rng: np.random.Generator, start: int, n: int, label: bool) -> pd.DataFrame:
+    """PassengerId가 start부터 시작하는 n행"""
+    sex = rng.choice(np.array(["male", "female"]), n, p=[0.65, 0.35])
+    pclass = rng.choice(np.array([1, 2, 3]), n, p=[0.24, 0.21, 0.55])
+    male = sex == "male"
+    titles = np.where(male,
+                      rng.choice(MALE_TITLES, n, p=MALE_TITLE_P),
+                      rng.choice(FEMALE_TITLES, n, p=FEMALE_TITLE_P))
+    ids = np.arange(start, start + n)
+
+    age = np.clip(rng.normal(30, 14, n), 0.42, 80).round(1)
+    age[rng.random(n) < 0.2] = np.nan
+    fare = np.select(
+        [pclass == 1, pclass == 2],
+        [rng.gamma(3.0, 28.0, n), rng.gamma(3.0, 7.0, n)],
+        rng.gamma(2.0, 6.5, n),
+    ).round(4)
+    fare[rng.random(n) < 0.001] = np.nan
+    embarked = rng.choice(np.array(["S", "C", "Q", ""], dtype=object), n, p=[0.72, 0.19, 0.087, 0.003])
+    embarked[embarked == ""] = None
+    cabin = np.where(rng.random(n) < np.select([pclass == 1, pclass == 2], [0.8, 0.2], 0.05),
+                     pd.Series(rng.integers(1, 150, n)).map(lambda x: f"C{x}").to_numpy(), None)
+
+    df = pd.DataFrame({
+        "PassengerId": ids,
+        "Pclass": pclass,
+        "Name": pd.Series(ids).map(lambda i: f"Surname{i % 5000}, ").to_numpy() + titles + ". Given",
+        "Sex": sex,
+        "Age": age,
+        "SibSp": rng.poisson(0.5, n),
+        "Parch": rng.poisson(0.4, n),
+        "Ticket": pd.Series(ids).map(lambda i: f"T{i}").to_numpy(),
+        "Fare": fare,
+        "Cabin": cabin,
+        "Embarked": embarked,
+    })
+    if label:
+        # 여성/1등실/어린이일수록 생존 확률이 높음
+        p = 0.16 + 0.56 * ~male + np.select([pclass == 1, pclass == 2], [0.18, 0.06], -0.08)
+        p = np.clip(p + np.where(age < 12, 0.2, 0.0), 0.02, 0.98)
+        df.insert(1, "Survived", (rng.random(n) < p).astype(np.int64))
+    return df
+
+
+def _write(path: Path, rows: int, start: int, label: bool, rng: np.random.Generator):
+    tmp_path = path.with_suffix(".csv.tmp")
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        for offset in range(0, rows, CHUNK_ROWS):
+            n = min(CHUNK_ROWS, rows - offset)
+            _chunk(rng, start + offset, n, label).to_csv(f, index=False, header=offset == 0)
+    tmp_path.replace(path)
+
+
+def generate(rows: int, output: Path, seed: int = 42, test_rows: int = None) -> Path:
+    """
+    output/train.csv, output/test.csv 생성 (이미 같은 행 수로 만들어져 있으면 재사용)
+    Returns: output 디렉터리
+    """
+    output = Path(output)
+    test_rows = test_rows if test_rows is not None else max(1, int(rows * TEST_RATIO))
+    marker = output / f".rows_{rows}_{test_rows}_{seed}"
+    if marker.exists() and (output / "train.csv").exists() and (output / "test.csv").exists():
+        return output
+
+    output.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    _write(output / "train.csv", rows, 1, True, rng)
+    _write(output / "test.csv", test_rows, rows + 1, False, rng)
+    for old in output.glob(".rows_*"):
+        old.unlink()
+    marker.touch()
+    return output
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="합성 타이타닉 데이터 생성")
+    parser.add_argument("--rows", type=int, default=10_000, help="train 행 수")
+    parser.add_argument("--test-rows", type=int, default=None, help="test 행 수 (기본: train의 418/891)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", required=True)
+    args = parser.parse_args()
+    print(generate(args.rows, Path(args.output), args.seed, args.test_rows))
@@ -18,7 +18,7 @@ if __name__ == "__main__":
     print("=" * 80)
     
     service = TitanicService()
-    result = service.preprocess()
+    result = service.preprocess(diagnostics=True)
     
     print("\n" + "=" * 80)
     print("전처리 결과:")
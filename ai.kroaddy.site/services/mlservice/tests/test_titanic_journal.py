@@ -0,0 +1,74 @@
+import json
+
+from app.titanic.titanic_journal import PassengerJournal
+
+
+def _journal(tmp_path):
+    return PassengerJournal(store_dir=tmp_path, compact_every=1000, fsync=False)
+
+
+def _lines(journal):
+    return [json.loads(line) for line in journal.journal_path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_replay_skips_entries_covered_by_snapshot(tmp_path):
+    journal = _journal(tmp_path)
+    journal.append("put", 1, {"PassengerId": 1})
+    journal.append("put", 2, {"PassengerId": 2})
+    journal.append("delete", 1)
+    journal.close()
+    # 스냅샷 교체 후 저널을 비우기 전에 종료된 상황: 스냅샷 seq=2, 저널에는 seq 1~3
+    journal.snapshot_path.write_text(json.dumps({"seq": 2, "records": [{"PassengerId": 1}, {"PassengerId": 2}]}))
+
+    restored = _journal(tmp_path)
+    assert restored.load_snapshot() == [{"PassengerId": 1}, {"PassengerId": 2}]
+    entries = list(restored.replay())
+    assert [e["seq"] for e in entries] == [3]
+    assert entries[0]["op"] == "delete"
+    assert restored.stats()["seq"] == 3
+    assert restored.stats()["pending"] == 1
+    # 다음 기록은 스냅샷/저널 이후 seq로 이어짐
+    assert restored.append("put", 4, {"PassengerId": 4}) == 4
+    restored.close()
+
+
+def test_replay_truncates_torn_last_line(tmp_path):
+    journal = _journal(tmp_path)
+    journal.append("put", 1, {"PassengerId": 1})
+    journal.append("put", 2, {"PassengerId": 2})
+    journal.close()
+    intact_size = journal.journal_path.stat().st_size
+    with open(journal.journal_path, "ab") as f:
+        f.write(b'{"seq": 3, "op": "put", "id": 3, "rec')
+
+    restored = _journal(tmp_path)
+    assert restored.load_snapshot() is None
+    assert [e["seq"] for e in restored.replay()] == [1, 2]
+    assert restored.journal_path.stat().st_size == intact_size
+
+    # 잘라낸 뒤 이어서 기록한 줄은 정상적으로 재생됨
+    assert restored.append("put", 3, {"PassengerId": 3}) == 3
+    restored.close()
+    assert [e["seq"] for e in _lines(restored)] == [1, 2, 3]
+
+
+def test_compact_while_journal_is_open(tmp_path):
+    journal = _journal(tmp_path)
+    journal.append("put", 1, {"PassengerId": 1})
+    journal.append("put", 2, {"PassengerId": 2})
+    assert journal._file is not None
+
+    journal.compact([{"PassengerId": 1}, {"PassengerId": 2}])
+    assert journal.journal_path.stat().st_size == 0
+    assert journal.stats()["pending"] == 0
+    assert json.loads(journal.snapshot_path.read_text(encoding="utf-8"))["seq"] == 2
+
+    # 압축 후 기록은 비워진 저널에 새로 쌓임
+    journal.append("delete", 2)
+    journal.close()
+    assert [e["seq"] for e in _lines(journal)] == [3]
+
+    restored = _journal(tmp_path)
+    assert restored.load_snapshot() == [{"PassengerId": 1}, {"PassengerId": 2}]
+    entries = list(restored.replay())
+    assert [(e["seq"], e["op"], e["id"]) for e in entries] == [(3, "delete", 2)]
@@ -0,0 +1,93 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.titanic import titanic_service
+from app.titanic.titanic_cache import PreprocessCache
+from app.titanic.titanic_registry import TitanicModelRegistry
+from app.titanic.titanic_service import TitanicService
+
+RESOURCES = Path(titanic_service.__file__).parent.parent / "resources" / "titanic"
+
+
+@pytest.fixture
+def service(tmp_path, monkeypatch):
+    monkeypatch.setattr(titanic_service, "DOWNLOAD_DIR", tmp_path / "download")
+    service = TitanicService(RESOURCES)
+    service.registry = TitanicModelRegistry(tmp_path / "models")
+    service.preprocess_cache = PreprocessCache(tmp_path / "cache")
+    return service
+
+
+@pytest.fixture
+def other_data_dir(tmp_path):
+    """train.csv를 3배로 늘리고 생존 라벨을 뒤집은 다른 데이터셋 (학습한 모델의 예측이 원래와 반대)"""
+    train = pd.read_csv(RESOURCES / "train.csv")
+    train["Survived"] = 1 - train["Survived"]
+    parts = []
+    for i in range(3):
+        part = train.copy()
+        part["PassengerId"] = part["PassengerId"] + i * 10000
+        parts.append(part)
+    data_dir = tmp_path / "other"
+    data_dir.mkdir()
+    pd.concat(parts).to_csv(data_dir / "train.csv", index=False)
+    (data_dir / "test.csv").write_bytes((RESOURCES / "test.csv").read_bytes())
+    return data_dir
+
+
+def _fresh_model(service, name):
+    model = type(service.models[name])(**service.models[name].get_params())
+    X, y = service._training_data()
+    return model.fit(X.to_numpy(), y.to_numpy())
+
+
+def test_evaluate_refits_models_learned_on_other_data(service, other_data_dir):
+    service.preprocess()
+    service.modeling(["LogisticRegression"])
+    service.learning()
+    old_coef = service.models["LogisticRegression"].coef_.copy()
+    old_predictions = service.models["LogisticRegression"].predict(
+        service.processed_data.test[service.feature_columns].to_numpy())
+
+    service.data_dir = other_data_dir
+    assert service.preprocess()["status"] == "success"
+    assert len(service.processed_data.train) == 3 * 891
+    result = service.evaluate()
+
+    expected = _fresh_model(service, "LogisticRegression")
+    assert not np.allclose(expected.coef_, old_coef)
+    X_test = service.processed_data.test[service.feature_columns].to_numpy()
+    assert (expected.predict(X_test) != old_predictions).any()
+    submission = pd.read_csv(result["submission_file"])
+    assert (submission["Survived"].to_numpy() == expected.predict(X_test)).all()
+
+    # 저장된 아티팩트도 새 데이터로 학습한 모델
+    artifact = service.registry.load(result["model_key"])
+    assert np.allclose(artifact["model"].coef_, expected.coef_)
+
+
+def test_evaluate_does_not_refit_models_learned_on_current_data(service):
+    service.preprocess()
+    service.modeling(["LogisticRegression"])
+    service.learning()
+    coef = service.models["LogisticRegression"].coef_
+
+    assert service.evaluate()["status"] == "success"
+    # 다시 학습하면 coef_ 배열이 새로 만들어짐
+    assert service.models["LogisticRegression"].coef_ is coef
+
+
+def test_evaluate_does_not_save_model_fitted_on_other_data(service, monkeypatch):
+    service.preprocess()
+    service.modeling(["LogisticRegression"])
+    service.learning()
+    # 제출 파일 생성 단계에서 재학습이 빠진 경우에도 다른 데이터로 학습한 모델은 저장하지 않음
+    service._fitted_keys["LogisticRegression"] = "other-data"
+    monkeypatch.setattr(service, "generate_submission_csv", lambda model_name: None)
+
+    result = service.evaluate()
+    assert result["status"] == "success"
+    assert not service.registry.exists(result["model_key"])
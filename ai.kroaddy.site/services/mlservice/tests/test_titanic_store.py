@@ -0,0 +1,207 @@
+import random
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from app.titanic import titanic_service
+from app.titanic.titanic_journal import PassengerJournal
+from app.titanic.titanic_store import PASSENGER_FIELDS, PassengerStore
+
+TRAIN_CSV = Path(titanic_service.__file__).parent.parent / "resources" / "titanic" / "train.csv"
+
+SEARCHES = [
+    {},
+    {"name": "mr"},
+    {"name": "Ann"},
+    {"name": "o"},
+    {"name": "smith"},
+    {"name": "zzq"},
+    {"sex": "female"},
+    {"survived": 1, "pclass": 1},
+    {"sex": "male", "survived": 0, "pclass": 3},
+    {"min_age": 18, "max_age": 30},
+    {"max_age": 5},
+    {"min_fare": 50},
+    {"min_fare": 7.25, "max_fare": 7.25},
+    {"name": "mrs", "pclass": 2, "min_fare": 10, "max_fare": 30},
+    {"sex": "female", "min_age": 20, "max_fare": 20},
+]
+
+
+def _passenger(rng: random.Random, pid: int):
+    first = rng.choice(["Anna", "John", "Mary", "Otto", "Sven", "Lea"])
+    last = rng.choice(["Smith", "Berg", "Olsen", "Kim", "Ohara"])
+    title = rng.choice(["Mr", "Mrs", "Miss", "Master", "Dr"])
+    return {
+        "PassengerId": pid,
+        "Survived": rng.choice([0, 1]),
+        "Pclass": rng.choice([1, 2, 3]),
+        "Name": f"{last}, {title}. {first}",
+        "Sex": rng.choice(["male", "female"]),
+        "Age": rng.choice([None, 0.42, 4.0, 18.0, 22.0, 30.5, 61.0]),
+        "SibSp": rng.randint(0, 3),
+        "Parch": rng.randint(0, 2),
+        "Ticket": f"T{pid}",
+        # 기존 데이터와 같은 값도 넣어 (값, id) 정렬/동률 처리를 확인
+        "Fare": rng.choice([None, 0.0, 7.25, 8.05, 26.0, 71.2833, 512.3292]),
+        "Cabin": None,
+        "Embarked": rng.choice(["C", "Q", "S", None]),
+    }
+
+
+def _mutate(store: PassengerStore, reference: dict, rng: random.Random, steps: int, clear_at: int = None):
+    """store와 reference(dict)에 같은 변경을 무작위 순서로 적용"""
+    next_id = max([5000, *reference]) + 1
+    for step in range(steps):
+        if step == clear_at:
+            store.clear()
+            reference.clear()
+            continue
+        op = rng.choice(["add", "add", "replace", "remove"])
+        if op == "add" or not reference:
+            record = _passenger(rng, next_id)
+            next_id += 1
+            assert store.add(record) == record
+            assert store.add(record) is None  # 이미 있는 id
+            reference[record["PassengerId"]] = record
+        elif op == "replace":
+            pid = rng.choice(sorted(reference))
+            record = _passenger(rng, pid)
+            assert store.replace(pid, record) == record
+            reference[pid] = record
+        else:
+            pid = rng.choice(sorted(reference))
+            assert store.remove(pid)
+            assert not store.remove(pid)
+            del reference[pid]
+    assert store.replace(999999, _passenger(rng, 999999)) is None
+
+
+def _frame(reference: dict) -> pd.DataFrame:
+    return pd.DataFrame(list(reference.values()), columns=PASSENGER_FIELDS)
+
+
+def _expected_search(df: pd.DataFrame, name=None, sex=None, survived=None, pclass=None,
+                     min_age=None, max_age=None, min_fare=None, max_fare=None):
+    mask = pd.Series(True, index=df.index)
+    if name:
+        mask &= df["Name"].fillna("").str.lower().str.contains(name.lower(), regex=False)
+    for column, value in (("Sex", sex), ("Survived", survived), ("Pclass", pclass)):
+        if value is not None:
+            mask &= df[column] == value
+    for column, low, high in (("Age", min_age, max_age), ("Fare", min_fare, max_fare)):
+        if low is not None or high is not None:
+            values = pd.to_numeric(df[column])
+            mask &= values.notna()
+            if low is not None:
+                mask &= values >= low
+            if high is not None:
+                mask &= values <= high
+    return sorted(df.loc[mask, "PassengerId"].tolist())
+
+
+def _expected_top(df: pd.DataFrame, field: str, top_n: int):
+    ranked = df.assign(value=pd.to_numeric(df[field])).dropna(subset=["value"])
+    ranked = ranked.sort_values(["value", "PassengerId"], ascending=[False, True])
+    return ranked["PassengerId"].head(top_n).tolist()
+
+
+def _assert_matches(store: PassengerStore, reference: dict):
+    df = _frame(reference)
+    assert len(store) == len(reference)
+    assert store.page() == [reference[pid] for pid in sorted(reference)]
+
+    for query in SEARCHES:
+        expected = _expected_search(df, **query)
+        assert [r["PassengerId"] for r in store.search(**query, limit=100000)] == expected, query
+        assert [r["PassengerId"] for r in store.search(**query, limit=3)] == expected[:3], query
+
+    for top_n in (1, 10, 50):
+        assert [r["PassengerId"] for r in store.top_by("Fare", top_n)] == _expected_top(df, "Fare", top_n)
+    assert [r["PassengerId"] for r in store.top_by("Age", 25)] == _expected_top(df, "Age", 25)
+
+    stats = store.statistics()
+    total = len(df)
+    survived = int((df["Survived"] == 1).sum())
+    assert stats["total_passengers"] == total
+    assert stats["survived"] == survived
+    assert stats["died"] == total - survived
+    for field, key in (("Pclass", "by_class"), ("Sex", "by_sex")):
+        expected = {
+            str(value): {"count": len(group), "survived": int((group["Survived"] == 1).sum())}
+            for value, group in df.groupby(field)
+        }
+        assert {k: {"count": v["count"], "survived": v["survived"]} for k, v in stats[key].items()} == expected
+    for field, key in (("Age", "age"), ("Fare", "fare")):
+        values = pd.to_numeric(df[field]).dropna()
+        assert stats[key]["count"] == len(values)
+        assert stats[key]["missing"] == total - len(values)
+        if len(values):
+            assert stats[key]["mean"] == pytest.approx(values.mean(), abs=1e-4)
+            assert stats[key]["median"] == pytest.approx(values.median())
+            assert stats[key]["min"] == values.min()
+            assert stats[key]["max"] == values.max()
+        else:
+            assert stats[key]["mean"] is None and stats[key]["median"] is None
+
+    # 증감으로 유지한 색인이 같은 레코드를 처음부터 적재한 색인과 같은지
+    fresh = PassengerStore()
+    fresh.load_records(reference.values())
+    assert store._ids == fresh._ids
+    assert store._sorted == fresh._sorted
+    assert store._category == fresh._category
+    assert store._grams == fresh._grams
+    assert store._group_counts == fresh._group_counts
+    assert store._survived == fresh._survived
+    for field, stats_ in store._numeric.items():
+        assert stats_.count == fresh._numeric[field].count
+        assert stats_.total == pytest.approx(fresh._numeric[field].total)
+
+
+def _csv_reference():
+    store = PassengerStore(TRAIN_CSV)
+    return {record["PassengerId"]: record for record in store.page()}
+
+
+@pytest.mark.parametrize("seed", [0, 1, 2])
+def test_indexes_match_pandas_after_mutations(seed):
+    store = PassengerStore(TRAIN_CSV)
+    reference = _csv_reference()
+    _assert_matches(store, reference)
+
+    rng = random.Random(seed)
+    _mutate(store, reference, rng, steps=300)
+    _assert_matches(store, reference)
+
+    # 전체 삭제 후 다시 쌓은 경우 (빈 색인에서 시작)
+    _mutate(store, reference, rng, steps=120, clear_at=0)
+    _assert_matches(store, reference)
+
+
+def test_empty_store_statistics():
+    store = PassengerStore()
+    store.load_records([])
+    _assert_matches(store, {})
+
+
+@pytest.mark.parametrize("compact_every", [1000, 7])
+def test_journal_replay_round_trip(tmp_path, compact_every):
+    journal = PassengerJournal(store_dir=tmp_path, compact_every=compact_every, fsync=False)
+    store = PassengerStore(TRAIN_CSV, journal=journal)
+    reference = _csv_reference()
+    rng = random.Random(compact_every)
+    _mutate(store, reference, rng, steps=80)
+    _mutate(store, reference, rng, steps=40, clear_at=10)
+    # 압축 없이 종료된 경우: 스냅샷(있으면) + 저널 재생으로 복구
+    journal.close()
+
+    restored = PassengerStore(TRAIN_CSV, journal=PassengerJournal(store_dir=tmp_path, compact_every=compact_every, fsync=False))
+    _assert_matches(restored, reference)
+
+    # 복구한 저장소에서 이어서 변경하고 정상 종료(압축)한 뒤 다시 로드
+    _mutate(restored, reference, rng, steps=30)
+    restored.close()
+    assert journal.journal_path.stat().st_size == 0
+    reopened = PassengerStore(TRAIN_CSV, journal=PassengerJournal(store_dir=tmp_path, fsync=False))
+    _assert_matches(reopened, reference)
@@ -0,0 +1,66 @@
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from app.titanic import titanic_service
+from app.titanic.titanic_dataset import TitanicDataset
+from app.titanic.titanic_encoder import PassengerEncoder
+from app.titanic.titanic_method import TitanicMethod
+from app.titanic.titanic_service import PREPROCESS_DROP_FEATURES
+from app.titanic.titanic_transformer import FEATURE_COLUMNS, TitanicTransformer
+
+RESOURCES = Path(titanic_service.__file__).parent.parent / "resources" / "titanic"
+
+
+@pytest.fixture(scope="module")
+def raw():
+    train = pd.read_csv(RESOURCES / "train.csv").drop(columns=["Survived"])
+    test = pd.read_csv(RESOURCES / "test.csv")
+    return train, test
+
+
+@pytest.fixture(scope="module")
+def test_with_outliers(raw):
+    """test.csv + 학습 구간 밖/경계의 Fare, Age와 결측치를 넣은 행"""
+    test = raw[1].copy()
+    extra = test.head(8).copy()
+    extra["PassengerId"] = np.arange(len(extra)) + 100000
+    extra["Fare"] = [-5.0, 0.0, 1e6, np.nan, 512.3292, 7.9104, 14.4542, 31.0]
+    extra["Age"] = [-10.0, -1.0, 0.0, 0.42, 200.0, np.nan, 60.0, 80.0]
+    return pd.concat([test, extra], ignore_index=True)
+
+
+def _records(df):
+    return df.astype(object).where(df.notna(), None).to_dict("records")
+
+
+def test_encoder_matches_transformer(raw, test_with_outliers):
+    transformer = TitanicTransformer().fit(raw[0])
+    expected = transformer.transform(test_with_outliers).to_numpy(dtype=float)
+    encoder = PassengerEncoder(transformer.fitted_params_, FEATURE_COLUMNS)
+    records = _records(test_with_outliers)
+
+    np.testing.assert_array_equal(encoder.transform(records), expected)
+    np.testing.assert_array_equal(np.vstack([encoder.transform_one(r) for r in records]), expected)
+
+
+def test_fit_transform_matches_steps_without_mutating_input(raw):
+    train, test = raw
+    source = TitanicDataset()
+    source.train, source.test = train.copy(), test.copy()
+
+    result = TitanicMethod().fit_transform(source, *PREPROCESS_DROP_FEATURES)
+    pd.testing.assert_frame_equal(source.train, train)
+    pd.testing.assert_frame_equal(source.test, test)
+    assert result.train.columns.tolist() == ['PassengerId'] + FEATURE_COLUMNS
+
+    method = TitanicMethod()
+    this = method.drop_features(source, *PREPROCESS_DROP_FEATURES)
+    for step in ("pclass_ordinal", "fare_ordinal", "embarked_ordinal", "gender_nominal", "age_ratio", "title_nominal"):
+        this = getattr(method, step)(this)
+    this = method.drop_features(this, "Name")
+    pd.testing.assert_frame_equal(source.train, train)
+    pd.testing.assert_frame_equal(this.train, result.train)
+    pd.testing.assert_frame_equal(this.test, result.test)